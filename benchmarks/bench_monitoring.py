@@ -0,0 +1,153 @@
+"""
+Throughput benchmark for the synthetic monitoring loop.
+
+Monitors N symbols (half synthetic entries, half synthetic stops on open
+positions) on the lean_standin harness and feeds them a synthetic quote
+stream. Each slice updates --update-ratio of the symbols; --trigger-ratio of
+the updated ones get a quote that triggers their monitor. Triggered symbols are put
+back under monitoring between slices, so the monitored count stays at N.
+
+Reports slices per second and the per-slice latency distribution of
+process_synthetic_entries + process_synthetic_stops, then reruns the
+same stream under tracemalloc for peak and retained allocations.
+
+    python benchmarks/bench_monitoring.py --symbols 10 100 1000 5000 --slices 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import lean_standin  # noqa: E402
+
+lean_standin.install()
+
+from orb_example import SchwabSyntheticStops, SyntheticLogger  # noqa: E402
+
+TARGET_PRICE = 50.0
+
+
+def build(symbol_count, batch_threshold=None):
+    """Algorithm and handler with symbol_count monitored symbols, alternating entries and stops."""
+    algorithm = lean_standin.StandInAlgorithm(datetime(2025, 1, 2, 9, 30))
+    algorithm.fill_market_orders = False  # Keep positions open so re-monitored stops stay live
+    handler = SchwabSyntheticStops(algorithm)
+    handler.quote_driven = True
+    handler.scheduled_timeouts = True
+    handler.synthetic_timeout_minutes = 24 * 60  # Keep records alive for the whole run
+    handler.log.level = SyntheticLogger.WARNING
+    if batch_threshold is not None:
+        handler.batch_threshold = batch_threshold
+
+    symbols = [f"SYM{index:05d}" for index in range(symbol_count)]
+    for index, symbol in enumerate(symbols):
+        algorithm.set_quote(symbol, TARGET_PRICE - 0.05, TARGET_PRICE + 0.05, TARGET_PRICE)
+        if index % 2:
+            algorithm.Portfolio[symbol].Quantity = 100
+        monitor(handler, symbol, index)
+    return algorithm, handler, symbols
+
+
+def monitor(handler, symbol, index):
+    """Put a symbol (back) under synthetic monitoring: even indexes long entries, odd indexes long stops."""
+    if index % 2:
+        handler.handle_stop_rejection(symbol, None, TARGET_PRICE, -100, "benchmark")
+    else:
+        handler.handle_entry_rejection(symbol, None, TARGET_PRICE, 100, "benchmark")
+
+
+def quote_stream(symbol_count, slices, update_ratio, trigger_ratio, seed):
+    """
+    Per slice, the (symbol index, bid, ask, price) quotes.
+
+    Quiet quotes straddle the target with a spread Schwab would reject a stop
+    in; triggering quotes either tighten the spread past the target (place)
+    or trade through it (cross).
+    """
+    rng = random.Random(seed)
+    updates = max(1, int(symbol_count * update_ratio))
+    stream = []
+    for _ in range(slices):
+        quotes = []
+        for index in rng.sample(range(symbol_count), updates):
+            direction = -1 if index % 2 else 1  # Entries trigger upward, stops downward
+            if rng.random() >= trigger_ratio:
+                price = TARGET_PRICE - direction * rng.uniform(0, 0.01)
+                half_spread = rng.uniform(0.03, 0.10)
+                bid_price, ask_price = price - half_spread, price + half_spread
+            elif rng.random() < 0.5:
+                price = TARGET_PRICE - direction * 0.005
+                bid_price, ask_price = (price - 0.02, price + 0.01) if direction > 0 else (price - 0.01, price + 0.02)
+            else:
+                price = TARGET_PRICE + direction * 0.05
+                bid_price, ask_price = price - 0.01, price + 0.01
+            quotes.append((index, bid_price, ask_price, price))
+        stream.append(quotes)
+    return stream
+
+
+def run(symbol_count, stream, batch_threshold=None, trace=False):
+    """Replay a quote stream; returns per-slice latencies (ns), orders issued and tracemalloc stats."""
+    algorithm, handler, symbols = build(symbol_count, batch_threshold)
+    latencies = np.empty(len(stream), dtype=np.int64)
+    memory = None
+    if trace:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+    for slice_index, quotes in enumerate(stream):
+        algorithm.Time += timedelta(seconds=1)
+        for index, bid_price, ask_price, price in quotes:
+            algorithm.set_quote(symbols[index], bid_price, ask_price, price)
+        data_slice = lean_standin.Slice(algorithm.Time, [symbols[index] for index, *_ in quotes])
+
+        started = time.perf_counter_ns()
+        handler.process_synthetic_entries(data_slice)
+        handler.process_synthetic_stops(data_slice)
+        latencies[slice_index] = time.perf_counter_ns() - started
+
+        for index, *_ in quotes:
+            symbol = symbols[index]
+            if symbol not in handler.synthetic_entries and symbol not in handler.synthetic_stops:
+                monitor(handler, symbol, index)
+
+    if trace:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory = (peak - baseline, current - baseline)
+    return latencies, len(algorithm.orders), memory
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the synthetic monitoring loop.")
+    parser.add_argument("--symbols", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--slices", type=int, default=500)
+    parser.add_argument("--update-ratio", type=float, default=0.3, help="share of symbols quoted per slice")
+    parser.add_argument("--trigger-ratio", type=float, default=0.01, help="share of updates crossing the target")
+    parser.add_argument("--batch-threshold", type=int, help="override SchwabSyntheticStops.batch_threshold")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    print(f"{'symbols':>8} {'slices/s':>10} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9} {'max us':>9} "
+          f"{'orders':>7} {'peak KiB':>9} {'kept KiB':>9}")
+    for symbol_count in args.symbols:
+        stream = quote_stream(symbol_count, args.slices, args.update_ratio, args.trigger_ratio, args.seed)
+        latencies, orders, _ = run(symbol_count, stream, args.batch_threshold)
+        _, _, (peak, retained) = run(symbol_count, stream, args.batch_threshold, trace=True)
+
+        micros = latencies / 1000
+        p50, p95, p99 = np.percentile(micros, [50, 95, 99])
+        print(f"{symbol_count:>8} {len(micros) / (micros.sum() / 1e6):>10.0f} {p50:>9.1f} {p95:>9.1f} "
+              f"{p99:>9.1f} {micros.max():>9.1f} {orders:>7} {peak / 1024:>9.1f} {retained / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
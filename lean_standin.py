@@ -0,0 +1,431 @@
+"""
+In-process stand-in for the parts of LEAN that orb_example.py uses.
+
+SchwabSyntheticStops and SymbolData run against StandInAlgorithm without
+QuantConnect: securities with bid/ask/price, a portfolio, the algorithm
+clock, stop market and market order tickets, order events and one-time
+scheduled events. Fills and rejections are driven explicitly by the caller.
+
+    import lean_standin
+    lean_standin.install()  # Registers AlgorithmImports if LEAN is not installed
+    from orb_example import SchwabSyntheticStops
+
+    algorithm = lean_standin.StandInAlgorithm(datetime(2025, 1, 2, 9, 30))
+    handler = algorithm.synthetic_stops = SchwabSyntheticStops(algorithm)
+    algorithm.set_quote("AAPL", 190.00, 190.05)
+    ticket = handler.submit_stop_order("AAPL", 100, 190.02, tag="Entry")
+    algorithm.reject(ticket, "Stop price must be above the current ask")
+"""
+
+import heapq
+import sys
+import types
+from collections import deque
+from datetime import datetime, timedelta
+from enum import IntEnum
+
+OrderStatus = IntEnum("OrderStatus", {
+    "New": 0, "Submitted": 1, "PartiallyFilled": 2, "Filled": 3, "Canceled": 5,
+    "Invalid": 7, "CancelPending": 8, "UpdateSubmitted": 9,
+})
+OrderType = IntEnum("OrderType", {"Market": 0, "Limit": 1, "StopMarket": 2, "StopLimit": 3})
+Resolution = IntEnum("Resolution", {"Tick": 0, "Second": 1, "Minute": 2, "Hour": 3, "Daily": 4})
+TickType = IntEnum("TickType", {"Trade": 0, "Quote": 1, "OpenInterest": 2})
+BrokerageName = IntEnum("BrokerageName", {"Default": 0, "CharlesSchwab": 1})
+AccountType = IntEnum("AccountType", {"Margin": 0, "Cash": 1})
+
+_OPEN = (OrderStatus.New, OrderStatus.Submitted, OrderStatus.PartiallyFilled, OrderStatus.UpdateSubmitted)
+
+
+class QCAlgorithm:
+    pass
+
+
+class UpdateOrderFields:
+    def __init__(self):
+        self.Quantity = None
+        self.StopPrice = None
+        self.Tag = None
+
+
+class IndicatorDataPoint:
+    def __init__(self, value=0.0):
+        self.Value = value
+
+
+class SimpleMovingAverage:
+    def __init__(self, period):
+        self.period = period
+        self.window = deque(maxlen=period)
+        self.Current = IndicatorDataPoint()
+
+    @property
+    def IsReady(self):
+        return len(self.window) == self.period
+
+    def Update(self, time, value):
+        self.window.append(value)
+        self.Current = IndicatorDataPoint(sum(self.window) / len(self.window))
+        return self.IsReady
+
+
+class Indicator:
+    """Indicator whose value is set directly, e.g. the ATR."""
+
+    def __init__(self, value=0.0, ready=False):
+        self.Current = IndicatorDataPoint(value)
+        self.IsReady = ready
+
+    def set(self, value):
+        self.Current = IndicatorDataPoint(value)
+        self.IsReady = True
+
+
+def algorithm_imports():
+    """Module with the AlgorithmImports names orb_example needs."""
+    module = types.ModuleType("AlgorithmImports")
+    for name in ("datetime", "timedelta", "QCAlgorithm", "OrderStatus", "OrderType", "Resolution",
+                 "TickType", "BrokerageName", "AccountType", "UpdateOrderFields", "SimpleMovingAverage",
+                 "UserDefinedUniverse"):
+        setattr(module, name, globals()[name])
+    return module
+
+
+def install():
+    """Register the stand-in AlgorithmImports unless the real one is importable."""
+    try:
+        import AlgorithmImports  # noqa: F401
+    except ImportError:
+        sys.modules["AlgorithmImports"] = algorithm_imports()
+
+
+class Security:
+    def __init__(self, symbol):
+        self.Symbol = symbol
+        self.BidPrice = self.AskPrice = self.Price = 0.0
+        self.HasData = False
+        self.Subscriptions = []
+        self.SymbolProperties = types.SimpleNamespace(MinimumPriceVariation=0.01)
+
+
+class SecurityHolding:
+    def __init__(self, symbol):
+        self.Symbol = symbol
+        self.Quantity = 0
+        self.AveragePrice = 0.0
+
+    @property
+    def Invested(self):
+        return self.Quantity != 0
+
+
+class _SymbolDictionary(dict):
+    """Dictionary that creates missing entries, like LEAN's security and holding collections."""
+
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+
+    def __missing__(self, symbol):
+        value = self[symbol] = self.factory(symbol)
+        return value
+
+    def ContainsKey(self, symbol):
+        return symbol in self
+
+
+class Portfolio(_SymbolDictionary):
+    def __init__(self, algorithm, cash):
+        super().__init__(SecurityHolding)
+        self.algorithm = algorithm
+        self.Cash = cash
+        self.TotalProfit = 0.0
+
+    @property
+    def Invested(self):
+        return any(holding.Invested for holding in self.values())
+
+    @property
+    def Values(self):
+        return list(self.values())
+
+    @property
+    def TotalPortfolioValue(self):
+        securities = self.algorithm.Securities
+        return self.Cash + sum(holding.Quantity * securities[symbol].Price for symbol, holding in self.items())
+
+
+class DataDictionary(dict):
+    @property
+    def Keys(self):
+        return list(self)
+
+    def ContainsKey(self, symbol):
+        return symbol in self
+
+
+class Slice:
+    """Slice with a non fill-forward quote bar for each updated symbol."""
+
+    def __init__(self, time, symbols=(), ticks=None):
+        self.Time = time
+        self.QuoteBars = DataDictionary((symbol, types.SimpleNamespace(IsFillForward=False)) for symbol in symbols)
+        self.Ticks = DataDictionary(ticks or {})
+        self.Keys = list(dict.fromkeys([*self.QuoteBars, *self.Ticks]))
+
+
+class OrderEvent:
+    def __init__(self, ticket, status, utc_time, fill_price=0.0, fill_quantity=0, message=""):
+        self.OrderId = ticket.OrderId
+        self.Symbol = ticket.Symbol
+        self.Status = status
+        self.FillPrice = fill_price
+        self.FillQuantity = fill_quantity
+        self.Message = message
+        self.UtcTime = utc_time
+
+
+class OrderTicket:
+    def __init__(self, algorithm, order_id, order_type, symbol, quantity, stop_price, tag):
+        self.algorithm = algorithm
+        self.OrderId = order_id
+        self.OrderType = order_type
+        self.Symbol = symbol
+        self.Quantity = quantity
+        self.StopPrice = stop_price
+        self.Tag = tag
+        self.Time = algorithm.Time
+        self.Status = OrderStatus.Submitted
+        self.QuantityFilled = 0
+
+    def Update(self, fields):
+        """Apply the non-empty fields of an open order; succeeds unless algorithm.update_succeeds is off."""
+        success = self.Status in _OPEN and self.algorithm.update_succeeds
+        if success:
+            if fields.Quantity is not None:
+                self.Quantity = fields.Quantity
+            if fields.StopPrice is not None:
+                self.StopPrice = fields.StopPrice
+            if fields.Tag is not None:
+                self.Tag = fields.Tag
+        return types.SimpleNamespace(IsSuccess=success)
+
+    def Cancel(self):
+        if self.Status in _OPEN:
+            self.algorithm.order_event(self, OrderStatus.Canceled)
+        return types.SimpleNamespace(IsSuccess=self.Status == OrderStatus.Canceled)
+
+
+class Schedule:
+    """One-time scheduled events; StandInAlgorithm.advance fires them."""
+
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.events = {}  # sequence -> [time, callback, sequence]
+        self.heap = []  # (time, sequence), removed events are skipped when popped
+        self.sequence = 0
+
+    def On(self, date_rule, time_rule, callback):
+        self.sequence += 1
+        event = [datetime.combine(self.algorithm.Time.date(), time_rule), callback, self.sequence]
+        self.events[self.sequence] = event
+        heapq.heappush(self.heap, (event[0], self.sequence))
+        return event
+
+    def Remove(self, event):
+        self.events.pop(event[2], None)  # Already fired events are gone
+
+    def fire_until(self, until):
+        """Run callbacks due at or before until in time order, each at its own time."""
+        while self.heap and self.heap[0][0] <= until:
+            _, sequence = heapq.heappop(self.heap)
+            event = self.events.pop(sequence, None)
+            if event is not None:
+                self.algorithm.Time = event[0]
+                event[1]()
+
+
+class Transactions:
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+
+    def GetOpenOrders(self, symbol=None):
+        return [ticket for ticket in self.algorithm.orders
+                if ticket.Status in _OPEN and (symbol is None or ticket.Symbol == symbol)]
+
+
+class Universe:
+    """A universe with a fixed member set."""
+
+    def __init__(self, symbols=()):
+        self.members = set(symbols)
+
+    def ContainsMember(self, symbol):
+        return symbol in self.members
+
+
+class UserDefinedUniverse(Universe):
+    """The universe AddEquity adds securities to."""
+
+
+class UniverseManager(dict):
+    @property
+    def Values(self):
+        return list(self.values())
+
+
+class ObjectStore(dict):
+    def ContainsKey(self, key):
+        return key in self
+
+    def Save(self, key, value):
+        self[key] = value
+
+    def Read(self, key):
+        return self[key]
+
+    def SaveBytes(self, key, value):
+        self[key] = bytes(value)
+
+    def ReadBytes(self, key):
+        return self[key]
+
+
+class Consolidator:
+    def __init__(self, symbol, period, callback):
+        self.symbol = symbol
+        self.period = period
+        self.callback = callback
+
+    def Dispose(self):
+        pass
+
+
+class StandInAlgorithm:
+    """
+    The parts of QCAlgorithm used by SchwabSyntheticStops and SymbolData.
+
+    Time is a plain datetime that also serves as UtcTime. Like a LEAN
+    backtest, a synchronous MarketOrder fills at the security price before the
+    call returns (unless fill_market_orders is off), and submit_rejection(ticket)
+    can reject an order at submit time; both events are delivered from inside
+    the submit call. Other orders stay Submitted until fill() or reject()
+    resolves them. Every event is delivered to OnOrderEvent, which subclasses
+    (or callers) override.
+    """
+
+    def __init__(self, start=datetime(2025, 1, 2, 9, 30), cash=100000.0, log=False):
+        self.Time = start
+        self.Securities = _SymbolDictionary(Security)
+        self.Portfolio = Portfolio(self, cash)
+        self.Schedule = Schedule(self)
+        self.DateRules = types.SimpleNamespace(Today=None)
+        self.TimeRules = types.SimpleNamespace(At=self._time_rule)
+        self.Transactions = Transactions(self)
+        self.ObjectStore = ObjectStore()
+        self.UniverseManager = UniverseManager()
+        self.SubscriptionManager = types.SimpleNamespace(RemoveConsolidator=lambda symbol, consolidator: None)
+        self.orders = []  # All OrderTickets in submission order
+        self.logs = []
+        self.print_logs = log
+        self.update_succeeds = True
+        self.fill_market_orders = True  # Fill synchronous market orders inside the submit call
+        self.submit_rejection = None  # ticket -> rejection message (or None) checked at submit time
+        self._order_id = 0
+
+    @staticmethod
+    def _time_rule(hour, minute, second=0):
+        return datetime.min.time().replace(hour=hour, minute=minute, second=second)
+
+    @property
+    def UtcTime(self):
+        return self.Time
+
+    def Log(self, message):
+        self.logs.append(message)
+        if self.print_logs:
+            print(f"{self.Time} {message}")
+
+    def advance(self, until):
+        """Move the clock to until, firing the scheduled events due on the way."""
+        self.Schedule.fire_until(until)
+        self.Time = until
+
+    def set_quote(self, symbol, bid_price, ask_price, price=None):
+        security = self.Securities[symbol]
+        security.BidPrice = bid_price
+        security.AskPrice = ask_price
+        security.Price = (bid_price + ask_price) / 2 if price is None else price
+        security.HasData = True
+        return security
+
+    def AddEquity(self, symbol, resolution=Resolution.Minute):
+        security = self.Securities[symbol]
+        security.Subscriptions.append(types.SimpleNamespace(Resolution=resolution))
+        return security
+
+    def RemoveSecurity(self, symbol):
+        self.Securities[symbol].Subscriptions.clear()
+
+    def ATR(self, symbol, period):
+        return Indicator()
+
+    def Consolidate(self, symbol, period, callback):
+        return Consolidator(symbol, period, callback)
+
+    def CalculateOrderQuantity(self, symbol, target):
+        price = self.Securities[symbol].Price
+        return int(target * self.Portfolio.TotalPortfolioValue / price) if price > 0 else 0
+
+    def StopMarketOrder(self, symbol, quantity, stop_price, tag=""):
+        return self._submit(OrderType.StopMarket, symbol, quantity, stop_price, tag)
+
+    def MarketOrder(self, symbol, quantity, asynchronous=False, tag=""):
+        ticket = self._submit(OrderType.Market, symbol, quantity, None, tag)
+        if ticket.Status == OrderStatus.Submitted and self.fill_market_orders and not asynchronous:
+            self.fill(ticket, self.Securities[symbol].Price)
+        return ticket
+
+    def Liquidate(self, symbol=None):
+        """Cancel open orders and close holdings with market orders, for one symbol or all."""
+        for ticket in self.Transactions.GetOpenOrders(symbol):
+            ticket.Cancel()
+        for held, holding in list(self.Portfolio.items()):
+            if holding.Quantity and symbol in (None, held):
+                self.MarketOrder(held, -holding.Quantity, tag="Liquidated")
+
+    def _submit(self, order_type, symbol, quantity, stop_price, tag):
+        self._order_id += 1
+        ticket = OrderTicket(self, self._order_id, order_type, symbol, quantity, stop_price, tag)
+        self.orders.append(ticket)
+        message = self.submit_rejection(ticket) if self.submit_rejection is not None else None
+        if message:
+            self.reject(ticket, message)
+        return ticket
+
+    def fill(self, ticket, price=None, quantity=None):
+        """Fill an order (partially when quantity is less than what remains) and update the holding."""
+        remaining = ticket.Quantity - ticket.QuantityFilled
+        quantity = remaining if quantity is None else quantity
+        if price is None:
+            security = self.Securities[ticket.Symbol]
+            price = ticket.StopPrice or (security.AskPrice if quantity > 0 else security.BidPrice)
+
+        holding = self.Portfolio[ticket.Symbol]
+        holding.Quantity += quantity
+        self.Portfolio.Cash -= quantity * price
+        ticket.QuantityFilled += quantity
+        status = OrderStatus.Filled if ticket.QuantityFilled == ticket.Quantity else OrderStatus.PartiallyFilled
+        return self.order_event(ticket, status, price, quantity)
+
+    def reject(self, ticket, message):
+        return self.order_event(ticket, OrderStatus.Invalid, message=message)
+
+    def order_event(self, ticket, status, fill_price=0.0, fill_quantity=0, message=""):
+        ticket.Status = status
+        event = OrderEvent(ticket, status, self.UtcTime, fill_price, fill_quantity, message)
+        self.OnOrderEvent(event)
+        return event
+
+    def OnOrderEvent(self, order_event):
+        pass
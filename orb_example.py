@@ -17,14 +17,25 @@ License: MIT
 """
 
 from AlgorithmImports import *
+import heapq
+import json
+import os
+import re
+import struct
+from bisect import bisect_left, bisect_right
+from collections import deque
 from dataclasses import dataclass
+from enum import Enum, IntEnum
+from functools import lru_cache, partial
 from typing import Optional
 
+import numpy as np
+
 # =============================================================================
 # SCHWAB SYNTHETIC STOPS IMPLEMENTATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SyntheticEntry:
     """Tracks synthetic entry orders for Schwab rejection handling."""
     symbol: str
@@ -33,8 +44,16 @@ class SyntheticEntry:
     timeout: datetime
     side: int  # OrderSide.Buy = 1, OrderSide.Sell = -1
     original_order_id: Optional[str] = None
+    order_id: Optional[int] = None  # Order submitted on trigger; in pending_orders until it closes
+    retries: int = 0  # Trigger orders resubmitted after a failure
+    # Latency spans (UTC): rejection -> monitoring -> first evaluation -> order -> fill
+    rejected_at: Optional[datetime] = None
+    monitored_at: Optional[datetime] = None
+    evaluated_at: Optional[datetime] = None
+    triggered_at: Optional[datetime] = None
+    filled_at: Optional[datetime] = None
 
-@dataclass
+@dataclass(slots=True)
 class SyntheticStop:
     """Tracks synthetic stop orders for Schwab rejection handling."""
     symbol: str
@@ -43,6 +62,1140 @@ class SyntheticStop:
     timeout: datetime
     side: int  # OrderSide.Buy = 1, OrderSide.Sell = -1
     original_order_id: Optional[str] = None
+    order_id: Optional[int] = None  # Order submitted on trigger; in pending_orders until it closes
+    retries: int = 0  # Trigger orders resubmitted after a failure
+    # Latency spans (UTC): rejection -> monitoring -> first evaluation -> order -> fill
+    rejected_at: Optional[datetime] = None
+    monitored_at: Optional[datetime] = None
+    evaluated_at: Optional[datetime] = None
+    triggered_at: Optional[datetime] = None
+    filled_at: Optional[datetime] = None
+
+class OrderRole(Enum):
+    """What an order submitted by the strategy or the synthetic handler is for."""
+    ENTRY = "entry"  # Breakout entry stop
+    STOP = "stop"  # Main (ATR) protective stop
+    BACKUP_STOP = "backup_stop"  # Stop for shares the main stop could not be resized to
+    SYNTHETIC_ENTRY = "synthetic_entry"  # Entry stop placed by the synthetic monitor
+    SYNTHETIC_STOP = "synthetic_stop"  # Protective stop placed by the synthetic monitor
+    CROSS_ENTRY = "cross_entry"  # Market entry after price crossed a synthetic entry
+    CROSS_STOP = "cross_stop"  # Market exit after price crossed a synthetic stop
+    TIMEOUT = "timeout"  # Market exit of a timed-out synthetic stop
+    EXIT = "exit"  # Other market exits
+
+ENTRY_ROLES = frozenset((OrderRole.ENTRY, OrderRole.SYNTHETIC_ENTRY, OrderRole.CROSS_ENTRY))
+# Market orders the monitors submit from the data loop; their rejections are settled by _reconcile_order
+TRIGGER_MARKET_ROLES = frozenset((OrderRole.CROSS_ENTRY, OrderRole.CROSS_STOP, OrderRole.TIMEOUT))
+
+@dataclass(slots=True)
+class OrderRoute:
+    """Symbol, role, ticket and last known state of a submitted order."""
+    symbol: str
+    role: OrderRole
+    ticket: object
+    quantity: int
+    status: object = OrderStatus.Submitted
+    filled: int = 0
+    
+    @property
+    def remaining(self) -> int:
+        return self.quantity - self.filled
+
+class OrderRegistry:
+    """
+    OrderId -> OrderRoute for every order submitted through the handler.
+    
+    Order events dispatch with one dictionary lookup instead of comparing
+    tickets, and each route keeps the order's status and filled quantity as
+    reported by order events, so decision code reads them from Python rather
+    than polling ticket.Status across the .NET boundary. Final routes are
+    kept for the day and pruned at the daily reset.
+    
+    LEAN delivers the fill of a synchronous market order, and a rejection at
+    submit time, before the submit call returns. Events arriving while
+    submitting is set for an order that is not registered yet are deferred
+    and redelivered by the handler once it is.
+    """
+    
+    OPEN_STATUSES = (OrderStatus.New, OrderStatus.Submitted, OrderStatus.PartiallyFilled,
+                     OrderStatus.UpdateSubmitted, OrderStatus.CancelPending)
+    
+    def __init__(self):
+        self.routes = {}
+        self.submitting = False  # Set for the duration of a submit call
+        self.deferred = []  # Events that arrived for an order before it was registered
+    
+    def __len__(self):
+        return len(self.routes)
+    
+    def register(self, ticket, symbol, role: OrderRole, quantity: int) -> OrderRoute:
+        route = self.routes[ticket.OrderId] = OrderRoute(symbol, role, ticket, quantity, OrderStatus.New)
+        return route
+    
+    def defer(self, order_event) -> bool:
+        """Hold back an event for an order that is still being submitted; True if it was deferred."""
+        if self.submitting and order_event.OrderId not in self.routes:
+            self.deferred.append(order_event)
+            return True
+        return False
+    
+    def get(self, ticket) -> Optional[OrderRoute]:
+        return self.routes.get(ticket.OrderId) if ticket is not None else None
+    
+    def on_order_event(self, order_event) -> Optional[OrderRoute]:
+        """Apply an order event to its route and return the route (None for untracked orders)."""
+        route = self.routes.get(order_event.OrderId)
+        if route is not None:
+            route.status = order_event.Status
+            route.filled += int(order_event.FillQuantity)
+        return route
+    
+    def update_quantity(self, ticket, quantity: int):
+        """Record a successful quantity update of an order."""
+        route = self.get(ticket)
+        if route is not None:
+            route.quantity = quantity
+    
+    def status(self, ticket):
+        """Last known status of an order (None for untracked orders)."""
+        route = self.get(ticket)
+        return route.status if route is not None else None
+    
+    def is_open(self, ticket) -> bool:
+        """Whether an order is tracked and still working at the broker."""
+        route = self.get(ticket)
+        return route is not None and route.status in self.OPEN_STATUSES
+    
+    def prune(self):
+        """Forget orders that reached a final status."""
+        self.routes = {order_id: route for order_id, route in self.routes.items()
+                       if route.status in self.OPEN_STATUSES}
+    
+    def clear(self):
+        self.routes.clear()
+
+class OrderThrottle:
+    """
+    Token-bucket rate limit with strict priority for outbound order requests.
+    
+    A request is sent right away when a token is free and nothing of the same
+    or higher priority is waiting; otherwise it is queued by priority, then
+    arrival: protective exits before synthetic stop placements before
+    entries. A request for a key that is already queued replaces it in place,
+    so a waiting stop goes out at its latest size. The queue drains from a
+    scheduled event at the time the next token is available, and on drain().
+    orders_per_minute None disables the limit.
+    """
+    
+    EXIT = 0
+    SYNTHETIC = 1
+    ENTRY = 2
+    
+    def __init__(self, algorithm, orders_per_minute: Optional[float] = None, burst: int = 10):
+        self.algorithm = algorithm
+        self.orders_per_minute = orders_per_minute
+        self.burst = burst
+        self.tokens = float(burst)
+        self.refilled_at = None
+        self.heap = []  # [priority, sequence, key, send, on_sent]; send is None once discarded
+        self.queued = {}  # key -> heap entry
+        self.sequence = 0
+        self._event = None
+    
+    def __len__(self):
+        return len(self.queued)
+    
+    def is_queued(self, key) -> bool:
+        return key in self.queued
+    
+    def submit(self, priority: int, key, send, on_sent=None):
+        """
+        Send a request now or queue it.
+        
+        send() performs the broker call; on_sent(result) runs whenever it is
+        performed. Returns send()'s result, or None if the request was queued.
+        """
+        if self.orders_per_minute is None:
+            return self._send(send, on_sent)
+        
+        self._refill()
+        head = self._head()
+        if self.tokens >= 1 and (head is None or head[0] > priority):
+            self.tokens -= 1
+            return self._send(send, on_sent)
+        
+        queued = self.queued.get(key)
+        if queued is not None:
+            # Keep the queue position, send the newer request
+            queued[3], queued[4] = send, on_sent
+        else:
+            self.sequence += 1
+            entry = [priority, self.sequence, key, send, on_sent]
+            self.queued[key] = entry
+            heapq.heappush(self.heap, entry)
+        self._schedule()
+        return None
+    
+    def discard(self, key):
+        """Drop a queued request."""
+        entry = self.queued.pop(key, None)
+        if entry is not None:
+            entry[3] = None
+    
+    def drain(self):
+        """Send queued requests while tokens last."""
+        if not self.queued:
+            return
+        
+        self._refill()
+        while self.tokens >= 1:
+            entry = self._head()
+            if entry is None:
+                break
+            heapq.heappop(self.heap)
+            del self.queued[entry[2]]
+            self.tokens -= 1
+            self._send(entry[3], entry[4])
+        self._schedule()
+    
+    def clear(self):
+        self.heap.clear()
+        self.queued.clear()
+        if self._event is not None:
+            self.algorithm.Schedule.Remove(self._event)
+            self._event = None
+    
+    def _head(self):
+        """Highest-priority live queued entry, dropping discarded ones off the top."""
+        while self.heap and self.heap[0][3] is None:
+            heapq.heappop(self.heap)
+        return self.heap[0] if self.heap else None
+    
+    def _refill(self):
+        now = self.algorithm.Time
+        elapsed = (now - self.refilled_at).total_seconds() if self.refilled_at is not None else 0.0
+        self.tokens = min(self.burst, self.tokens + elapsed * self.orders_per_minute / 60)
+        self.refilled_at = now
+    
+    def _schedule(self):
+        if self._event is not None or not self.queued:
+            return
+        
+        wait = timedelta(seconds=max(0.0, 1 - self.tokens) * 60 / self.orders_per_minute)
+        fire_at = self.algorithm.Time + wait
+        # Round up to a whole second so a token is available when the event fires
+        if fire_at.microsecond:
+            fire_at = fire_at.replace(microsecond=0) + timedelta(seconds=1)
+        if fire_at <= self.algorithm.Time:
+            fire_at = self.algorithm.Time.replace(microsecond=0) + timedelta(seconds=1)
+        self._event = self.algorithm.Schedule.On(
+            self.algorithm.DateRules.Today,
+            self.algorithm.TimeRules.At(fire_at.hour, fire_at.minute, fire_at.second),
+            self._on_scheduled
+        )
+    
+    def _on_scheduled(self):
+        self._event = None
+        self.drain()
+    
+    @staticmethod
+    def _send(send, on_sent):
+        result = send()
+        if on_sent is not None:
+            on_sent(result)
+        return result
+
+class RejectionReason(Enum):
+    """Reason codes for broker order rejections."""
+    NONE = "none"  # Not a Schwab stop price rejection
+    SPREAD = "spread"  # Stop price inside or on the wrong side of the bid-ask spread
+    INVALID_PRICE = "invalid_price"  # Stop price rejected as invalid
+    OTHER = "other"  # Stop order rejected for another reason
+
+class SchwabRejectionClassifier:
+    """
+    Classifies rejection messages with a single precompiled regex.
+    
+    Every (reason, pattern) pair becomes one lookahead alternative of a
+    case-insensitive regex anchored at the start of the message, with a named
+    group per pattern. Patterns are tried in priority order (list order), so
+    the first pattern found anywhere in the message wins, whatever its
+    position; the generic OTHER patterns come last. Results are memoized per
+    distinct message in an LRU cache, since rejections arrive in bursts of
+    near-identical messages.
+    """
+    
+    # Most specific first
+    DEFAULT_PATTERNS = [
+        (RejectionReason.SPREAD, r"stop price must be"),
+        (RejectionReason.SPREAD, r"stop price outside spread"),
+        (RejectionReason.INVALID_PRICE, r"invalid stop price"),
+        (RejectionReason.OTHER, r"stop order rejected"),
+    ]
+    
+    def __init__(self, patterns=None, cache_size: int = 256):
+        self.patterns = list(self.DEFAULT_PATTERNS if patterns is None else patterns)
+        self.cache_size = cache_size
+        self._compile()
+    
+    def add_pattern(self, reason: RejectionReason, pattern: str):
+        """
+        Add a regex pattern for a reason; rebuilds the regex and clears the cache.
+        
+        Specific reasons take precedence over the generic OTHER patterns.
+        """
+        index = len(self.patterns)
+        if reason != RejectionReason.OTHER:
+            index = next((index for index, (existing, _) in enumerate(self.patterns)
+                          if existing == RejectionReason.OTHER), index)
+        self.patterns.insert(index, (reason, pattern))
+        self._compile()
+    
+    def _compile(self):
+        self._group_reasons = {f"p{index}": reason for index, (reason, _) in enumerate(self.patterns)}
+        alternatives = "|".join(f"(?=.*?(?P<p{index}>{pattern}))" for index, (_, pattern) in enumerate(self.patterns))
+        self._regex = re.compile(alternatives or r"(?!)", re.IGNORECASE | re.DOTALL)
+        self.classify = lru_cache(maxsize=self.cache_size)(self._classify)
+    
+    def _classify(self, message: str) -> RejectionReason:
+        """Reason code for a rejection message (RejectionReason.NONE if no pattern matches)."""
+        match = self._regex.match(message or "")
+        return self._group_reasons[match.lastgroup] if match else RejectionReason.NONE
+
+class SpreadModel:
+    """
+    Incremental bid-ask spread estimator by minute of the trading day.
+    
+    Keeps an exponentially weighted mean and variance of ask - bid for each
+    regular-session minute, plus a session-wide estimate used until a minute
+    has min_samples observations. Updates are O(1) and memory is fixed.
+    """
+    
+    SESSION_OPEN_MINUTE = 9 * 60 + 30
+    SESSION_MINUTES = 390
+    
+    def __init__(self, alpha: float = 0.1, z_score: float = 1.0, min_samples: int = 5):
+        self.alpha = alpha
+        self.z_score = z_score
+        self.min_samples = min_samples
+        self.mean = [0.0] * self.SESSION_MINUTES
+        self.variance = [0.0] * self.SESSION_MINUTES
+        self.count = [0] * self.SESSION_MINUTES
+        self.session_mean = 0.0
+        self.session_variance = 0.0
+        self.session_count = 0
+    
+    def _bucket(self, time):
+        minute = time.hour * 60 + time.minute - self.SESSION_OPEN_MINUTE
+        return min(max(minute, 0), self.SESSION_MINUTES - 1)
+    
+    def update(self, time, bid_price: float, ask_price: float):
+        """Add one quote observation."""
+        if bid_price <= 0 or ask_price < bid_price:
+            return
+        
+        spread = ask_price - bid_price
+        bucket = self._bucket(time)
+        self.mean[bucket], self.variance[bucket] = self._ewm(
+            self.mean[bucket], self.variance[bucket], self.count[bucket], spread)
+        self.count[bucket] += 1
+        self.session_mean, self.session_variance = self._ewm(
+            self.session_mean, self.session_variance, self.session_count, spread)
+        self.session_count += 1
+    
+    def _ewm(self, mean, variance, count, value):
+        if count == 0:
+            return value, 0.0
+        delta = value - mean
+        mean += self.alpha * delta
+        variance = (1 - self.alpha) * (variance + self.alpha * delta * delta)
+        return mean, variance
+    
+    def predict(self, time) -> Optional[float]:
+        """Expected spread plus z_score deviations at this minute, or None without history."""
+        bucket = self._bucket(time)
+        if self.count[bucket] >= self.min_samples:
+            return self.mean[bucket] + self.z_score * self.variance[bucket] ** 0.5
+        if self.session_count >= self.min_samples:
+            return self.session_mean + self.z_score * self.session_variance ** 0.5
+        return None
+
+class RejectionStatistics:
+    """
+    Submitted/rejected stop order counters by symbol, time of day and spread.
+    
+    Each stop is counted under (symbol, time bucket, spread bucket), where the
+    spread is measured in basis points of the mid at submission. Only Invalid
+    events the classifier attributes to Schwab's stop price rules count as
+    rejections; stops rejected for other reasons (buying power, ...) never
+    tested the spread and are not counted as submitted either. The counters
+    are persisted to the ObjectStore as a JSON table, one row per key, so the
+    measured rejection rates carry over between days and deployments.
+    """
+    
+    def __init__(self, algorithm, classifier: SchwabRejectionClassifier,
+                 object_store_key: str = "schwab-synthetic-stops/rejection-statistics",
+                 time_bucket_minutes: int = 15, spread_edges_bps=(5, 10, 25, 50, 100)):
+        self.algorithm = algorithm
+        self.classifier = classifier
+        self.object_store_key = object_store_key
+        self.time_bucket_minutes = time_bucket_minutes
+        self.spread_edges_bps = list(spread_edges_bps)
+        self.counts = {}  # (symbol, time bucket, spread bucket) -> [submitted, rejected]
+        self.pending = {}  # order id -> key, until the broker accepts or rejects it
+    
+    def key(self, symbol, time, spread_bps: float):
+        time_bucket = (time.hour * 60 + time.minute) // self.time_bucket_minutes
+        return str(symbol), time_bucket, bisect_right(self.spread_edges_bps, spread_bps)
+    
+    def record_submission(self, symbol, order_id, spread_bps: float):
+        """Count a submitted stop; its outcome is resolved by on_order_event."""
+        key = self.key(symbol, self.algorithm.Time, spread_bps)
+        self.counts.setdefault(key, [0, 0])[0] += 1
+        self.pending[order_id] = key
+    
+    def on_order_event(self, order_event):
+        """Resolve a pending submission as rejected (Invalid) or accepted."""
+        if order_event.Status == OrderStatus.Invalid:
+            key = self.pending.pop(order_event.OrderId, None)
+            if key is None:
+                return
+            if self.classifier.classify(order_event.Message) != RejectionReason.NONE:
+                self.counts[key][1] += 1
+            else:
+                self.counts[key][0] -= 1
+        elif order_event.Status != OrderStatus.New:
+            self.pending.pop(order_event.OrderId, None)
+    
+    def rejection_rate(self, symbol, time, spread_bps: float):
+        """(rejection rate, submitted count) for the matching bucket; rate is None without samples."""
+        submitted, rejected = self.counts.get(self.key(symbol, time, spread_bps), (0, 0))
+        return (rejected / submitted if submitted else None), submitted
+    
+    def rows(self):
+        """Counters as a list of table rows."""
+        return [
+            {"symbol": symbol, "time_bucket": time_bucket, "spread_bucket": spread_bucket,
+             "submitted": submitted, "rejected": rejected}
+            for (symbol, time_bucket, spread_bucket), (submitted, rejected) in self.counts.items()
+        ]
+    
+    def save(self):
+        self.algorithm.ObjectStore.Save(self.object_store_key, json.dumps(self.rows()))
+    
+    def load(self):
+        if not self.algorithm.ObjectStore.ContainsKey(self.object_store_key):
+            return
+        for row in json.loads(self.algorithm.ObjectStore.Read(self.object_store_key)):
+            key = (row["symbol"], row["time_bucket"], row["spread_bucket"])
+            self.counts[key] = [row["submitted"], row["rejected"]]
+
+class SyntheticLatencyTracker:
+    """
+    Collects rejection-to-execution latency spans of synthetic records.
+    
+    A record is tracked from the order its monitor placed until that order
+    fills; its span timestamps are then turned into per-stage durations in
+    milliseconds. summary() reports p50/p95/p99 per stage for the day.
+    """
+    
+    STAGES = [
+        ("reject_to_monitor", "rejected_at", "monitored_at"),
+        ("monitor_to_evaluate", "monitored_at", "evaluated_at"),
+        ("evaluate_to_trigger", "evaluated_at", "triggered_at"),
+        ("trigger_to_fill", "triggered_at", "filled_at"),
+        ("reject_to_fill", "rejected_at", "filled_at"),
+    ]
+    
+    def __init__(self):
+        self.pending = {}  # order id -> record
+        self.durations = {stage: [] for stage, _, _ in self.STAGES}
+    
+    def track(self, order_id, record):
+        self.pending[order_id] = record
+    
+    def discard(self, order_id):
+        """Forget an order that closed without filling."""
+        self.pending.pop(order_id, None)
+    
+    def on_fill(self, order_id, filled_at):
+        """Close the span of the record whose order filled."""
+        record = self.pending.pop(order_id, None)
+        if record is None:
+            return
+        
+        record.filled_at = filled_at
+        for stage, start, end in self.STAGES:
+            started, ended = getattr(record, start), getattr(record, end)
+            if started is not None and ended is not None:
+                self.durations[stage].append((ended - started).total_seconds() * 1000)
+    
+    def summary(self):
+        """Stage -> (count, p50, p95, p99) in milliseconds, for stages with samples."""
+        result = {}
+        for stage, values in self.durations.items():
+            if values:
+                p50, p95, p99 = np.percentile(values, [50, 95, 99])
+                result[stage] = (len(values), p50, p95, p99)
+        return result
+    
+    def reset(self):
+        self.pending.clear()
+        for values in self.durations.values():
+            values.clear()
+
+class FillQualityTracker:
+    """
+    Slippage of stop fills against their intended price, aggregated by order tag.
+    
+    Tags separate the native paths ("Entry", "Stop Loss", "ATR Stop", "Backup
+    Stop") from the synthetic ones ("Synthetic Entry", "Synthetic Entry (Cross)",
+    "Synthetic Stop", "Synthetic Stop (Cross)", "Synthetic Stop (Timeout)").
+    Slippage is signed so positive means worse than target: paying more on a
+    buy, receiving less on a sell. Averages are weighted by filled shares.
+    """
+    
+    def __init__(self):
+        self.expected = {}  # order id -> (tag, target price)
+        self.paths = {}  # tag -> [fills, shares, ticks x shares, bps x shares, worst bps]
+    
+    def expect(self, order_id, tag: str, target_price: float):
+        """Register the price an order was meant to fill at."""
+        self.expected[order_id] = (tag, target_price)
+    
+    def discard(self, order_id):
+        """Forget an order that was canceled or rejected (after any partial fills)."""
+        self.expected.pop(order_id, None)
+    
+    def on_fill(self, order_event, tick_size: float):
+        """Account a (partial) fill of a registered order."""
+        expected = self.expected.get(order_event.OrderId)
+        if expected is None or order_event.FillQuantity == 0:
+            return
+        if order_event.Status == OrderStatus.Filled:
+            del self.expected[order_event.OrderId]
+        
+        tag, target_price = expected
+        shares = abs(order_event.FillQuantity)
+        slippage = (order_event.FillPrice - target_price) * (1 if order_event.FillQuantity > 0 else -1)
+        slippage_ticks = slippage / tick_size if tick_size > 0 else 0.0
+        slippage_bps = slippage / target_price * 10000 if target_price > 0 else 0.0
+        
+        path = self.paths.setdefault(tag, [0, 0, 0.0, 0.0, float("-inf")])
+        path[0] += 1
+        path[1] += shares
+        path[2] += slippage_ticks * shares
+        path[3] += slippage_bps * shares
+        path[4] = max(path[4], slippage_bps)
+    
+    def summary(self):
+        """Tag -> (fills, shares, mean ticks, mean bps, worst bps)."""
+        return {
+            tag: (fills, shares, ticks / shares, bps / shares, worst)
+            for tag, (fills, shares, ticks, bps, worst) in self.paths.items() if shares
+        }
+
+class SyntheticOrderStore:
+    """
+    Struct-of-arrays store of synthetic records keyed by symbol.
+    
+    Target price, quantity and side are kept in NumPy columns, one row per
+    monitored symbol, so all monitored triggers can be
+    compared against a bid/ask array in one vectorized pass. Removing a symbol
+    moves the last row into its slot to keep the columns dense.
+    
+    Reads behave like the symbol -> record dict it replaces. Quantity changes
+    must go through update_quantity so the record and its row stay in sync.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.rows = {}  # symbol -> row
+        self.records = []  # row -> record
+        self.target_price = np.zeros(capacity, dtype=np.float64)
+        self.quantity = np.zeros(capacity, dtype=np.int64)
+        self.side = np.zeros(capacity, dtype=np.int8)
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def __contains__(self, symbol):
+        return symbol in self.rows
+    
+    def __getitem__(self, symbol):
+        return self.records[self.rows[symbol]]
+    
+    def __setitem__(self, symbol, record):
+        row = self.rows.get(symbol)
+        if row is None:
+            row = len(self.records)
+            if row == len(self.target_price):
+                self._grow()
+            self.rows[symbol] = row
+            self.records.append(record)
+        else:
+            self.records[row] = record
+        
+        self.target_price[row] = record.target_price
+        self.quantity[row] = record.quantity
+        self.side[row] = record.side
+    
+    def __iter__(self):
+        return iter(self.rows)
+    
+    def get(self, symbol, default=None):
+        row = self.rows.get(symbol)
+        return default if row is None else self.records[row]
+    
+    def keys(self):
+        return self.rows.keys()
+    
+    def values(self):
+        return list(self.records)
+    
+    def items(self):
+        return [(record.symbol, record) for record in self.records]
+    
+    def pop(self, symbol, default=None):
+        row = self.rows.pop(symbol, None)
+        if row is None:
+            return default
+        
+        record = self.records[row]
+        last = len(self.records) - 1
+        if row != last:
+            # Move the last row into the hole
+            moved = self.records[last]
+            self.records[row] = moved
+            self.rows[moved.symbol] = row
+            self.target_price[row] = self.target_price[last]
+            self.quantity[row] = self.quantity[last]
+            self.side[row] = self.side[last]
+        self.records.pop()
+        return record
+    
+    def clear(self):
+        self.rows.clear()
+        self.records.clear()
+    
+    def update_quantity(self, symbol, quantity: int):
+        """Change a monitored record's quantity in both the record and its row."""
+        row = self.rows[symbol]
+        self.records[row].quantity = quantity
+        self.quantity[row] = quantity
+    
+    def rows_for(self, symbols):
+        """Row indices for the given monitored symbols, as an index array."""
+        return np.fromiter((self.rows[symbol] for symbol in symbols), dtype=np.intp)
+    
+    def _grow(self):
+        capacity = 2 * len(self.target_price)
+        self.target_price = np.resize(self.target_price, capacity)
+        self.quantity = np.resize(self.quantity, capacity)
+        self.side = np.resize(self.side, capacity)
+
+class SyntheticLogger:
+    """
+    Leveled, lazily formatted and rate-limited logging for hot paths.
+    
+    Messages take %-style arguments that are only formatted when the level is
+    enabled and the message is not rate limited. Each key (the message
+    template unless given) may log max_per_interval messages per
+    interval_seconds of algorithm time; the rest are counted and kept
+    unformatted in a ring buffer until flush_summary reports them.
+    """
+    
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    
+    def __init__(self, algorithm, level: int = INFO, max_per_interval: int = 50,
+                 interval_seconds: float = 60, buffer_size: int = 500):
+        self.algorithm = algorithm
+        self.level = level
+        self.max_per_interval = max_per_interval
+        self.interval = timedelta(seconds=interval_seconds)
+        self.windows = {}  # key -> [window start, messages logged in window]
+        self.suppressed = {}  # key -> messages dropped since the last flush
+        self.buffer = deque(maxlen=buffer_size)  # (time, message, args) of dropped messages
+    
+    def is_enabled(self, level: int) -> bool:
+        return level >= self.level
+    
+    def debug(self, message: str, *args, key=None):
+        if self.DEBUG >= self.level:
+            self._log(message, args, key)
+    
+    def info(self, message: str, *args, key=None):
+        if self.INFO >= self.level:
+            self._log(message, args, key)
+    
+    def warning(self, message: str, *args, key=None):
+        if self.WARNING >= self.level:
+            self._log(message, args, key)
+    
+    def _log(self, message, args, key):
+        key = message if key is None else key
+        now = self.algorithm.Time
+        window = self.windows.get(key)
+        if window is None or now - window[0] >= self.interval:
+            self.windows[key] = window = [now, 0]
+        
+        if window[1] >= self.max_per_interval:
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1
+            self.buffer.append((now, message, args))
+            return
+        
+        window[1] += 1
+        self.algorithm.Log(message % args if args else message)
+    
+    def flush_summary(self, recent: int = 5):
+        """Log suppression counts per key and the most recent dropped messages, then reset."""
+        if not self.suppressed:
+            return
+        
+        for key, count in self.suppressed.items():
+            self.algorithm.Log(f"LOG SUMMARY: {count} suppressed - {key}")
+        for time, message, args in list(self.buffer)[-recent:]:
+            self.algorithm.Log(f"LOG SUMMARY: last suppressed at {time} - " + (message % args if args else message))
+        
+        self.suppressed.clear()
+        self.buffer.clear()
+        self.windows.clear()
+
+class JournalEvent(IntEnum):
+    """Event type codes of the binary synthetic-stop journal."""
+    ORDER_SUBMITTED = 1
+    ORDER_PARTIALLY_FILLED = 2
+    ORDER_FILLED = 3
+    ORDER_CANCELED = 4
+    ORDER_INVALID = 5
+    ORDER_UPDATED = 6
+    ORDER_UPDATE_FAILED = 7
+    MONITOR_ENTRY = 10
+    MONITOR_STOP = 11
+    RELEASE_ENTRY = 12
+    RELEASE_STOP = 13
+    SYNTHETIC_PLACED = 14
+    SYNTHETIC_CROSSED = 15
+    SYNTHETIC_TIMEOUT = 16
+    SYNTHETIC_RESIZED = 17
+    STOPS_CANCELED = 18
+    QUOTE_BID = 20
+    QUOTE_ASK = 21
+    QUOTE_LAST = 22
+
+# Fixed-width journal record: UTC timestamp (microseconds since epoch), symbol id,
+# event type, price, quantity and order id (-1 when there is none); 29 bytes, no padding
+JOURNAL_RECORD = struct.Struct("<qIBdii")
+JOURNAL_DTYPE = np.dtype([
+    ("time", "<i8"), ("symbol", "<u4"), ("event", "u1"),
+    ("price", "<f8"), ("quantity", "<i4"), ("order_id", "<i4"),
+])
+_EPOCH = datetime(1970, 1, 1)
+
+class SyntheticJournal:
+    """
+    Append-only binary journal of synthetic-stop lifecycle events.
+    
+    Records are packed into an in-memory buffer and flushed in batches of
+    flush_records, either appended to a local file (path) or saved as
+    numbered chunks under a per-day ObjectStore key. Symbols are interned to
+    ids; the id table is written next to the records. Before the first record
+    a restarted algorithm picks up the journal already written (the symbol
+    table, and today's chunk count in the ObjectStore), so it appends to it
+    instead of overwriting it. decode_journal turns the bytes back into a
+    NumPy record array.
+    """
+    
+    def __init__(self, algorithm, object_store_key: str = "schwab-synthetic-stops/journal",
+                 path: Optional[str] = None, flush_records: int = 4096):
+        self.algorithm = algorithm
+        self.enabled = True
+        self.record_quotes = False  # Also journal every quote the monitors evaluate (needed for replay)
+        self.key = object_store_key
+        self.path = path
+        self.flush_records = flush_records
+        self.symbol_ids = {}  # str(symbol) -> id
+        self.buffer = bytearray()
+        self.pending = 0
+        self.chunks = {}  # day -> ObjectStore chunks written
+        self._resumed = False
+    
+    def record_quote(self, symbol, bid_price: float, ask_price: float, price: float):
+        """Journal the quote a monitor evaluated, if quote recording is on."""
+        if self.record_quotes:
+            self.record(JournalEvent.QUOTE_BID, symbol, bid_price)
+            self.record(JournalEvent.QUOTE_ASK, symbol, ask_price)
+            self.record(JournalEvent.QUOTE_LAST, symbol, price)
+    
+    def record(self, event: JournalEvent, symbol, price: float = 0.0, quantity: int = 0, order_id=None):
+        if not self.enabled:
+            return
+        if not self._resumed:
+            self._resume()
+        
+        name = str(symbol)
+        symbol_id = self.symbol_ids.get(name)
+        if symbol_id is None:
+            symbol_id = self.symbol_ids[name] = len(self.symbol_ids)
+        
+        timestamp = (self.algorithm.UtcTime.replace(tzinfo=None) - _EPOCH) // timedelta(microseconds=1)
+        self.buffer += JOURNAL_RECORD.pack(
+            timestamp, symbol_id, event, price, int(quantity), -1 if order_id is None else int(order_id))
+        self.pending += 1
+        if self.pending >= self.flush_records:
+            self.flush()
+    
+    def _resume(self):
+        """Continue the symbol ids and chunk numbers of a journal written before a restart."""
+        self._resumed = True
+        symbols = None
+        if self.path is not None:
+            if os.path.exists(self.path + ".symbols.json"):
+                with open(self.path + ".symbols.json") as symbols_file:
+                    symbols = json.loads(symbols_file.read())
+        else:
+            store = self.algorithm.ObjectStore
+            day = self.algorithm.Time.date()
+            prefix = self.day_key(day)
+            chunk = 0
+            while store.ContainsKey(f"{prefix}/{chunk:05d}"):
+                chunk += 1
+            self.chunks[day] = chunk
+            if store.ContainsKey(f"{prefix}/symbols"):
+                symbols = json.loads(store.Read(f"{prefix}/symbols"))
+        
+        if symbols and not self.symbol_ids:
+            self.symbol_ids = {name: symbol_id for symbol_id, name in enumerate(symbols)}
+    
+    def symbols(self) -> list:
+        """Symbol names indexed by journal symbol id."""
+        return list(self.symbol_ids)
+    
+    def day_key(self, day) -> str:
+        return f"{self.key}/{day:%Y-%m-%d}"
+    
+    def flush(self):
+        """Write buffered records and the symbol table."""
+        if not self.pending:
+            return
+        
+        data = bytes(self.buffer)
+        symbols = json.dumps(self.symbols())
+        if self.path is not None:
+            with open(self.path, "ab") as journal_file:
+                journal_file.write(data)
+            with open(self.path + ".symbols.json", "w") as symbols_file:
+                symbols_file.write(symbols)
+        else:
+            day = self.algorithm.Time.date()
+            chunk = self.chunks.get(day, 0)
+            self.chunks[day] = chunk + 1
+            self.algorithm.ObjectStore.SaveBytes(f"{self.day_key(day)}/{chunk:05d}", data)
+            self.algorithm.ObjectStore.Save(f"{self.day_key(day)}/symbols", symbols)
+        
+        self.buffer.clear()
+        self.pending = 0
+    
+    def load(self, day):
+        """(records, symbols) journaled to the ObjectStore on a day."""
+        store = self.algorithm.ObjectStore
+        prefix = self.day_key(day)
+        if not store.ContainsKey(f"{prefix}/symbols"):
+            return decode_journal(b""), []
+        
+        data = bytearray()
+        chunk = 0
+        while store.ContainsKey(f"{prefix}/{chunk:05d}"):
+            data += bytes(store.ReadBytes(f"{prefix}/{chunk:05d}"))
+            chunk += 1
+        return decode_journal(bytes(data)), json.loads(store.Read(f"{prefix}/symbols"))
+
+def decode_journal(data: bytes) -> np.ndarray:
+    """Decode journal bytes into a record array with the JOURNAL_DTYPE fields."""
+    return np.frombuffer(data, dtype=JOURNAL_DTYPE, count=len(data) // JOURNAL_RECORD.size)
+
+def read_journal(path: str):
+    """(records, symbols) from a journal written to a local file."""
+    with open(path, "rb") as journal_file:
+        records = decode_journal(journal_file.read())
+    with open(path + ".symbols.json") as symbols_file:
+        return records, json.loads(symbols_file.read())
+
+def read_journal_chunks(directory: str):
+    """(records, symbols) from one day's ObjectStore chunks (00000, 00001, ..., symbols) downloaded to a directory."""
+    data = bytearray()
+    chunk = 0
+    while os.path.exists(os.path.join(directory, f"{chunk:05d}")):
+        with open(os.path.join(directory, f"{chunk:05d}"), "rb") as chunk_file:
+            data += chunk_file.read()
+        chunk += 1
+    with open(os.path.join(directory, "symbols")) as symbols_file:
+        return decode_journal(bytes(data)), json.loads(symbols_file.read())
+
+class SyntheticTriggerBook:
+    """
+    Per-symbol index of synthetic trigger thresholds.
+    
+    Buy-side records (long entries, short covers) and sell-side records
+    (short entries, long exits) are kept sorted by target price, so a quote
+    for one symbol finds the records it triggers with a bisection instead of
+    walking every monitored symbol.
+    """
+    
+    PLACE = "place"  # Quote is back outside the target - stop order can be placed
+    CROSS = "cross"  # Price traded through the target - execute at market
+    
+    def __init__(self):
+        # symbol -> {side: ([sorted target prices], [records in the same order])}
+        self.books = {}
+    
+    def __contains__(self, symbol):
+        return symbol in self.books
+    
+    def __len__(self):
+        return len(self.books)
+    
+    def add(self, record):
+        """Index a record under its symbol and side."""
+        book = self.books.setdefault(record.symbol, {1: ([], []), -1: ([], [])})
+        targets, records = book[record.side]
+        index = bisect_right(targets, record.target_price)
+        targets.insert(index, record.target_price)
+        records.insert(index, record)
+    
+    def remove(self, record):
+        """Drop a record from the index; unknown records are ignored."""
+        book = self.books.get(record.symbol)
+        if book is None:
+            return
+        
+        targets, records = book[record.side]
+        index = bisect_left(targets, record.target_price)
+        while index < len(targets) and targets[index] == record.target_price:
+            if records[index] is record:
+                del targets[index]
+                del records[index]
+                break
+            index += 1
+        
+        if not book[1][0] and not book[-1][0]:
+            del self.books[record.symbol]
+    
+    def clear(self):
+        self.books.clear()
+    
+    def triggered(self, symbol, bid_price, ask_price, current_price, tolerance):
+        """
+        Return (record, action) pairs triggered by a quote for one symbol.
+        
+        A record that can be placed as a stop order is never also reported as
+        crossed, matching the place-first order of the scalar checks.
+        """
+        book = self.books.get(symbol)
+        if book is None:
+            return []
+        
+        hits = []
+        
+        # Buy side: place when ask <= target + tolerance, cross when price > target
+        targets, records = book[1]
+        if targets:
+            place_from = len(targets)
+            if ask_price > 0:
+                place_from = _first_index(targets, lambda target: ask_price <= target + tolerance)
+                hits.extend((record, self.PLACE) for record in records[place_from:])
+            cross_to = min(bisect_left(targets, current_price), place_from)
+            hits.extend((record, self.CROSS) for record in records[:cross_to])
+        
+        # Sell side: place when bid >= target - tolerance, cross when price < target
+        targets, records = book[-1]
+        if targets:
+            place_to = 0
+            if bid_price > 0:
+                place_to = _first_index(targets, lambda target: not bid_price >= target - tolerance)
+                hits.extend((record, self.PLACE) for record in records[:place_to])
+            cross_from = max(bisect_right(targets, current_price), place_to)
+            hits.extend((record, self.CROSS) for record in records[cross_from:])
+        
+        return hits
+
+
+def _first_index(sorted_values, predicate):
+    """Binary search for the first value where a monotone predicate turns true."""
+    low, high = 0, len(sorted_values)
+    while low < high:
+        middle = (low + high) // 2
+        if predicate(sorted_values[middle]):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+class MonitoringSubscriptions:
+    """
+    Reference-counted high-resolution subscriptions for synthetic monitoring.
+    
+    Remembers which symbols were subscribed at the monitoring resolution and
+    which users (entry monitor, stop monitor, backup protection) still need
+    them, so Subscriptions never has to be rescanned. When the last user lets
+    go the manually added subscription is removed with RemoveSecurity. Because
+    RemoveSecurity cancels open orders and liquidates, removal is deferred
+    while the symbol is invested or has open orders and retried by
+    flush_pending. Symbols that already had the feed before monitoring are
+    never removed. RemoveSecurity also resets the security, so symbols still
+    selected by another universe keep the feed until the universe drops them;
+    release_all retries those daily.
+    
+    Limitation: LEAN has no call that drops one subscription of a universe
+    member without resetting the security, so removal only happens for
+    symbols added by hand. Every symbol the ORB strategy trades comes from
+    its universe; for those the second feed stays (in retained) until the
+    universe deselects the symbol, and the counts only stop duplicate
+    AddEquity calls.
+    """
+    
+    ENTRY = "entry"
+    STOP = "stop"
+    BACKUP = "backup"
+    PREWARM = "prewarm"
+    
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.users = {}  # symbol -> set of users
+        self.subscribed = set()  # Symbols subscribed by us
+        self.external = set()  # Symbols that already had the feed
+        self.pending_removal = set()
+        self.retained = set()  # Released symbols kept because another universe still selects them
+    
+    def acquire(self, symbol, user: str, resolution):
+        """Register a user of a symbol's high-resolution feed, subscribing on first use."""
+        self.users.setdefault(symbol, set()).add(user)
+        self.pending_removal.discard(symbol)
+        self.retained.discard(symbol)
+        if symbol in self.subscribed or symbol in self.external:
+            return
+        
+        if any(sub.Resolution == resolution for sub in self.algorithm.Securities[symbol].Subscriptions):
+            self.external.add(symbol)
+        else:
+            self.algorithm.AddEquity(symbol, resolution)
+            self.subscribed.add(symbol)
+    
+    def release(self, symbol, user: str):
+        """Drop a user; removes our subscription once nobody needs it."""
+        users = self.users.get(symbol)
+        if users is None:
+            return
+        
+        users.discard(user)
+        if not users:
+            del self.users[symbol]
+            self._remove(symbol)
+    
+    def release_all(self):
+        """Drop every user of every symbol and retry any deferred removals."""
+        for symbol in list(self.users):
+            del self.users[symbol]
+            self.pending_removal.add(symbol)
+        self.pending_removal |= self.retained
+        self.retained.clear()
+        self.flush_pending()
+    
+    def flush_pending(self):
+        """Retry removals that were deferred because of a position or open orders."""
+        for symbol in list(self.pending_removal):
+            self.pending_removal.discard(symbol)
+            self._remove(symbol)
+    
+    def _remove(self, symbol):
+        if symbol not in self.subscribed:
+            return
+        
+        if (self.algorithm.Portfolio[symbol].Invested or
+                self.algorithm.Transactions.GetOpenOrders(symbol)):
+            self.pending_removal.add(symbol)
+            return
+        
+        if self._in_other_universe(symbol):
+            self.retained.add(symbol)
+            return
+        
+        self.algorithm.RemoveSecurity(symbol)
+        self.subscribed.discard(symbol)
+    
+    def _in_other_universe(self, symbol) -> bool:
+        """Whether a universe other than the manual (AddEquity) one still selects the symbol."""
+        return any(not isinstance(universe, UserDefinedUniverse) and universe.ContainsMember(symbol)
+                   for universe in self.algorithm.UniverseManager.Values)
+
+
+class SyntheticTimeoutScheduler:
+    """
+    Min-heap of synthetic record timeouts.
+    
+    Records are pushed when monitoring starts, and again with the same
+    timeout when a rejected cross puts them back under monitoring. Records
+    that resolve before their timeout are not searched for; they are
+    discarded when they reach the top of the heap and no longer match the
+    active record, and repeated entries of a record are returned once.
+    """
+    
+    def __init__(self):
+        self.heap = []  # (timeout, sequence, record)
+        self._sequence = 0  # Tie-breaker so records are never compared
+    
+    def __len__(self):
+        return len(self.heap)
+    
+    def schedule(self, record):
+        """Register a record to expire at record.timeout."""
+        self._sequence += 1
+        heapq.heappush(self.heap, (record.timeout, self._sequence, record))
+    
+    def pop_expired(self, now, is_active):
+        """Pop and return the still-active records whose timeout is at or before now."""
+        expired = []
+        seen = set()
+        while self.heap and self.heap[0][0] <= now:
+            record = heapq.heappop(self.heap)[2]
+            if id(record) not in seen and is_active(record):
+                seen.add(id(record))
+                expired.append(record)
+        return expired
+    
+    def next_timeout(self):
+        """Earliest scheduled timeout (possibly of an already resolved record)."""
+        return self.heap[0][0] if self.heap else None
+    
+    def clear(self):
+        self.heap.clear()
+
+
+def evaluate_synthetic_triggers(bid, ask, price, target, quantity, tolerance, drop_dead=False):
+    """
+    Evaluate synthetic triggers for many records in one NumPy pass.
+    
+    Buy records (quantity > 0) can be placed as stop orders once the ask is
+    within tolerance of the target and cross when price trades above it; sell
+    records mirror this on the bid. With drop_dead, rows where either side of
+    the quote is 0 are dead. Timeouts are handled by SyntheticTimeoutScheduler.
+    
+    Returns boolean masks (place, cross, dead). A row is in at most one.
+    """
+    buy = quantity > 0
+    place = np.where(buy,
+                     (ask > 0) & (ask <= target + tolerance),
+                     (bid > 0) & (bid >= target - tolerance))
+    cross = ~place & np.where(buy, price > target, price < target)
+    
+    dead = np.zeros(len(target), dtype=bool)
+    if drop_dead:
+        dead |= (bid == 0) | (ask == 0)
+    
+    return place & ~dead, cross & ~dead, dead
+
 
 class SchwabSyntheticStops:
     """
@@ -52,164 +1205,679 @@ class SchwabSyntheticStops:
     when Schwab rejects stop orders within the bid-ask spread.
     """
     
+    _JOURNAL_STATUS = {
+        OrderStatus.PartiallyFilled: JournalEvent.ORDER_PARTIALLY_FILLED,
+        OrderStatus.Filled: JournalEvent.ORDER_FILLED,
+        OrderStatus.Canceled: JournalEvent.ORDER_CANCELED,
+        OrderStatus.Invalid: JournalEvent.ORDER_INVALID,
+    }
+    
+    # Protective exits go out first, then synthetic stop placements, then entries
+    _THROTTLE_PRIORITY = {
+        OrderRole.STOP: OrderThrottle.EXIT,
+        OrderRole.BACKUP_STOP: OrderThrottle.EXIT,
+        OrderRole.CROSS_STOP: OrderThrottle.EXIT,
+        OrderRole.TIMEOUT: OrderThrottle.EXIT,
+        OrderRole.EXIT: OrderThrottle.EXIT,
+        OrderRole.SYNTHETIC_STOP: OrderThrottle.SYNTHETIC,
+        OrderRole.ENTRY: OrderThrottle.ENTRY,
+        OrderRole.SYNTHETIC_ENTRY: OrderThrottle.ENTRY,
+        OrderRole.CROSS_ENTRY: OrderThrottle.ENTRY,
+    }
+    
+    # Rejections worth retrying besides the classified Schwab ones
+    _TRANSIENT_REJECTION = re.compile(
+        r"timed? ?out|temporar|try again|rate limit|too many requests|unavailable|connection", re.IGNORECASE)
+    
     def __init__(self, algorithm):
         self.algorithm = algorithm
-        self.synthetic_entries = {}
-        self.synthetic_stops = {}
+        self.synthetic_entries = SyntheticOrderStore()
+        self.synthetic_stops = SyntheticOrderStore()
         self.price_tolerance = 0.01
         self.synthetic_timeout_minutes = 10
+        self.quote_driven = False  # Only evaluate symbols with fresh QuoteBars/quote Ticks in the slice
+        self.tick_mode = False  # Monitor on quote ticks instead of second bars (implies quote_driven)
+        self.batch_threshold = 32  # Updated symbols per slice at which triggers are evaluated vectorized
+        self.rejection_classifier = SchwabRejectionClassifier()
+        self.orders = OrderRegistry()  # Routes order events of everything submitted through the handler
+        self.throttle = OrderThrottle(algorithm)  # Order submission rate limit (off until orders_per_minute is set)
+        self.asynchronous_orders = False  # Trigger market orders return without waiting for the fill
+        self.max_order_retries = 2  # Resubmissions of a failed cross/timeout order before giving up
+        self.pending_orders = {}  # OrderId -> synthetic record whose triggered order is still open
+        self.log = SyntheticLogger(algorithm)  # Level/rate limits for monitor and order-path logging
+        self.journal = SyntheticJournal(algorithm)  # Binary lifecycle journal for offline reconstruction
+        self.subscriptions = MonitoringSubscriptions(algorithm)
+        
+        # Symbols pre-subscribed before any rejection, so monitoring is hot when one arrives
+        self.prewarm_budget = 0  # Max symbols pre-subscribed at once (0 disables)
+        self.prewarmed = set()
+        
+        # Route orders Schwab would reject straight to synthetic monitoring
+        self.proactive_spread_gate = False
+        self.statistics = RejectionStatistics(algorithm, self.rejection_classifier)
+        self.skip_rejection_rate = None  # Measured rejection rate at which submission is skipped (None disables)
+        self.skip_min_samples = 20
+        self.skip_explore_every = 10  # Every Nth skip in a bucket is checked against the quote instead (0 never)
+        self._skips = {}  # Rejection statistics key -> submissions skipped
+        
+        # Rejection-to-execution latency and fill slippage per order path
+        self.latency = SyntheticLatencyTracker()
+        self.fill_quality = FillQualityTracker()
+        self._unevaluated = set()  # (record type, symbol) not evaluated since monitoring started
+        self.on_synthetic_order = None  # Optional callback(record, ticket) for orders placed by the monitors
+        
+        # Trigger books indexed by symbol, kept in sync with the dicts above
+        self.entry_book = SyntheticTriggerBook()
+        self.stop_book = SyntheticTriggerBook()
+        
+        # Single expiry mechanism for both entries and stops
+        self.timeouts = SyntheticTimeoutScheduler()
+        
+        # One Schedule.On event per monitored record fires its timeout even if
+        # no data arrives; slices then no longer poll the heap
+        self.scheduled_timeouts = False
+        self._timeout_events = {}  # (record type, symbol) -> ScheduledEvent
+    
+    def on_order_event(self, order_event):
+        """Update rejection statistics, latency spans, the journal and pending trigger orders from an order event."""
+        self.statistics.on_order_event(order_event)
+        if order_event.OrderId in self.pending_orders:
+            self._reconcile_order(order_event)
+        event = self._JOURNAL_STATUS.get(order_event.Status)
+        if event is not None:
+            self.journal.record(event, order_event.Symbol, order_event.FillPrice,
+                                order_event.FillQuantity, order_event.OrderId)
+        if order_event.Status == OrderStatus.Filled:
+            self.latency.on_fill(order_event.OrderId, order_event.UtcTime)
+        if order_event.FillQuantity != 0 and order_event.OrderId in self.fill_quality.expected:
+            tick_size = self.algorithm.Securities[order_event.Symbol].SymbolProperties.MinimumPriceVariation
+            self.fill_quality.on_fill(order_event, float(tick_size))
+        if order_event.Status in (OrderStatus.Canceled, OrderStatus.Invalid):
+            self.fill_quality.discard(order_event.OrderId)
+            self.latency.discard(order_event.OrderId)
+    
+    def classify_rejection(self, order_message: str) -> RejectionReason:
+        """Reason code for an order rejection message."""
+        return self.rejection_classifier.classify(order_message)
     
     def is_schwab_rejection(self, order_message: str) -> bool:
         """Check if order rejection is due to Schwab's stop price restrictions."""
-        rejection_keywords = [
-            "stop price must be",
-            "stop order rejected", 
-            "invalid stop price",
-            "stop price outside spread"
-        ]
-        return any(keyword in order_message.lower() for keyword in rejection_keywords)
+        return self.rejection_classifier.classify(order_message) != RejectionReason.NONE
     
     def handle_entry_rejection(self, symbol: str, order_id: str, target_price: float, 
-                             quantity: int, rejection_message: str):
+                             quantity: int, rejection_message: str, rejected_at: Optional[datetime] = None):
         """Handle rejected entry orders by adding to synthetic monitoring."""
         if symbol in self.synthetic_entries:
             return  # Already monitoring
         
         # Add high-resolution data for monitoring
-        if not any(sub.Resolution == Resolution.Second for sub in self.algorithm.Securities[symbol].Subscriptions):
-            self.algorithm.AddEquity(symbol, Resolution.Second)
+        self.subscribe_monitoring_data(symbol, MonitoringSubscriptions.ENTRY)
         
-        self.synthetic_entries[symbol] = SyntheticEntry(
-            symbol=symbol,
-            target_price=target_price,
-            quantity=quantity,
-            timeout=self.algorithm.Time.AddMinutes(self.synthetic_timeout_minutes),
-            side=1 if quantity > 0 else -1,  # OrderSide.Buy = 1, OrderSide.Sell = -1
-            original_order_id=order_id
-        )
+        self.add_synthetic_entry(symbol, target_price, quantity, order_id, rejected_at)
         
-        self.algorithm.Log(f"SYNTHETIC ENTRY MONITOR: {symbol} - Target={target_price:.2f}, Qty={quantity}")
+        self.log.info("SYNTHETIC ENTRY MONITOR: %s - Target=%.2f, Qty=%s", symbol, target_price, quantity)
     
     def handle_stop_rejection(self, symbol: str, order_id: str, target_price: float, 
-                            quantity: int, rejection_message: str):
+                            quantity: int, rejection_message: str, rejected_at: Optional[datetime] = None):
         """Handle rejected stop orders by adding to synthetic monitoring."""
         if symbol in self.synthetic_stops:
             return  # Already monitoring
         
         # Add high-resolution data for monitoring
-        if not any(sub.Resolution == Resolution.Second for sub in self.algorithm.Securities[symbol].Subscriptions):
-            self.algorithm.AddEquity(symbol, Resolution.Second)
+        self.subscribe_monitoring_data(symbol, MonitoringSubscriptions.STOP)
+        
+        self.add_synthetic_stop(symbol, target_price, quantity, order_id, rejected_at)
+        
+        self.log.info("SYNTHETIC STOP MONITOR: %s - Target=%.2f, Qty=%s", symbol, target_price, quantity)
+    
+    @property
+    def monitoring_resolution(self):
+        """Data resolution used for symbols under synthetic monitoring."""
+        return Resolution.Tick if self.tick_mode else Resolution.Second
+    
+    def subscribe_monitoring_data(self, symbol, user: str):
+        """Add the monitoring resolution feed for a symbol on behalf of a monitoring user."""
+        self.subscriptions.acquire(symbol, user, self.monitoring_resolution)
+    
+    def prewarm(self, symbol) -> bool:
+        """Pre-subscribe a likely synthetic candidate to monitoring data if the budget allows."""
+        if symbol in self.prewarmed:
+            return True
+        if len(self.prewarmed) >= self.prewarm_budget:
+            return False
+        
+        self.prewarmed.add(symbol)
+        self.subscribe_monitoring_data(symbol, MonitoringSubscriptions.PREWARM)
+        return True
+    
+    def release_prewarm(self, symbol):
+        """Give back a pre-subscribed symbol's budget slot."""
+        if symbol in self.prewarmed:
+            self.prewarmed.discard(symbol)
+            self.subscriptions.release(symbol, MonitoringSubscriptions.PREWARM)
+    
+    def should_use_synthetic_stops(self, symbol, stop_price: float, quantity: int,
+                                   spread_model: Optional[SpreadModel] = None) -> bool:
+        """
+        Predict whether Schwab would reject a stop order at stop_price.
+        
+        A stop is only submitted if the synthetic monitor would place it right
+        away: a buy stop needs the ask at or below stop_price + price_tolerance,
+        a sell stop the bid at or above stop_price - price_tolerance. With a
+        spread model, a live spread narrower than the model predicts for this
+        minute is widened around the mid, since Schwab's quote is often wider
+        than QuantConnect's. Without a usable quote the order is submitted.
+        """
+        if not self.proactive_spread_gate:
+            return False
+        
+        security = self.algorithm.Securities[symbol]
+        bid_price = security.BidPrice
+        ask_price = security.AskPrice
+        if not security.HasData or bid_price <= 0 or ask_price <= 0:
+            return False
+        
+        # Skip submission where stops have measurably been rejected most of the time
+        # (looked up under the live spread, which is what submissions are counted under);
+        # every skip_explore_every-th skip in a bucket goes through the quote check anyway,
+        # so the bucket keeps being measured and can recover
+        if self.skip_rejection_rate is not None:
+            spread_bps = self._spread_bps(bid_price, ask_price)
+            rate, samples = self.statistics.rejection_rate(symbol, self.algorithm.Time, spread_bps)
+            if samples >= self.skip_min_samples and rate >= self.skip_rejection_rate:
+                key = self.statistics.key(symbol, self.algorithm.Time, spread_bps)
+                skips = self._skips[key] = self._skips.get(key, 0) + 1
+                if not self.skip_explore_every or skips % self.skip_explore_every:
+                    return True
+        
+        predicted_spread = spread_model.predict(self.algorithm.Time) if spread_model else None
+        if predicted_spread is not None and predicted_spread > ask_price - bid_price:
+            mid_price = (bid_price + ask_price) / 2
+            bid_price = mid_price - predicted_spread / 2
+            ask_price = mid_price + predicted_spread / 2
+        
+        if quantity > 0:
+            return ask_price > stop_price + self.price_tolerance
+        return bid_price < stop_price - self.price_tolerance
+    
+    @staticmethod
+    def _spread_bps(bid_price, ask_price):
+        if bid_price <= 0 or ask_price <= 0:
+            return 0.0
+        return (ask_price - bid_price) / ((ask_price + bid_price) / 2) * 10000
+    
+    def submit_stop_order(self, symbol, quantity: int, stop_price: float, tag: str = "",
+                          role: OrderRole = OrderRole.STOP, on_submitted=None):
+        """
+        Submit a stop market order through the throttle.
+        
+        Returns the ticket, or None if the order was queued; on_submitted(ticket)
+        runs once it is actually submitted. A newer order for the same symbol
+        and role replaces a queued one.
+        """
+        send = partial(self._send_stop_order, symbol, quantity, stop_price, tag, role)
+        return self.throttle.submit(self._THROTTLE_PRIORITY[role], (symbol, role), send,
+                                    partial(self._submitted, on_submitted))
+    
+    def submit_market_order(self, symbol, quantity: int, tag: str = "", role: OrderRole = OrderRole.EXIT,
+                            on_submitted=None):
+        """Submit a market order through the throttle, like submit_stop_order."""
+        send = partial(self._send_market_order, symbol, quantity, tag, role)
+        return self.throttle.submit(self._THROTTLE_PRIORITY[role], (symbol, role), send,
+                                    partial(self._submitted, on_submitted))
+    
+    def update_order(self, ticket, update_fields, on_response):
+        """Update an order through the throttle at exit priority; on_response(response) runs once it is sent."""
+        return self.throttle.submit(OrderThrottle.EXIT, ("update", ticket.OrderId),
+                                    partial(ticket.Update, update_fields), on_response)
+    
+    def _send_stop_order(self, symbol, quantity, stop_price, tag, role):
+        """Submit and route a stop market order, counting it in the rejection statistics and fill quality."""
+        self.orders.submitting = True
+        try:
+            ticket = self.algorithm.StopMarketOrder(symbol, quantity, stop_price, tag=tag)
+        finally:
+            self.orders.submitting = False
+        self.orders.register(ticket, symbol, role, quantity)
+        self.journal.record(JournalEvent.ORDER_SUBMITTED, symbol, stop_price, quantity, ticket.OrderId)
+        self.fill_quality.expect(ticket.OrderId, tag, stop_price)
+        security = self.algorithm.Securities[symbol]
+        self.statistics.record_submission(symbol, ticket.OrderId,
+                                          self._spread_bps(security.BidPrice, security.AskPrice))
+        return ticket
+    
+    def _send_market_order(self, symbol, quantity, tag, role):
+        """Submit and route a market order (without blocking on the fill for async trigger orders)."""
+        asynchronous = self.asynchronous_orders and role in TRIGGER_MARKET_ROLES
+        self.orders.submitting = True
+        try:
+            ticket = self.algorithm.MarketOrder(symbol, quantity, asynchronous=asynchronous, tag=tag)
+        finally:
+            self.orders.submitting = False
+        self.orders.register(ticket, symbol, role, quantity)
+        return ticket
+    
+    def _submitted(self, on_submitted, ticket):
+        """Run the submitter's callback, then deliver the events that arrived during the submit call."""
+        if on_submitted is not None:
+            on_submitted(ticket)
+        while self.orders.deferred:
+            self.algorithm.OnOrderEvent(self.orders.deferred.pop(0))
+    
+    def place_entry_with_spread_check(self, symbol, quantity: int, stop_price: float, tag: str = "Entry",
+                                      spread_model: Optional[SpreadModel] = None, on_submitted=None):
+        """Submit a stop market entry, or monitor it synthetically if Schwab would reject it.
+        
+        Returns the order ticket, or None when the entry went to synthetic monitoring
+        or is queued by the throttle (on_submitted(ticket) runs once it is submitted).
+        """
+        if not self.should_use_synthetic_stops(symbol, stop_price, quantity, spread_model):
+            return self.submit_stop_order(symbol, quantity, stop_price, tag=tag, role=OrderRole.ENTRY,
+                                          on_submitted=on_submitted)
+        
+        if symbol not in self.synthetic_entries:
+            self.subscribe_monitoring_data(symbol, MonitoringSubscriptions.ENTRY)
+            self.add_synthetic_entry(symbol, stop_price, quantity)
+        self.log.info("PROACTIVE SYNTHETIC ENTRY: %s - Target=%.2f, Qty=%s", symbol, stop_price, quantity)
+        return None
+    
+    def place_stop_with_spread_check(self, symbol, quantity: int, stop_price: float, tag: str = "Stop Loss",
+                                     spread_model: Optional[SpreadModel] = None, on_submitted=None):
+        """Submit a protective stop market order, or monitor it synthetically if Schwab would reject it.
+        
+        Returns the order ticket, or None when the stop went to synthetic monitoring
+        (added to an existing synthetic stop for the symbol if there is one) or is
+        queued by the throttle (on_submitted(ticket) runs once it is submitted).
+        """
+        if not self.should_use_synthetic_stops(symbol, stop_price, quantity, spread_model):
+            return self.submit_stop_order(symbol, quantity, stop_price, tag=tag, on_submitted=on_submitted)
         
-        self.synthetic_stops[symbol] = SyntheticStop(
+        # A queued native stop is superseded by synthetic monitoring
+        self.throttle.discard((symbol, OrderRole.STOP))
+        if symbol in self.synthetic_stops:
+            existing_stop = self.synthetic_stops[symbol]
+            self.synthetic_stops.update_quantity(symbol, existing_stop.quantity + quantity)
+            self.journal.record(JournalEvent.SYNTHETIC_RESIZED, symbol, existing_stop.target_price,
+                                existing_stop.quantity)
+        else:
+            self.subscribe_monitoring_data(symbol, MonitoringSubscriptions.STOP)
+            self.add_synthetic_stop(symbol, stop_price, quantity)
+        self.log.info("PROACTIVE SYNTHETIC STOP: %s - Target=%.2f, Qty=%s", symbol, stop_price, quantity)
+        return None
+    
+    def add_synthetic_entry(self, symbol, target_price: float, quantity: int, order_id: Optional[str] = None,
+                            rejected_at: Optional[datetime] = None):
+        """Add an entry to synthetic monitoring and return its record."""
+        entry = SyntheticEntry(
+            symbol=symbol,
+            target_price=target_price,
+            quantity=quantity,
+            timeout=self.algorithm.Time + timedelta(minutes=self.synthetic_timeout_minutes),
+            side=1 if quantity > 0 else -1,  # OrderSide.Buy = 1, OrderSide.Sell = -1
+            original_order_id=order_id,
+            rejected_at=rejected_at,
+            monitored_at=self.algorithm.UtcTime
+        )
+        self._monitor_entry(entry)
+        return entry
+    
+    def add_synthetic_stop(self, symbol, target_price: float, quantity: int, order_id: Optional[str] = None,
+                           rejected_at: Optional[datetime] = None):
+        """Add a stop to synthetic monitoring and return its record."""
+        stop = SyntheticStop(
             symbol=symbol,
             target_price=target_price,
             quantity=quantity,
-            timeout=self.algorithm.Time.AddMinutes(self.synthetic_timeout_minutes),
+            timeout=self.algorithm.Time + timedelta(minutes=self.synthetic_timeout_minutes),
             side=-1 if quantity < 0 else 1,  # OrderSide.Sell = -1, OrderSide.Buy = 1
-            original_order_id=order_id
+            original_order_id=order_id,
+            rejected_at=rejected_at,
+            monitored_at=self.algorithm.UtcTime
         )
+        self._monitor_stop(stop)
+        return stop
+    
+    def _monitor_entry(self, entry):
+        self.journal.record(JournalEvent.MONITOR_ENTRY, entry.symbol, entry.target_price,
+                            entry.quantity, entry.original_order_id)
+        self.synthetic_entries[entry.symbol] = entry
+        self._unevaluated.add((SyntheticEntry, entry.symbol))
+        self.entry_book.add(entry)
+        self._schedule_timeout(entry)
+        self.release_prewarm(entry.symbol)  # The monitor holds its own feed now
+    
+    def _monitor_stop(self, stop):
+        self.journal.record(JournalEvent.MONITOR_STOP, stop.symbol, stop.target_price,
+                            stop.quantity, stop.original_order_id)
+        self.synthetic_stops[stop.symbol] = stop
+        self._unevaluated.add((SyntheticStop, stop.symbol))
+        self.stop_book.add(stop)
+        self._schedule_timeout(stop)
+        self.release_prewarm(stop.symbol)
+    
+    def _schedule_timeout(self, record):
+        self.timeouts.schedule(record)
+        if not self.scheduled_timeouts:
+            return
         
-        self.algorithm.Log(f"SYNTHETIC STOP MONITOR: {symbol} - Target={target_price:.2f}, Qty={quantity}")
+        key = (type(record), record.symbol)
+        self._cancel_timeout_event(key)
+        # Round up to a whole second so the event never fires before the timeout
+        fire_at = record.timeout.replace(microsecond=0)
+        if record.timeout.microsecond:
+            fire_at += timedelta(seconds=1)
+        self._timeout_events[key] = self.algorithm.Schedule.On(
+            self.algorithm.DateRules.Today,
+            self.algorithm.TimeRules.At(fire_at.hour, fire_at.minute, fire_at.second),
+            self.process_timeouts
+        )
     
-    def process_synthetic_entries(self, data_slice):
-        """Process synthetic entry monitoring on high-frequency data."""
-        for symbol, entry in list(self.synthetic_entries.items()):
-            if not self.algorithm.Securities.ContainsKey(symbol):
-                continue
-            
-            security = self.algorithm.Securities[symbol]
-            current_price = security.Price
-            bid_price = security.BidPrice
-            ask_price = security.AskPrice
+    def _cancel_timeout_event(self, key):
+        event = self._timeout_events.pop(key, None)
+        if event is not None:
+            self.algorithm.Schedule.Remove(event)
+    
+    def _notify_order(self, record, event: JournalEvent, ticket):
+        record.triggered_at = self.algorithm.UtcTime
+        record.order_id = ticket.OrderId
+        if self.orders.is_open(ticket):
+            self.pending_orders[ticket.OrderId] = record
+        self.journal.record(event, record.symbol, record.target_price, record.quantity, ticket.OrderId)
+        self.latency.track(ticket.OrderId, record)
+        self.fill_quality.expect(ticket.OrderId, ticket.Tag, record.target_price)
+        if self.on_synthetic_order is not None:
+            self.on_synthetic_order(record, ticket)
+    
+    def _reconcile_order(self, order_event):
+        """
+        Settle the synthetic record behind a triggered order once the order closes.
+        
+        A cross or timeout market order (with asynchronous_orders only known to
+        have failed from its event) is retried up to max_order_retries times
+        when the rejection is a classified Schwab or transient one: a timeout
+        exit is resubmitted at market, a cross puts the same record back under
+        monitoring with its original timeout. Other rejections (buying power,
+        ...) are final. Rejected stop placements are re-monitored by the
+        strategy's rejection handling like any other stop.
+        """
+        if order_event.Status in OrderRegistry.OPEN_STATUSES:
+            return
+        
+        record = self.pending_orders.pop(order_event.OrderId)
+        route = self.orders.routes.get(order_event.OrderId)
+        if (order_event.Status != OrderStatus.Invalid or route is None or
+                route.role not in TRIGGER_MARKET_ROLES):
+            return
+        
+        symbol = record.symbol
+        message = order_event.Message
+        retryable = self.is_schwab_rejection(message) or self._TRANSIENT_REJECTION.search(message or "")
+        if not retryable or record.retries >= self.max_order_retries:
+            self.log.warning("SYNTHETIC ORDER FAILED: %s - %s, giving up after %s retries",
+                             symbol, message, record.retries)
+            return
+        record.retries += 1
+        
+        is_entry = isinstance(record, SyntheticEntry)
+        if not is_entry and int(self.algorithm.Portfolio[symbol].Quantity) == 0:
+            return  # Position closed in the meantime
+        
+        if route.role == OrderRole.TIMEOUT:
+            self.log.warning("SYNTHETIC ORDER FAILED: %s - %s, retrying at market", symbol, message)
+            self.submit_market_order(symbol, record.quantity, tag="Synthetic Stop (Timeout)",
+                                     role=OrderRole.TIMEOUT,
+                                     on_submitted=partial(self._notify_order, record, JournalEvent.SYNTHETIC_TIMEOUT))
+            return
+        
+        store = self.synthetic_entries if is_entry else self.synthetic_stops
+        if symbol in store or record.timeout <= self.algorithm.Time:
+            return  # Monitored again already, or past its original timeout
+        
+        self.log.warning("SYNTHETIC ORDER FAILED: %s - %s, resuming monitoring", symbol, message)
+        record.monitored_at = self.algorithm.UtcTime
+        record.evaluated_at = None
+        if is_entry:
+            self.subscribe_monitoring_data(symbol, MonitoringSubscriptions.ENTRY)
+            self._monitor_entry(record)
+        else:
+            self.subscribe_monitoring_data(symbol, MonitoringSubscriptions.STOP)
+            self._monitor_stop(record)
+    
+    def _is_active(self, record):
+        store = self.synthetic_entries if isinstance(record, SyntheticEntry) else self.synthetic_stops
+        return store.get(record.symbol) is record
+    
+    def _release_entry(self, symbol):
+        entry = self.synthetic_entries.pop(symbol, None)
+        if entry is not None:
+            self.journal.record(JournalEvent.RELEASE_ENTRY, symbol, entry.target_price, entry.quantity)
+            self.entry_book.remove(entry)
+            self._cancel_timeout_event((SyntheticEntry, symbol))
+            self.subscriptions.release(symbol, MonitoringSubscriptions.ENTRY)
+    
+    def _release_stop(self, symbol):
+        stop = self.synthetic_stops.pop(symbol, None)
+        if stop is not None:
+            self.journal.record(JournalEvent.RELEASE_STOP, symbol, stop.target_price, stop.quantity)
+            self.stop_book.remove(stop)
+            self._cancel_timeout_event((SyntheticStop, symbol))
+            self.subscriptions.release(symbol, MonitoringSubscriptions.STOP)
+            self.subscriptions.release(symbol, MonitoringSubscriptions.BACKUP)
+    
+    def _touched_symbols(self, data_slice, book):
+        """Monitored symbols that received data in this slice."""
+        if not len(book):
+            return []
+        if self.quote_driven or self.tick_mode:
+            return self._quoted_symbols(data_slice, book)
+        return [symbol for symbol in data_slice.Keys if symbol in book]
+    
+    def _quoted_symbols(self, data_slice, book):
+        """Monitored symbols with a new (not fill-forward) quote in this slice."""
+        symbols = []
+        
+        quote_bars = data_slice.QuoteBars
+        for symbol in quote_bars.Keys:
+            if symbol in book and not quote_bars[symbol].IsFillForward:
+                symbols.append(symbol)
+        
+        ticks = data_slice.Ticks
+        for symbol in ticks.Keys:
+            if symbol in book and symbol not in symbols:
+                if any(tick.TickType == TickType.Quote for tick in ticks[symbol]):
+                    symbols.append(symbol)
+        
+        return symbols
+    
+    def _quote(self, symbol, data_slice):
+        """
+        Current (bid, ask, price) for a symbol.
+        
+        In tick mode all ticks for the symbol in this slice are coalesced into
+        the latest bid, ask and trade price, so a burst of ticks costs one
+        trigger evaluation. Sides without a tick fall back to the security cache.
+        """
+        security = self.algorithm.Securities[symbol]
+        if not self.tick_mode or not data_slice.Ticks.ContainsKey(symbol):
+            self.journal.record_quote(symbol, security.BidPrice, security.AskPrice, security.Price)
+            return security.BidPrice, security.AskPrice, security.Price
+        
+        bid_price = ask_price = current_price = 0
+        for tick in data_slice.Ticks[symbol]:
+            if tick.TickType == TickType.Quote:
+                if tick.BidPrice > 0:
+                    bid_price = tick.BidPrice
+                if tick.AskPrice > 0:
+                    ask_price = tick.AskPrice
+            elif tick.Price > 0:
+                current_price = tick.Price
+        
+        quote = (bid_price or security.BidPrice,
+                 ask_price or security.AskPrice,
+                 current_price or security.Price)
+        self.journal.record_quote(symbol, *quote)
+        return quote
+    
+    def process_timeouts(self):
+        """Expire monitored entries and stops whose timeout has passed."""
+        for record in self.timeouts.pop_expired(self.algorithm.Time, self._is_active):
+            symbol = record.symbol
             
-            # Check for timeout or dead stock
-            if (self.algorithm.Time >= entry.timeout or 
-                bid_price == 0 or ask_price == 0):
-                self.algorithm.Log(f"SYNTHETIC TIMEOUT: {symbol} - Removing from monitoring")
-                self.synthetic_entries.pop(symbol, None)
+            if isinstance(record, SyntheticEntry):
+                self.log.info("SYNTHETIC TIMEOUT: %s - Removing from monitoring", symbol)
+                self._release_entry(symbol)
                 continue
             
-            # For long entries
-            if entry.quantity > 0:
-                if ask_price > 0 and ask_price <= entry.target_price + self.price_tolerance:
-                    # Can place stop order now
-                    self.algorithm.Log(f"SYNTHETIC STOP PLACED: {symbol} - Ask={ask_price:.2f}")
-                    self.algorithm.StopMarketOrder(symbol, entry.quantity, entry.target_price, tag="Synthetic Entry")
-                    self.synthetic_entries.pop(symbol, None)
-                elif current_price > entry.target_price:
-                    # Price crossed - execute market order
-                    self.algorithm.Log(f"SYNTHETIC CROSS: {symbol} - Price={current_price:.2f}>Target={entry.target_price:.2f}")
-                    self.algorithm.MarketOrder(symbol, entry.quantity, tag="Synthetic Entry (Cross)")
-                    self.synthetic_entries.pop(symbol, None)
-            
-            # For short entries
+            # Check if position still exists
+            if int(self.algorithm.Portfolio[symbol].Quantity) == 0:
+                self.log.info("SYNTHETIC STOP REMOVED: %s - Position flat", symbol)
             else:
-                if bid_price > 0 and bid_price >= entry.target_price - self.price_tolerance:
-                    # Can place stop order now
-                    self.algorithm.Log(f"SYNTHETIC STOP PLACED: {symbol} - Bid={bid_price:.2f}")
-                    self.algorithm.StopMarketOrder(symbol, entry.quantity, entry.target_price, tag="Synthetic Entry")
-                    self.synthetic_entries.pop(symbol, None)
-                elif current_price < entry.target_price:
-                    # Price crossed - execute market order
-                    self.algorithm.Log(f"SYNTHETIC CROSS: {symbol} - Price={current_price:.2f}<Target={entry.target_price:.2f}")
-                    self.algorithm.MarketOrder(symbol, entry.quantity, tag="Synthetic Entry (Cross)")
-                    self.synthetic_entries.pop(symbol, None)
+                self.log.info("SYNTHETIC STOP TIMEOUT: %s - Forcing market order", symbol)
+                self.submit_market_order(symbol, record.quantity, tag="Synthetic Stop (Timeout)",
+                                         role=OrderRole.TIMEOUT,
+                                         on_submitted=partial(self._notify_order, record, JournalEvent.SYNTHETIC_TIMEOUT))
+            self._release_stop(symbol)
     
-    def process_synthetic_stops(self, data_slice):
-        """Process synthetic stop monitoring on high-frequency data."""
-        for symbol, stop in list(self.synthetic_stops.items()):
-            if not self.algorithm.Securities.ContainsKey(symbol):
+    def _evaluate(self, store, book, symbols, data_slice, drop_dead=False):
+        """
+        Evaluate triggers for the updated symbols of one monitor.
+        
+        Returns (hits, dead): hits are (record, action, bid, ask, price) tuples,
+        dead are records without a two-sided quote (only when drop_dead is set).
+        Once batch_threshold symbols are updated in one slice they are evaluated
+        in a single vectorized pass over the store columns; smaller sets go
+        through the per-symbol trigger book.
+        """
+        hits, dead = [], []
+        
+        # Stamp the first evaluation of newly monitored records
+        if self._unevaluated:
+            for symbol in symbols:
+                record = store[symbol]
+                if record.evaluated_at is None:
+                    record.evaluated_at = self.algorithm.UtcTime
+                    self._unevaluated.discard((type(record), symbol))
+        
+        if len(symbols) >= self.batch_threshold:
+            quotes = np.array([self._quote(symbol, data_slice) for symbol in symbols], dtype=np.float64)
+            rows = store.rows_for(symbols)
+            place, cross, no_quote = evaluate_synthetic_triggers(
+                quotes[:, 0], quotes[:, 1], quotes[:, 2],
+                store.target_price[rows], store.quantity[rows],
+                self.price_tolerance, drop_dead=drop_dead
+            )
+            for index in np.flatnonzero(place | cross | no_quote):
+                record = store.records[rows[index]]
+                if no_quote[index]:
+                    dead.append(record)
+                else:
+                    action = SyntheticTriggerBook.PLACE if place[index] else SyntheticTriggerBook.CROSS
+                    hits.append((record, action, *quotes[index]))
+            return hits, dead
+        
+        for symbol in symbols:
+            bid_price, ask_price, current_price = self._quote(symbol, data_slice)
+            if drop_dead and (bid_price == 0 or ask_price == 0):
+                dead.append(store[symbol])
                 continue
-            
+            for record, action in book.triggered(symbol, bid_price, ask_price, current_price, self.price_tolerance):
+                hits.append((record, action, bid_price, ask_price, current_price))
+        return hits, dead
+    
+    def process_synthetic_entries(self, data_slice):
+        """Process synthetic entry monitoring for the symbols updated in this slice."""
+        if not self.scheduled_timeouts:
+            self.process_timeouts()
+        
+        symbols = self._touched_symbols(data_slice, self.entry_book)
+        if not symbols:
+            return
+        
+        hits, dead = self._evaluate(self.synthetic_entries, self.entry_book, symbols, data_slice, drop_dead=True)
+        
+        # Dead stock - no two-sided quote
+        for entry in dead:
+            self.log.info("SYNTHETIC TIMEOUT: %s - Removing from monitoring", entry.symbol)
+            self._release_entry(entry.symbol)
+        
+        for entry, action, bid_price, ask_price, current_price in hits:
+            symbol = entry.symbol
+            if action == SyntheticTriggerBook.PLACE:
+                # Can place stop order now
+                if entry.side > 0:
+                    self.log.info("SYNTHETIC STOP PLACED: %s - Ask=%.2f", symbol, ask_price)
+                else:
+                    self.log.info("SYNTHETIC STOP PLACED: %s - Bid=%.2f", symbol, bid_price)
+                self._release_entry(symbol)
+                self.submit_stop_order(symbol, entry.quantity, entry.target_price, tag="Synthetic Entry",
+                                       role=OrderRole.SYNTHETIC_ENTRY,
+                                       on_submitted=partial(self._notify_order, entry, JournalEvent.SYNTHETIC_PLACED))
+            else:
+                # Price crossed - execute market order
+                relation = ">" if entry.side > 0 else "<"
+                self.log.info("SYNTHETIC CROSS: %s - Price=%.2f%sTarget=%.2f", symbol, current_price, relation, entry.target_price)
+                self._release_entry(symbol)
+                self.submit_market_order(symbol, entry.quantity, tag="Synthetic Entry (Cross)",
+                                         role=OrderRole.CROSS_ENTRY,
+                                         on_submitted=partial(self._notify_order, entry, JournalEvent.SYNTHETIC_CROSSED))
+    
+    def process_synthetic_stops(self, data_slice):
+        """Process synthetic stop monitoring for the symbols updated in this slice."""
+        if not self.scheduled_timeouts:
+            self.process_timeouts()
+        
+        symbols = []
+        for symbol in self._touched_symbols(data_slice, self.stop_book):
             # Check if position still exists
-            current_position = int(self.algorithm.Portfolio[symbol].Quantity)
-            if current_position == 0:
-                self.algorithm.Log(f"SYNTHETIC STOP REMOVED: {symbol} - Position flat")
-                self.synthetic_stops.pop(symbol, None)
-                continue
-            
-            security = self.algorithm.Securities[symbol]
-            current_price = security.Price
-            bid_price = security.BidPrice
-            ask_price = security.AskPrice
-            
-            # Check for timeout
-            if self.algorithm.Time >= stop.timeout:
-                self.algorithm.Log(f"SYNTHETIC STOP TIMEOUT: {symbol} - Forcing market order")
-                self.algorithm.MarketOrder(symbol, stop.quantity, tag="Synthetic Stop (Timeout)")
-                self.synthetic_stops.pop(symbol, None)
-                continue
-            
-            # For long positions (need to sell)
-            if stop.quantity < 0:  # Selling to exit long
-                if bid_price > 0 and bid_price >= stop.target_price - self.price_tolerance:
-                    # Can place stop order now
-                    self.algorithm.Log(f"SYNTHETIC STOP PLACED: {symbol} - Bid={bid_price:.2f}")
-                    self.algorithm.StopMarketOrder(symbol, stop.quantity, stop.target_price, tag="Synthetic Stop")
-                    self.synthetic_stops.pop(symbol, None)
-                elif current_price < stop.target_price:
-                    # Price crossed - execute market order
-                    self.algorithm.Log(f"SYNTHETIC STOP CROSS: {symbol} - Price={current_price:.2f}<Target={stop.target_price:.2f}")
-                    self.algorithm.MarketOrder(symbol, stop.quantity, tag="Synthetic Stop (Cross)")
-                    self.synthetic_stops.pop(symbol, None)
-            
-            # For short positions (need to buy)
+            if int(self.algorithm.Portfolio[symbol].Quantity) == 0:
+                self.log.info("SYNTHETIC STOP REMOVED: %s - Position flat", symbol)
+                self._release_stop(symbol)
             else:
-                if ask_price > 0 and ask_price <= stop.target_price + self.price_tolerance:
-                    # Can place stop order now
-                    self.algorithm.Log(f"SYNTHETIC STOP PLACED: {symbol} - Ask={ask_price:.2f}")
-                    self.algorithm.StopMarketOrder(symbol, stop.quantity, stop.target_price, tag="Synthetic Stop")
-                    self.synthetic_stops.pop(symbol, None)
-                elif current_price > stop.target_price:
-                    # Price crossed - execute market order
-                    self.algorithm.Log(f"SYNTHETIC STOP CROSS: {symbol} - Price={current_price:.2f}>Target={stop.target_price:.2f}")
-                    self.algorithm.MarketOrder(symbol, stop.quantity, tag="Synthetic Stop (Cross)")
-                    self.synthetic_stops.pop(symbol, None)
+                symbols.append(symbol)
+        if not symbols:
+            return
+        
+        hits, _ = self._evaluate(self.synthetic_stops, self.stop_book, symbols, data_slice)
+        
+        for stop, action, bid_price, ask_price, current_price in hits:
+            symbol = stop.symbol
+            if action == SyntheticTriggerBook.PLACE:
+                # Can place stop order now
+                if stop.side < 0:
+                    self.log.info("SYNTHETIC STOP PLACED: %s - Bid=%.2f", symbol, bid_price)
+                else:
+                    self.log.info("SYNTHETIC STOP PLACED: %s - Ask=%.2f", symbol, ask_price)
+                self._release_stop(symbol)
+                self.submit_stop_order(symbol, stop.quantity, stop.target_price, tag="Synthetic Stop",
+                                       role=OrderRole.SYNTHETIC_STOP,
+                                       on_submitted=partial(self._notify_order, stop, JournalEvent.SYNTHETIC_PLACED))
+            else:
+                # Price crossed - execute market order
+                relation = "<" if stop.side < 0 else ">"
+                self.log.info("SYNTHETIC STOP CROSS: %s - Price=%.2f%sTarget=%.2f", symbol, current_price, relation, stop.target_price)
+                self._release_stop(symbol)
+                self.submit_market_order(symbol, stop.quantity, tag="Synthetic Stop (Cross)",
+                                         role=OrderRole.CROSS_STOP,
+                                         on_submitted=partial(self._notify_order, stop, JournalEvent.SYNTHETIC_CROSSED))
     
     def clear_all_monitoring(self):
         """Clear all synthetic monitoring."""
+        for entry in self.synthetic_entries.values():
+            self.journal.record(JournalEvent.RELEASE_ENTRY, entry.symbol, entry.target_price, entry.quantity)
+        for stop in self.synthetic_stops.values():
+            self.journal.record(JournalEvent.RELEASE_STOP, stop.symbol, stop.target_price, stop.quantity)
         self.synthetic_entries.clear()
         self.synthetic_stops.clear()
+        self.entry_book.clear()
+        self.stop_book.clear()
+        self.timeouts.clear()
+        self._unevaluated.clear()
+        for key in list(self._timeout_events):
+            self._cancel_timeout_event(key)
+        self.prewarmed.clear()
+        self.subscriptions.release_all()
+        self.throttle.clear()
+        self.pending_orders.clear()
 
 # =============================================================================
 # END SYNTHETIC STOPS IMPLEMENTATION
@@ -240,11 +1908,37 @@ class OpeningRangeBreakoutAlgorithm(QCAlgorithm):
         self.stop_loss_atr_distance = 0.15
         self.stop_loss_risk_size = 0.02  # 2% portfolio risk per position
         
-        # Initialize synthetic stops handler
+        # Set up brokerage (Schwab for synthetic features, others for standard)
+        self.brokerage_name = BrokerageName.CharlesSchwab
+        self.SetBrokerageModel(self.brokerage_name, AccountType.Margin)
+        
+        # Initialize synthetic stops handler (only re-check symbols with new quotes,
+        # timeouts fire from scheduled events even if a symbol goes quiet)
         self.synthetic_stops = SchwabSyntheticStops(self)
+        self.synthetic_stops.quote_driven = True
+        self.synthetic_stops.scheduled_timeouts = True
+        self.synthetic_stops.on_synthetic_order = self.OnSyntheticOrder
+        self.synthetic_stops.statistics.load()
         
-        # Set up brokerage (Schwab for synthetic features, others for standard)
-        self.SetBrokerageModel(BrokerageName.CharlesSchwab, AccountType.Margin)
+        # Journal every evaluated quote too (3 records each) so live days can be rerun with replay.py
+        self.synthetic_stops.journal.record_quotes = self.LiveMode
+        
+        # SymbolData with partial entry fills awaiting one coalesced stop create/resize
+        self.pending_protection = set()
+        
+        # Pre-subscribing entries to second data stays off (prewarm_budget 0): every symbol here
+        # is a universe member, whose feed is only released when the universe drops it
+        self.synthetic_stops.prewarm_budget = 0
+        
+        # Skip the reject round trip for stops Schwab would refuse at the current quote
+        self.synthetic_stops.proactive_spread_gate = self.brokerage_name == BrokerageName.CharlesSchwab
+        
+        # Stay under Schwab's order rate limit; a burst of triggers queues exits ahead of entries
+        if self.brokerage_name == BrokerageName.CharlesSchwab:
+            self.synthetic_stops.throttle.orders_per_minute = 120
+        
+        # Don't block the trigger loop on each cross/timeout market fill
+        self.synthetic_stops.asynchronous_orders = self.LiveMode
         
         # Add SPY for market timing
         self.spy = self.AddEquity("SPY").Symbol
@@ -325,13 +2019,34 @@ class OpeningRangeBreakoutAlgorithm(QCAlgorithm):
     
     def OnData(self, data):
         """Process market data and synthetic stops."""
-        if not data or self.IsWarmingUp:
+        if not data:
             return
         
-        # Process synthetic stops on high-frequency data
+        # Learn spreads from minute quotes (also during warm-up)
+        if data.Time.second == 0:
+            for symbol, quote_bar in data.QuoteBars.items():
+                symbol_data = self.symbol_data.get(symbol)
+                if symbol_data is not None and not quote_bar.IsFillForward:
+                    symbol_data.UpdateSpread(quote_bar)
+        
+        if self.IsWarmingUp:
+            return
+        
+        # One protective stop per symbol sized to the entry fills accumulated since the last slice
+        if self.pending_protection:
+            for symbol_data in list(self.pending_protection):
+                symbol_data.protect_position()
+        
+        # Send throttled orders whose tokens have refilled, exits first
+        if self.synthetic_stops.throttle:
+            self.synthetic_stops.throttle.drain()
+        
+        # Process synthetic stops on every slice - only symbols updated in it are evaluated
+        self.synthetic_stops.process_synthetic_entries(data)
+        self.synthetic_stops.process_synthetic_stops(data)
+        
+        # Strategy logic runs on the minute bars
         if data.Time.second != 0:
-            self.synthetic_stops.process_synthetic_entries(data)
-            self.synthetic_stops.process_synthetic_stops(data)
             return
         
         # Skip if entry already placed today
@@ -388,90 +2103,129 @@ class OpeningRangeBreakoutAlgorithm(QCAlgorithm):
     
     def OnOrderEvent(self, order_event):
         """Handle order events including Schwab rejections."""
+        # Events for an order still being submitted come back once it is registered
+        if self.synthetic_stops.orders.defer(order_event):
+            return
+        
+        self.synthetic_stops.on_order_event(order_event)
+        
+        # One lookup tells which symbol and order role the event belongs to
+        route = self.synthetic_stops.orders.on_order_event(order_event)
+        symbol_data = self.symbol_data.get(route.symbol) if route is not None else None
+        
         # Handle rejected orders
         if order_event.Status == OrderStatus.Invalid:
-            self.Log(f"ORDER REJECTED: {order_event.Symbol} - {order_event.Message}")
-            
             # Check if this is a Schwab stop order rejection
-            if self.synthetic_stops.is_schwab_rejection(order_event.Message):
-                self.HandleSchwabRejection(order_event)
+            reason = self.synthetic_stops.classify_rejection(order_event.Message)
+            self.synthetic_stops.log.warning(
+                "ORDER REJECTED: %s - %s - %s", order_event.Symbol, reason.value, order_event.Message
+            )
+            
+            # Rejected cross and timeout orders are retried (or given up) by _reconcile_order
+            if (reason != RejectionReason.NONE and symbol_data is not None and
+                    route.role not in TRIGGER_MARKET_ROLES):
+                self.HandleSchwabRejection(order_event, route, symbol_data)
+            elif route is not None and route.role in ENTRY_ROLES:
+                # Entry is dead, so its monitoring warm-up is no longer needed
+                self.synthetic_stops.release_prewarm(route.symbol)
             return
         
-        # Handle filled orders
-        if order_event.Status in [OrderStatus.Filled, OrderStatus.PartiallyFilled]:
-            if order_event.Symbol in self.symbol_data:
-                self.symbol_data[order_event.Symbol].OnOrderEvent(order_event)
+        # Entry resolved without synthetic monitoring: canceled, or filled with its stop accepted
+        if route is not None and (
+                (route.role in ENTRY_ROLES and order_event.Status == OrderStatus.Canceled) or
+                (route.role == OrderRole.STOP and order_event.Status in (OrderStatus.Submitted, OrderStatus.Filled))):
+            self.synthetic_stops.release_prewarm(route.symbol)
         
-        # Handle backup stops
-        if order_event.Symbol in self.symbol_data:
-            symbol_data = self.symbol_data[order_event.Symbol]
-            for backup in symbol_data.backup_stops[:]:  # Copy list to avoid modification during iteration
-                if backup.OrderId == order_event.OrderId:
-                    if order_event.Status == OrderStatus.Invalid:
-                        self.Log(f"BACKUP STOP REJECTED: {order_event.Symbol} - Adding to synthetic")
-                        # Add the rejected quantity to synthetic monitoring
-                        symbol_data.add_synthetic_protection(int(backup.Quantity))
-                        symbol_data.backup_stops.remove(backup)
-                        break
-                    
-                    self.Log(f"BACKUP STOP FILLED: {order_event.Symbol}")
-                    
-                    # Get current position after backup fill
-                    current_position = int(self.Portfolio[order_event.Symbol].Quantity)
-                    
-                    # If ANY position remains after backup fill, exit immediately at market
-                    if current_position != 0:
-                        self.Log(f"BACKUP PARTIAL: {order_event.Symbol} - Remaining={current_position}, Market exit")
-                        self.MarketOrder(order_event.Symbol, -current_position, tag="Complete exit after backup")
-                        
-                        # Cancel main stop if exists
-                        if (symbol_data.stop_loss_ticket and 
-                            symbol_data.stop_loss_ticket.Status == OrderStatus.Submitted):
-                            symbol_data.stop_loss_ticket.Cancel()
-                        
-                        # Clear all tracking
-                        symbol_data.last_stop_quantity = 0
-                        symbol_data.stop_loss_ticket = None
-                    
-                    symbol_data.backup_stops.remove(backup)
-                    break
-    
-    def HandleSchwabRejection(self, order_event):
-        """Handle Schwab-specific order rejections with synthetic stops."""
-        symbol = order_event.Symbol
+        # A fill may have flattened a symbol whose monitoring feed is waiting to be removed
+        if order_event.Status == OrderStatus.Filled and self.synthetic_stops.subscriptions.pending_removal:
+            self.synthetic_stops.subscriptions.flush_pending()
         
-        if symbol not in self.symbol_data:
+        if symbol_data is None or order_event.Status not in (OrderStatus.Filled, OrderStatus.PartiallyFilled):
             return
         
-        symbol_data = self.symbol_data[symbol]
+        # Entry fills (native or synthetic) place the stop loss
+        if route.role in ENTRY_ROLES:
+            symbol_data.OnOrderEvent(order_event)
         
-        # Determine if this was an entry or stop order
-        if (symbol_data.EntryTicket and 
-            symbol_data.EntryTicket.OrderId == order_event.OrderId):
+        # Handle backup stops
+        elif route.role == OrderRole.BACKUP_STOP and order_event.Status == OrderStatus.Filled:
+            self.synthetic_stops.log.info("BACKUP STOP FILLED: %s", route.symbol)
+            symbol_data.backup_stops.pop(order_event.OrderId, None)
+            
+            # Get current position after backup fill
+            current_position = int(self.Portfolio[route.symbol].Quantity)
+            
+            # If ANY position remains after backup fill, exit immediately at market
+            if current_position != 0:
+                self.synthetic_stops.log.warning(
+                    "BACKUP PARTIAL: %s - Remaining=%s, Market exit", route.symbol, current_position
+                )
+                self.synthetic_stops.submit_market_order(route.symbol, -current_position,
+                                                         tag="Complete exit after backup")
+                
+                # Cancel main stop if exists
+                if self.synthetic_stops.orders.is_open(symbol_data.stop_loss_ticket):
+                    symbol_data.stop_loss_ticket.Cancel()
+                
+                # Clear all tracking
+                symbol_data.last_stop_quantity = 0
+                symbol_data.stop_loss_ticket = None
+    
+    def HandleSchwabRejection(self, order_event, route, symbol_data):
+        """Handle Schwab-specific order rejections with synthetic stops."""
+        symbol = route.symbol
+        
+        if route.role in ENTRY_ROLES:
             # Entry order rejected
             self.synthetic_stops.handle_entry_rejection(
                 symbol=symbol,
                 order_id=order_event.OrderId,
-                target_price=float(symbol_data.EntryPrice),
-                quantity=symbol_data.Quantity,
-                rejection_message=order_event.Message
+                target_price=float(symbol_data.entry_price),
+                quantity=route.quantity,
+                rejection_message=order_event.Message,
+                rejected_at=order_event.UtcTime
             )
         
-        elif (symbol_data.StopLossTicket and 
-              symbol_data.StopLossTicket.OrderId == order_event.OrderId):
+        elif route.role in (OrderRole.STOP, OrderRole.SYNTHETIC_STOP):
             # Stop order rejected
             self.synthetic_stops.handle_stop_rejection(
                 symbol=symbol,
                 order_id=order_event.OrderId,
-                target_price=float(symbol_data.StopLossPrice),
-                quantity=-symbol_data.Quantity,  # Negative for exits
-                rejection_message=order_event.Message
+                target_price=float(symbol_data.stop_loss_price),
+                quantity=route.quantity,  # Negative for exits
+                rejection_message=order_event.Message,
+                rejected_at=order_event.UtcTime
             )
+        
+        elif route.role == OrderRole.BACKUP_STOP:
+            self.synthetic_stops.log.warning("BACKUP STOP REJECTED: %s - Adding to synthetic", symbol)
+            # Add the rejected quantity to synthetic monitoring
+            symbol_data.backup_stops.pop(order_event.OrderId, None)
+            symbol_data.add_synthetic_protection(route.quantity)
+    
+    def OnSyntheticOrder(self, record, ticket):
+        """Adopt orders placed by synthetic monitoring into the symbol's order tracking."""
+        symbol_data = self.symbol_data.get(record.symbol)
+        if symbol_data is None:
+            return
+        
+        if isinstance(record, SyntheticEntry):
+            # Fills of the synthetic entry place the stop loss like the original entry
+            symbol_data.entry_ticket = ticket
+        elif (ticket.OrderType == OrderType.StopMarket and
+              (symbol_data.stop_loss_ticket is None or
+               self.synthetic_stops.orders.status(symbol_data.stop_loss_ticket) == OrderStatus.Invalid)):
+            # Synthetic stop placed at the broker becomes the main stop
+            symbol_data.stop_loss_ticket = ticket
+            symbol_data.last_stop_quantity = record.quantity
     
     def ResetDaily(self):
         """Reset daily variables."""
         self.entry_placed = False
         self.synthetic_stops.clear_all_monitoring()
+        for symbol_data in self.symbol_data.values():
+            symbol_data.forget_closed_stops()
+        self.synthetic_stops.orders.prune()
         self.Log(f"Daily reset completed at {self.Time} - Entry allowed for today")
     
     def LiquidateAll(self):
@@ -485,8 +2239,22 @@ class OpeningRangeBreakoutAlgorithm(QCAlgorithm):
             
             self.Liquidate()
         
-        # Clear synthetic monitoring
+        # Clear synthetic monitoring and persist today's rejection counters
         self.synthetic_stops.clear_all_monitoring()
+        self.synthetic_stops.statistics.save()
+        self.synthetic_stops.journal.flush()
+        
+        # Rejection-to-execution latency percentiles for the day
+        for stage, (count, p50, p95, p99) in self.synthetic_stops.latency.summary().items():
+            self.Log(f"Synthetic Latency: {stage} N={count} p50={p50:.0f}ms p95={p95:.0f}ms p99={p99:.0f}ms")
+        self.synthetic_stops.latency.reset()
+        
+        # Slippage vs. target per native/synthetic order path (running totals)
+        for tag, (fills, shares, ticks, bps, worst) in self.synthetic_stops.fill_quality.summary().items():
+            self.Log(f"Fill Quality: {tag} Fills={fills} Shares={shares} Slippage={ticks:.2f} ticks / {bps:.1f} bps, Worst={worst:.1f} bps")
+        
+        # Report anything the rate limiter dropped today
+        self.synthetic_stops.log.flush_summary()
         
         # Log daily summary
         total_pnl = self.Portfolio.TotalProfit
@@ -501,6 +2269,9 @@ class SymbolData:
         self.algorithm = algorithm
         self.security = security
         self.symbol = security.Symbol
+        self.log = algorithm.synthetic_stops.log
+        self.journal = algorithm.synthetic_stops.journal
+        self.orders = algorithm.synthetic_stops.orders  # Order states fed by OnOrderEvent
         
         # Indicators
         self.atr = algorithm.ATR(self.symbol, atr_period)
@@ -510,6 +2281,9 @@ class SymbolData:
         self.opening_bar = None
         self.relative_volume = None
         
+        # Spread history for the proactive synthetic gate
+        self.spread_model = SpreadModel()
+        
         # Order tracking
         self.entry_price = 0
         self.stop_loss_price = 0
@@ -519,7 +2293,7 @@ class SymbolData:
         
         # Backup stops tracking
         self.last_stop_quantity = 0
-        self.backup_stops = []
+        self.backup_stops = {}  # OrderId -> ticket
         
         # Consolidator for opening range
         self.consolidator = algorithm.Consolidate(
@@ -558,6 +2332,11 @@ class SymbolData:
         # Store opening bar
         self.opening_bar = bar
     
+    def UpdateSpread(self, quote_bar):
+        """Feed a quote bar's closing bid/ask into the spread model."""
+        if quote_bar.Bid is not None and quote_bar.Ask is not None:
+            self.spread_model.update(quote_bar.EndTime, quote_bar.Bid.Close, quote_bar.Ask.Close)
+    
     def Scan(self):
         """Scan for ORB entry opportunities."""
         if not self.opening_bar or not self.IsReady:
@@ -567,11 +2346,10 @@ class SymbolData:
         bar_type = "GREEN" if self.opening_bar.Close > self.opening_bar.Open else "RED"
         range_size = self.opening_bar.High - self.opening_bar.Low
         
-        self.algorithm.Log(
-            f"ORB: {self.symbol} - {bar_type} - "
-            f"O={self.opening_bar.Open:.2f} H={self.opening_bar.High:.2f} "
-            f"L={self.opening_bar.Low:.2f} C={self.opening_bar.Close:.2f} "
-            f"Range={range_size:.3f} RV={self.relative_volume:.2f}"
+        self.log.debug(
+            "ORB: %s - %s - O=%.2f H=%.2f L=%.2f C=%.2f Range=%.3f RV=%.2f",
+            self.symbol, bar_type, self.opening_bar.Open, self.opening_bar.High,
+            self.opening_bar.Low, self.opening_bar.Close, range_size, self.relative_volume
         )
         
         # Place trades based on bar type
@@ -610,43 +2388,57 @@ class SymbolData:
         self.stop_loss_price = stop_price
         self.quantity = quantity
         
-        # Place entry stop order
-        self.entry_ticket = self.algorithm.StopMarketOrder(
-            self.symbol, quantity, entry_price, tag="Entry"
+        # Warm up monitoring data in case Schwab rejects the entry
+        if self.algorithm.brokerage_name == BrokerageName.CharlesSchwab:
+            self.algorithm.synthetic_stops.prewarm(self.symbol)
+        
+        # Place entry stop order (or monitor it synthetically if Schwab would reject it)
+        self.entry_ticket = self.algorithm.synthetic_stops.place_entry_with_spread_check(
+            self.symbol, quantity, entry_price, tag="Entry", spread_model=self.spread_model,
+            on_submitted=self.adopt_entry
         )
         
-        self.algorithm.Log(
-            f"ENTRY ORDER: {self.symbol} - Qty={quantity} - "
-            f"Entry={entry_price:.2f} - Stop={stop_price:.2f}"
+        self.log.info(
+            "ENTRY ORDER: %s - Qty=%s - Entry=%.2f - Stop=%.2f",
+            self.symbol, quantity, entry_price, stop_price
         )
     
     def OnOrderEvent(self, order_event):
-        """Handle order events for this symbol."""
-        if not self.entry_ticket or order_event.OrderId != self.entry_ticket.OrderId:
-            return
-        
+        """Handle fills of this symbol's entry order."""
         if order_event.Status in [OrderStatus.Filled, OrderStatus.PartiallyFilled]:
-            # Entry filled - place stop loss
             fill_price = order_event.FillPrice
             actual_quantity = int(order_event.FillQuantity)
             
-            # Update quantity to actual fill
-            self.quantity = actual_quantity
-            
-            # Place stop loss order with backup protection
-            self.stop_loss_ticket = self.algorithm.StopMarketOrder(
-                self.symbol, -actual_quantity, self.stop_loss_price, tag="Stop Loss"
+            self.log.info(
+                "ENTRY FILLED: %s - Qty=%s - Fill=%.2f - Stop=%.2f",
+                self.symbol, actual_quantity, fill_price, self.stop_loss_price
             )
             
-            # Ensure position is fully protected (backup stops)
-            self.ensure_position_protected(order_event)
-            
-            self.algorithm.Log(
-                f"ENTRY FILLED: {self.symbol} - Qty={actual_quantity} - "
-                f"Fill={fill_price:.2f} - Stop={self.stop_loss_price:.2f}"
+            # Partial fills accumulate until the next slice; the final fill protects right away
+            if order_event.Status == OrderStatus.Filled:
+                self.protect_position()
+            else:
+                self.algorithm.pending_protection.add(self)
+    
+    def protect_position(self):
+        """Create or resize the one protective stop to the net position after the accumulated entry fills."""
+        self.algorithm.pending_protection.discard(self)
+        
+        current_position = int(self.algorithm.Portfolio[self.symbol].Quantity)
+        if (current_position != 0 and not self.orders.is_open(self.stop_loss_ticket) and
+                self.symbol not in self.algorithm.synthetic_stops.synthetic_stops):
+            # First fill - place stop loss (or monitor it synthetically if Schwab would reject it)
+            self.algorithm.synthetic_stops.place_stop_with_spread_check(
+                self.symbol, -current_position, self.stop_loss_price, tag="Stop Loss",
+                spread_model=self.spread_model, on_submitted=partial(self.adopt_stop, -current_position)
             )
+            self.quantity = current_position
+            return
+        
+        # Later fills - resize the existing stop, with backup protection if that fails
+        self.ensure_position_protected()
     
-    def ensure_position_protected(self, order_event):
+    def ensure_position_protected(self):
         """Ensure the full position is protected with backup stops if needed."""
         # Get actual current position from portfolio
         current_position = int(self.algorithm.Portfolio[self.symbol].Quantity)
@@ -659,22 +2451,31 @@ class SymbolData:
         # Desired stop quantity (opposite of position)
         desired_stop_qty = -current_position
         
-        # CASE 1: No stop exists yet - create it
-        if (self.stop_loss_ticket is None or 
-            self.stop_loss_ticket.Status == OrderStatus.Canceled or
-            self.stop_loss_ticket.Status == OrderStatus.Invalid):
+        # CASE 0: Stop is monitored synthetically (proactively or after a rejection) - keep it sized to the position
+        synthetic_stops = self.algorithm.synthetic_stops.synthetic_stops
+        if self.symbol in synthetic_stops and not self.orders.is_open(self.stop_loss_ticket):
+            if synthetic_stops[self.symbol].quantity != desired_stop_qty:
+                synthetic_stops.update_quantity(self.symbol, desired_stop_qty)
+                self.journal.record(JournalEvent.SYNTHETIC_RESIZED, self.symbol,
+                                    self.stop_loss_price, desired_stop_qty)
+            self.quantity = current_position
+            return
+        
+        # CASE 1: No working stop - none yet, or it closed (filled, canceled, rejected, or pruned
+        # with the other closed orders at the daily reset) - create it
+        if not self.orders.is_open(self.stop_loss_ticket):
             
-            self.algorithm.Log(f"STOP CREATE: {self.symbol} - Position={current_position}, StopQty={desired_stop_qty}")
-            self.stop_loss_ticket = self.algorithm.StopMarketOrder(
-                self.symbol, desired_stop_qty, self.stop_loss_price, tag="ATR Stop"
+            self.log.info("STOP CREATE: %s - Position=%s, StopQty=%s", self.symbol, current_position, desired_stop_qty)
+            self.algorithm.synthetic_stops.submit_stop_order(
+                self.symbol, desired_stop_qty, self.stop_loss_price, tag="ATR Stop", role=OrderRole.STOP,
+                on_submitted=partial(self.adopt_stop, desired_stop_qty)
             )
-            self.last_stop_quantity = desired_stop_qty
             self.quantity = current_position
             return
         
         # CASE 2: Stop exists but wrong size - UPDATE IT!
         if self.last_stop_quantity != desired_stop_qty:
-            self.algorithm.Log(f"STOP UPDATE NEEDED: {self.symbol} - Current={self.last_stop_quantity}, Desired={desired_stop_qty}")
+            self.log.debug("STOP UPDATE NEEDED: %s - Current=%s, Desired=%s", self.symbol, self.last_stop_quantity, desired_stop_qty)
             
             # Try atomic update
             update_fields = UpdateOrderFields()
@@ -682,26 +2483,53 @@ class SymbolData:
             update_fields.StopPrice = self.stop_loss_price
             update_fields.Tag = f"ATR Stop (Updated for {current_position} shares)"
             
-            response = self.stop_loss_ticket.Update(update_fields)
-            
-            if response.IsSuccess:
-                self.algorithm.Log(f"STOP UPDATE SUCCESS: {self.symbol} - NewQty={desired_stop_qty}")
-                self.last_stop_quantity = desired_stop_qty
-                self.quantity = current_position
-            else:
-                # UPDATE FAILED - Place backup stop for uncovered shares
-                uncovered_qty = desired_stop_qty - self.last_stop_quantity
-                self.algorithm.Log(f"STOP UPDATE FAILED: {self.symbol} - Placing backup for {uncovered_qty} shares")
-                
-                backup_stop = self.algorithm.StopMarketOrder(
-                    self.symbol, uncovered_qty, self.stop_loss_price, tag="Backup Stop"
-                )
-                self.backup_stops.append(backup_stop)
-                
-                # Add synthetic protection for uncovered shares
-                self.add_synthetic_protection(uncovered_qty)
+            # Goes out through the throttle; a newer resize replaces one still queued
+            self.algorithm.synthetic_stops.update_order(
+                self.stop_loss_ticket, update_fields,
+                partial(self.on_stop_update, self.stop_loss_ticket, desired_stop_qty, current_position)
+            )
         else:
-            self.algorithm.Log(f"STOP CORRECT: {self.symbol} - Already protecting {current_position} shares")
+            self.log.debug("STOP CORRECT: %s - Already protecting %s shares", self.symbol, current_position)
+    
+    def on_stop_update(self, ticket, desired_stop_qty, current_position, response):
+        """Apply the broker's response to a stop resize."""
+        if ticket is not self.stop_loss_ticket:
+            return  # Stop was replaced or canceled while the update waited
+        
+        if response.IsSuccess:
+            self.orders.update_quantity(ticket, desired_stop_qty)
+            self.log.info("STOP UPDATE SUCCESS: %s - NewQty=%s", self.symbol, desired_stop_qty)
+            self.journal.record(JournalEvent.ORDER_UPDATED, self.symbol, self.stop_loss_price,
+                                desired_stop_qty, ticket.OrderId)
+            self.last_stop_quantity = desired_stop_qty
+            self.quantity = current_position
+        else:
+            # UPDATE FAILED - Place backup stop for uncovered shares
+            uncovered_qty = desired_stop_qty - self.last_stop_quantity
+            self.log.warning("STOP UPDATE FAILED: %s - Placing backup for %s shares", self.symbol, uncovered_qty)
+            self.journal.record(JournalEvent.ORDER_UPDATE_FAILED, self.symbol, self.stop_loss_price,
+                                desired_stop_qty, ticket.OrderId)
+            
+            self.algorithm.synthetic_stops.submit_stop_order(
+                self.symbol, uncovered_qty, self.stop_loss_price, tag="Backup Stop", role=OrderRole.BACKUP_STOP,
+                on_submitted=self.adopt_backup
+            )
+            
+            # Add synthetic protection for uncovered shares
+            self.add_synthetic_protection(uncovered_qty)
+    
+    def adopt_entry(self, ticket):
+        """Track the entry order once the throttle has submitted it."""
+        self.entry_ticket = ticket
+    
+    def adopt_stop(self, quantity, ticket):
+        """Track the main stop once the throttle has submitted it."""
+        self.stop_loss_ticket = ticket
+        self.last_stop_quantity = quantity
+    
+    def adopt_backup(self, ticket):
+        """Track a backup stop once the throttle has submitted it."""
+        self.backup_stops[ticket.OrderId] = ticket
     
     def add_synthetic_protection(self, uncovered_qty):
         """Add synthetic protection for uncovered shares."""
@@ -718,7 +2546,7 @@ class SymbolData:
         # Check if we need any protection
         actually_needed = abs(current_position) - abs(already_protected)
         if actually_needed <= 0:
-            self.algorithm.Log(f"SYNTHETIC SKIP: {self.symbol} - Already fully protected")
+            self.log.debug("SYNTHETIC SKIP: %s - Already fully protected", self.symbol)
             return
         
         # Only add what's actually needed
@@ -726,43 +2554,61 @@ class SymbolData:
         
         # Add uncovered shares to synthetic stop monitoring
         if self.symbol not in self.algorithm.synthetic_stops.synthetic_stops:
-            self.algorithm.synthetic_stops.synthetic_stops[self.symbol] = SyntheticStop(
+            # Add high-resolution data for monitoring
+            self.algorithm.synthetic_stops.subscribe_monitoring_data(self.symbol, MonitoringSubscriptions.BACKUP)
+            
+            self.algorithm.synthetic_stops.add_synthetic_stop(
                 symbol=self.symbol,
                 target_price=self.stop_loss_price,
                 quantity=to_add,
-                timeout=self.algorithm.Time.AddMinutes(10),
-                side=-1 if current_position > 0 else 1,  # OrderSide.Sell = -1, OrderSide.Buy = 1
-                original_order_id=None
+                order_id=None
             )
             
-            # Add high-resolution data for monitoring
-            if not any(sub.Resolution == Resolution.Second for sub in self.algorithm.Securities[self.symbol].Subscriptions):
-                self.algorithm.AddEquity(self.symbol, Resolution.Second)
-            
-            self.algorithm.Log(f"SYNTHETIC PROTECTION ADDED: {self.symbol} - Qty={to_add}")
+            self.log.info("SYNTHETIC PROTECTION ADDED: %s - Qty=%s", self.symbol, to_add)
         else:
             # Accumulate with existing synthetic stop
-            existing_stop = self.algorithm.synthetic_stops.synthetic_stops[self.symbol]
-            existing_stop.quantity += to_add
-            self.algorithm.Log(f"SYNTHETIC PROTECTION ACCUMULATED: {self.symbol} - Added={to_add}, Total={existing_stop.quantity}")
+            synthetic_stops = self.algorithm.synthetic_stops.synthetic_stops
+            existing_stop = synthetic_stops[self.symbol]
+            synthetic_stops.update_quantity(self.symbol, existing_stop.quantity + to_add)
+            self.journal.record(JournalEvent.SYNTHETIC_RESIZED, self.symbol, existing_stop.target_price,
+                                existing_stop.quantity)
+            self.log.info("SYNTHETIC PROTECTION ACCUMULATED: %s - Added=%s, Total=%s", self.symbol, to_add, existing_stop.quantity)
     
     def cancel_all_stops(self):
         """Cancel all stops and clean up tracking."""
+        # Drop stops and resizes still waiting in the throttle
+        throttle = self.algorithm.synthetic_stops.throttle
+        throttle.discard((self.symbol, OrderRole.STOP))
+        throttle.discard((self.symbol, OrderRole.BACKUP_STOP))
+        if self.stop_loss_ticket is not None:
+            throttle.discard(("update", self.stop_loss_ticket.OrderId))
+        
         # Cancel main stop
-        if (self.stop_loss_ticket and 
-            (self.stop_loss_ticket.Status == OrderStatus.Submitted or 
-             self.stop_loss_ticket.Status == OrderStatus.PartiallyFilled)):
+        if self.orders.is_open(self.stop_loss_ticket):
             self.stop_loss_ticket.Cancel()
+        self.stop_loss_ticket = None
         
         # Cancel any backup stops
-        for backup in self.backup_stops:
-            if backup.Status == OrderStatus.Submitted:
+        for backup in self.backup_stops.values():
+            if self.orders.is_open(backup):
                 backup.Cancel()
         self.backup_stops.clear()
         self.last_stop_quantity = 0
+        self.journal.record(JournalEvent.STOPS_CANCELED, self.symbol, self.stop_loss_price)
+    
+    def forget_closed_stops(self):
+        """Drop the tickets of stops that are no longer working, so the next entry places a fresh stop."""
+        if not self.orders.is_open(self.stop_loss_ticket):
+            self.stop_loss_ticket = None
+            self.last_stop_quantity = 0
+        self.backup_stops = {order_id: backup for order_id, backup in self.backup_stops.items()
+                             if self.orders.is_open(backup)}
 
     def Dispose(self):
         """Clean up resources."""
+        self.algorithm.synthetic_stops.release_prewarm(self.symbol)
+        self.algorithm.pending_protection.discard(self)
+        
         if self.consolidator:
             self.algorithm.SubscriptionManager.RemoveConsolidator(
                 self.symbol, self.consolidator
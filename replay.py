@@ -0,0 +1,185 @@
+"""
+Offline replay of a synthetic-stop journal.
+
+Drives SchwabSyntheticStops through a day recorded by SyntheticJournal
+on the lean_standin harness, and prints the orders the monitors issue.
+Recorded monitor starts, resizes, fills and evaluated quotes are the inputs;
+the synthetic orders in the journal are compared against the replayed ones,
+so a change to the trigger logic shows up as a mismatch. Quotes are only in
+the journal with journal.record_quotes on (the strategy turns it on live).
+
+The journal is either a local file (SyntheticJournal.path) or a directory
+holding one day's ObjectStore chunks (the 00000, 00001, ... and symbols
+files under <journal key>/<YYYY-MM-DD>, as downloaded from the ObjectStore):
+
+    python replay.py synthetic-journal.bin [--batch-threshold N] [--polled-timeouts]
+    python replay.py object-store/schwab-synthetic-stops/journal/2025-01-02
+
+Journal times are UTC, so the replayed algorithm runs on a UTC clock; only
+relative times (timeouts) matter to the monitors.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import lean_standin
+
+lean_standin.install()
+
+from orb_example import (  # noqa: E402
+    JournalEvent, SchwabSyntheticStops, decode_journal, read_journal, read_journal_chunks)
+
+_QUOTE_FIELDS = {JournalEvent.QUOTE_BID: 0, JournalEvent.QUOTE_ASK: 1, JournalEvent.QUOTE_LAST: 2}
+_SYNTHETIC_ORDERS = (JournalEvent.SYNTHETIC_PLACED, JournalEvent.SYNTHETIC_CROSSED, JournalEvent.SYNTHETIC_TIMEOUT)
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _timestamp(microseconds):
+    return _EPOCH + timedelta(microseconds=int(microseconds))
+
+
+def _ceil_second(moment):
+    return moment.replace(microsecond=0) + timedelta(seconds=1 if moment.microsecond else 0)
+
+
+def load_journal(path):
+    """(records, symbols) from a journal file or a directory of one day's ObjectStore chunks."""
+    return read_journal_chunks(path) if os.path.isdir(path) else read_journal(path)
+
+
+def synthetic_orders(records, symbols):
+    """(time, event, symbol, price, quantity) of the orders placed by the monitors in a journal."""
+    return [
+        (_timestamp(record["time"]), JournalEvent(record["event"]), symbols[record["symbol"]],
+         round(float(record["price"]), 6), int(record["quantity"]))
+        for record in records if record["event"] in _SYNTHETIC_ORDERS
+    ]
+
+
+def replay(records, symbols, configure=None, verbose=False):
+    """
+    Replay journal records through a fresh SchwabSyntheticStops.
+
+    Quotes evaluated at one timestamp are replayed as one slice; monitor
+    starts, resizes and fills are applied between slices in journal order.
+    configure(handler) may change handler settings before the replay starts.
+    Returns (algorithm, handler); algorithm.orders holds the issued order tickets.
+    """
+    start = _timestamp(records[0]["time"]) if len(records) else _EPOCH
+    algorithm = lean_standin.StandInAlgorithm(start, log=verbose)
+    algorithm.fill_market_orders = False  # Positions follow the journaled fills only
+    handler = SchwabSyntheticStops(algorithm)
+    handler.quote_driven = True
+    handler.scheduled_timeouts = True
+    handler.journal.flush_records = sys.maxsize  # Keep the replayed journal in memory
+    if configure is not None:
+        configure(handler)
+
+    quotes = {}  # symbol -> [bid, ask, last] evaluated at the pending slice time
+
+    def advance(until):
+        if handler.scheduled_timeouts:
+            algorithm.advance(until)
+            return
+        # Polled timeouts expire on the first (second-resolution) slice at or after the timeout
+        while handler.timeouts.next_timeout() is not None:
+            due = _ceil_second(handler.timeouts.next_timeout())
+            if due > until:
+                return
+            algorithm.Time = due
+            handler.process_timeouts()
+
+    def run_slice():
+        for symbol, (bid_price, ask_price, price) in quotes.items():
+            algorithm.set_quote(symbol, bid_price, ask_price, price)
+        data_slice = lean_standin.Slice(algorithm.Time, list(quotes))
+        quotes.clear()
+        handler.process_synthetic_entries(data_slice)
+        handler.process_synthetic_stops(data_slice)
+
+    for record in records:
+        now = _timestamp(record["time"])
+        event = record["event"]
+        symbol = symbols[record["symbol"]]
+
+        if now != algorithm.Time:
+            if quotes:
+                run_slice()
+            advance(now)
+            algorithm.Time = now
+
+        field = _QUOTE_FIELDS.get(event)
+        if field is not None:
+            quotes.setdefault(symbol, [0.0, 0.0, 0.0])[field] = float(record["price"])
+            continue
+
+        if quotes:
+            run_slice()
+
+        price, quantity = float(record["price"]), int(record["quantity"])
+        order_id = None if record["order_id"] < 0 else int(record["order_id"])
+        if event == JournalEvent.MONITOR_ENTRY:
+            handler.handle_entry_rejection(symbol, order_id, price, quantity, "replay", rejected_at=now)
+        elif event == JournalEvent.MONITOR_STOP:
+            handler.handle_stop_rejection(symbol, order_id, price, quantity, "replay", rejected_at=now)
+        elif event == JournalEvent.SYNTHETIC_RESIZED:
+            if symbol in handler.synthetic_stops:
+                handler.synthetic_stops.update_quantity(symbol, quantity)
+        elif event in (JournalEvent.ORDER_FILLED, JournalEvent.ORDER_PARTIALLY_FILLED):
+            algorithm.Portfolio[symbol].Quantity += quantity
+
+    if quotes:
+        run_slice()
+    return algorithm, handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a synthetic-stop journal without LEAN.")
+    parser.add_argument("journal", help="journal file written with SyntheticJournal.path, "
+                                        "or a directory with one day's ObjectStore chunks")
+    parser.add_argument("--batch-threshold", type=int, help="override SchwabSyntheticStops.batch_threshold")
+    parser.add_argument("--tolerance", type=float, help="override SchwabSyntheticStops.price_tolerance")
+    parser.add_argument("--timeout-minutes", type=float, help="override synthetic_timeout_minutes")
+    parser.add_argument("--polled-timeouts", action="store_true", help="check timeouts on slices, not schedules")
+    parser.add_argument("--verbose", action="store_true", help="print the handler's log lines")
+    args = parser.parse_args(argv)
+
+    def configure(handler):
+        if args.batch_threshold is not None:
+            handler.batch_threshold = args.batch_threshold
+        if args.tolerance is not None:
+            handler.price_tolerance = args.tolerance
+        if args.timeout_minutes is not None:
+            handler.synthetic_timeout_minutes = args.timeout_minutes
+        handler.scheduled_timeouts = not args.polled_timeouts
+
+    records, symbols = load_journal(args.journal)
+    if not any(event in _QUOTE_FIELDS for event in records["event"]):
+        print("No quotes in the journal (journal.record_quotes was off): monitors cannot trigger in the replay")
+    started = time.perf_counter()
+    algorithm, handler = replay(records, symbols, configure, args.verbose)
+    elapsed = time.perf_counter() - started
+
+    for ticket in algorithm.orders:
+        price = "" if ticket.StopPrice is None else f" @ {ticket.StopPrice:.2f}"
+        print(f"{ticket.Time} {ticket.OrderType.name} {ticket.Symbol} {ticket.Quantity}{price} [{ticket.Tag}]")
+
+    recorded = synthetic_orders(records, symbols)
+    replayed = synthetic_orders(decode_journal(bytes(handler.journal.buffer)), handler.journal.symbols())
+    matched = next((index for index, (a, b) in enumerate(zip(recorded, replayed)) if a != b),
+                   min(len(recorded), len(replayed)))
+    print(f"Replayed {len(records)} records in {elapsed * 1000:.1f}ms: "
+          f"{matched}/{len(recorded)} recorded synthetic orders reproduced, {len(replayed)} replayed")
+    if matched < max(len(recorded), len(replayed)):
+        print(f"First difference at #{matched}: recorded "
+              f"{recorded[matched] if matched < len(recorded) else None}, "
+              f"replayed {replayed[matched] if matched < len(replayed) else None}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""Shared fixtures: orb_example running against the lean_standin stand-in."""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lean_standin  # noqa: E402
+
+lean_standin.install()
+
+import orb_example  # noqa: E402
+
+
+class StrategyAlgorithm(lean_standin.StandInAlgorithm):
+    """Stand-in algorithm with the strategy's order event handling."""
+
+    OnOrderEvent = orb_example.OpeningRangeBreakoutAlgorithm.OnOrderEvent
+    OnData = orb_example.OpeningRangeBreakoutAlgorithm.OnData
+    HandleSchwabRejection = orb_example.OpeningRangeBreakoutAlgorithm.HandleSchwabRejection
+    OnSyntheticOrder = orb_example.OpeningRangeBreakoutAlgorithm.OnSyntheticOrder
+    ResetDaily = orb_example.OpeningRangeBreakoutAlgorithm.ResetDaily
+    LiquidateAll = orb_example.OpeningRangeBreakoutAlgorithm.LiquidateAll
+    IsWarmingUp = False
+
+    def __init__(self, start=datetime(2025, 1, 2, 9, 33)):
+        super().__init__(start)
+        self.brokerage_name = lean_standin.BrokerageName.CharlesSchwab
+        self.stop_loss_risk_size = 0.02
+        self.stop_loss_atr_distance = 0.15
+        self.max_positions = 8
+        self.entry_placed = True  # Orders are placed by the tests, not the strategy scan
+        self.pending_protection = set()
+        self.symbol_data = {}
+        self.synthetic_stops = orb_example.SchwabSyntheticStops(self)
+        self.synthetic_stops.on_synthetic_order = self.OnSyntheticOrder
+
+    def add_symbol(self, symbol, bid_price, ask_price, atr=1.0):
+        """Quote a symbol and create its SymbolData with a ready ATR."""
+        self.set_quote(symbol, bid_price, ask_price)
+        symbol_data = self.symbol_data[symbol] = orb_example.SymbolData(self, self.Securities[symbol], 5, 14)
+        symbol_data.atr.set(atr)
+        return symbol_data
+
+
+@pytest.fixture
+def algorithm():
+    return StrategyAlgorithm()
+
+
+@pytest.fixture
+def handler():
+    """SchwabSyntheticStops on a bare stand-in whose events go to the handler and its registry."""
+    algorithm = lean_standin.StandInAlgorithm(datetime(2025, 1, 2, 9, 33))
+    handler = orb_example.SchwabSyntheticStops(algorithm)
+
+    def on_order_event(order_event):
+        if handler.orders.defer(order_event):
+            return
+        handler.on_order_event(order_event)
+        handler.orders.on_order_event(order_event)
+
+    algorithm.OnOrderEvent = on_order_event
+    return handler
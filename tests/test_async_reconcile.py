@@ -0,0 +1,160 @@
+"""Trigger market orders with asynchronous_orders: pending tracking, retries and giving up."""
+
+from datetime import timedelta
+
+import pytest
+
+from lean_standin import OrderStatus, OrderType, Slice
+from orb_example import OrderRole
+
+
+@pytest.fixture
+def async_handler(handler):
+    handler.asynchronous_orders = True
+    handler.quote_driven = True
+    handler.scheduled_timeouts = True
+    return handler
+
+
+def cross_entry(handler):
+    """Monitor a buy entry at 50.00 and cross it; returns the market order."""
+    algorithm = handler.algorithm
+    algorithm.set_quote("E", 49.95, 50.05, 50.0)
+    if "E" not in handler.synthetic_entries:
+        handler.handle_entry_rejection("E", None, 50.0, 100, "Stop price must be above the ask")
+    algorithm.Time += timedelta(seconds=1)
+    algorithm.set_quote("E", 50.08, 50.10, 50.09)
+    handler.process_synthetic_entries(Slice(algorithm.Time, ["E"]))
+    return algorithm.orders[-1]
+
+
+def test_async_cross_stays_pending_until_filled(async_handler):
+    ticket = cross_entry(async_handler)
+    assert ticket.OrderType == OrderType.Market
+    assert ticket.Status == OrderStatus.Submitted  # Not filled inside the submit call
+    record = async_handler.pending_orders[ticket.OrderId]
+    assert record.symbol == "E"
+
+    async_handler.algorithm.fill(ticket)
+    assert ticket.OrderId not in async_handler.pending_orders
+    assert record.filled_at == async_handler.algorithm.Time
+
+
+def test_synchronous_cross_is_never_pending(handler):
+    ticket = cross_entry(handler)
+    assert ticket.Status == OrderStatus.Filled
+    assert not handler.pending_orders
+
+
+def test_final_rejection_gives_up(async_handler):
+    ticket = cross_entry(async_handler)
+    async_handler.algorithm.reject(ticket, "Insufficient buying power")
+
+    assert not async_handler.pending_orders
+    assert "E" not in async_handler.synthetic_entries
+    assert "giving up" in async_handler.algorithm.logs[-1]
+
+
+def test_transient_rejection_is_retried_with_the_original_timeout(async_handler):
+    algorithm = async_handler.algorithm
+    ticket = cross_entry(async_handler)
+    timeout = async_handler.pending_orders[ticket.OrderId].timeout
+
+    for retry in range(1, async_handler.max_order_retries + 1):
+        algorithm.reject(ticket, "Service temporarily unavailable")
+        record = async_handler.synthetic_entries["E"]
+        assert (record.retries, record.timeout) == (retry, timeout)
+        ticket = cross_entry(async_handler)
+
+    algorithm.reject(ticket, "Service temporarily unavailable")
+    assert "E" not in async_handler.synthetic_entries
+    assert len(algorithm.orders) == async_handler.max_order_retries + 1
+    assert "giving up after 2 retries" in algorithm.logs[-1]
+
+
+def test_rejected_cross_past_its_timeout_is_not_monitored_again(async_handler):
+    algorithm = async_handler.algorithm
+    ticket = cross_entry(async_handler)
+    timeout = async_handler.pending_orders[ticket.OrderId].timeout
+
+    algorithm.Time = timeout
+    algorithm.reject(ticket, "Service temporarily unavailable")
+    assert "E" not in async_handler.synthetic_entries
+
+
+def test_failed_timeout_exit_is_retried_at_market(async_handler):
+    algorithm = async_handler.algorithm
+    algorithm.set_quote("S", 49.95, 50.05, 50.0)
+    algorithm.Portfolio["S"].Quantity = 100
+    async_handler.handle_stop_rejection("S", None, 49.0, -100, "Stop price must be below the bid")
+
+    algorithm.advance(algorithm.Time + timedelta(minutes=async_handler.synthetic_timeout_minutes + 1))
+    exit_order, = algorithm.orders
+    assert async_handler.orders.get(exit_order).role == OrderRole.TIMEOUT
+    assert "S" not in async_handler.synthetic_stops
+
+    algorithm.reject(exit_order, "Connection timed out")
+    retry = algorithm.orders[-1]
+    assert retry is not exit_order
+    assert (retry.OrderType, retry.Quantity, async_handler.orders.get(retry).role) == (
+        OrderType.Market, -100, OrderRole.TIMEOUT)
+    assert async_handler.pending_orders[retry.OrderId].retries == 1
+
+    algorithm.fill(retry)
+    assert not async_handler.pending_orders
+    assert algorithm.Portfolio["S"].Quantity == 0
+
+
+def test_failed_exit_of_a_flat_position_is_not_retried(async_handler):
+    algorithm = async_handler.algorithm
+    algorithm.set_quote("S", 49.95, 50.05, 50.0)
+    algorithm.Portfolio["S"].Quantity = 100
+    async_handler.handle_stop_rejection("S", None, 49.0, -100, "Stop price must be below the bid")
+    algorithm.advance(algorithm.Time + timedelta(minutes=async_handler.synthetic_timeout_minutes + 1))
+
+    algorithm.Portfolio["S"].Quantity = 0  # Closed by another order meanwhile
+    algorithm.reject(algorithm.orders[0], "Connection timed out")
+    assert len(algorithm.orders) == 1
+    assert not async_handler.pending_orders
+
+
+def test_remonitored_stop_times_out_with_a_single_exit(async_handler):
+    algorithm = async_handler.algorithm
+    algorithm.set_quote("S", 49.95, 50.05, 50.0)
+    algorithm.Portfolio["S"].Quantity = 100
+    async_handler.handle_stop_rejection("S", None, 49.0, -100, "Stop price must be below the bid")
+    stop = async_handler.synthetic_stops["S"]
+
+    algorithm.Time += timedelta(seconds=1)
+    algorithm.set_quote("S", 48.80, 48.90, 48.85)
+    async_handler.process_synthetic_stops(Slice(algorithm.Time, ["S"]))
+    cross, = algorithm.orders
+    assert async_handler.orders.get(cross).role == OrderRole.CROSS_STOP
+    algorithm.reject(cross, "Service temporarily unavailable")
+    assert async_handler.synthetic_stops["S"] is stop  # Scheduled a second time, same timeout
+
+    algorithm.advance(stop.timeout + timedelta(minutes=1))
+    exits = [ticket for ticket in algorithm.orders if async_handler.orders.get(ticket).role == OrderRole.TIMEOUT]
+    assert [ticket.Quantity for ticket in exits] == [-100]
+    assert "S" not in async_handler.synthetic_stops
+    assert not async_handler.timeouts.pop_expired(algorithm.Time, lambda record: True)
+
+
+def test_classified_rejection_of_a_cross_entry_is_left_to_reconciliation(algorithm):
+    algorithm.synthetic_stops.asynchronous_orders = True
+    algorithm.synthetic_stops.max_order_retries = 0
+    symbol_data = algorithm.add_symbol("E", 99.90, 99.95)
+    symbol_data.PlaceTrade(100.02, 99.87)
+    algorithm.reject(symbol_data.entry_ticket, "Stop price must be above the ask")
+    assert "E" in algorithm.synthetic_stops.synthetic_entries
+
+    algorithm.Time += timedelta(seconds=1)
+    algorithm.set_quote("E", 100.10, 100.12, 100.11)
+    algorithm.synthetic_stops.process_synthetic_entries(Slice(algorithm.Time, ["E"]))
+    cross = algorithm.orders[-1]
+    assert algorithm.synthetic_stops.orders.get(cross).role == OrderRole.CROSS_ENTRY
+    algorithm.reject(cross, "Stop price must be above the ask")
+
+    assert "E" not in algorithm.synthetic_stops.synthetic_entries
+    assert any("giving up after 0 retries" in line for line in algorithm.logs)
+    assert len(algorithm.orders) == 2
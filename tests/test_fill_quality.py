@@ -0,0 +1,65 @@
+"""Slippage attribution of native and synthetic fills by order tag."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from lean_standin import OrderStatus, Slice
+from orb_example import FillQualityTracker
+
+
+def test_slippage_is_signed_against_the_order_side(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("AAPL", 100.0, 100.02)
+    stop = handler.submit_stop_order("AAPL", -100, 99.0, tag="Stop Loss")
+    entry = handler.submit_stop_order("AAPL", 100, 100.02, tag="Entry")
+
+    algorithm.fill(stop, price=98.98)  # Sold 2 ticks below the stop: worse
+    algorithm.fill(entry, price=100.01)  # Bought 1 tick below the stop: better
+
+    summary = handler.fill_quality.summary()
+    fills, shares, ticks, bps, worst = summary["Stop Loss"]
+    assert (fills, shares) == (1, 100)
+    assert ticks == pytest.approx(2.0)
+    assert bps == pytest.approx(0.02 / 99.0 * 10000)
+    assert summary["Entry"][2] == pytest.approx(-1.0)
+    assert not handler.fill_quality.expected
+
+
+def test_partial_fills_are_weighted_by_shares():
+    tracker = FillQualityTracker()
+    tracker.expect(1, "Synthetic Stop (Cross)", 50.0)
+    tracker.on_fill(SimpleNamespace(OrderId=1, Status=OrderStatus.PartiallyFilled, FillPrice=49.99, FillQuantity=-100),
+                    0.01)
+    tracker.on_fill(SimpleNamespace(OrderId=1, Status=OrderStatus.Filled, FillPrice=49.95, FillQuantity=-300), 0.01)
+    fills, shares, ticks, bps, worst = tracker.summary()["Synthetic Stop (Cross)"]
+    assert (fills, shares) == (2, 400)
+    assert ticks == pytest.approx((1 * 100 + 5 * 300) / 400)
+    assert worst == pytest.approx(10.0)
+    assert 1 not in tracker.expected
+
+
+def test_synthetic_paths_are_measured_against_their_target(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("S", 49.95, 50.05)
+    algorithm.Portfolio["S"].Quantity = 100
+    handler.handle_stop_rejection("S", None, 50.0, -100, "Stop price must be below the bid")
+    algorithm.set_quote("S", 49.90, 49.94, 49.92)
+    handler.process_synthetic_stops(Slice(algorithm.Time, ["S"]))  # Crossed: market exit fills at 49.92
+
+    fills, shares, ticks, _, _ = handler.fill_quality.summary()["Synthetic Stop (Cross)"]
+    assert (fills, shares) == (1, 100)
+    assert ticks == pytest.approx(8.0)
+
+
+def test_canceled_and_rejected_orders_are_forgotten(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("AAPL", 100.0, 100.02)
+    canceled = handler.submit_stop_order("AAPL", -100, 99.0, tag="Stop Loss")
+    rejected = handler.submit_stop_order("AAPL", -100, 100.5, tag="Stop Loss")
+
+    algorithm.fill(canceled, quantity=-40)
+    canceled.Cancel()
+    algorithm.reject(rejected, "Stop price must be below the bid")
+    assert not handler.fill_quality.expected
+    assert handler.fill_quality.summary()["Stop Loss"][:2] == (1, 40)
@@ -0,0 +1,87 @@
+"""SyntheticJournal encoding, flushing and resuming after a restart."""
+
+from datetime import date, timedelta
+
+from lean_standin import StandInAlgorithm
+from orb_example import JOURNAL_RECORD, JournalEvent, SyntheticJournal, read_journal
+
+
+def test_records_round_trip_through_a_file(tmp_path):
+    algorithm = StandInAlgorithm()
+    journal = SyntheticJournal(algorithm, path=str(tmp_path / "journal.bin"), flush_records=2)
+    journal.record(JournalEvent.MONITOR_STOP, "AAPL", 99.5, -100, 7)
+    algorithm.Time += timedelta(milliseconds=1500)
+    journal.record(JournalEvent.SYNTHETIC_CROSSED, "MSFT", 410.25, 50)  # Fills the batch
+    journal.record(JournalEvent.RELEASE_STOP, "AAPL", 99.5, -100)
+    assert (tmp_path / "journal.bin").stat().st_size == 2 * JOURNAL_RECORD.size
+
+    journal.flush()
+    records, symbols = read_journal(str(tmp_path / "journal.bin"))
+    assert symbols == ["AAPL", "MSFT"]
+    assert [(symbols[r["symbol"]], JournalEvent(r["event"]), r["price"], r["quantity"], r["order_id"])
+            for r in records] == [
+        ("AAPL", JournalEvent.MONITOR_STOP, 99.5, -100, 7),
+        ("MSFT", JournalEvent.SYNTHETIC_CROSSED, 410.25, 50, -1),
+        ("AAPL", JournalEvent.RELEASE_STOP, 99.5, -100, -1),
+    ]
+    assert records[1]["time"] - records[0]["time"] == 1_500_000
+
+
+def test_quotes_are_only_journaled_when_enabled():
+    journal = SyntheticJournal(StandInAlgorithm())
+    journal.record_quote("AAPL", 100.0, 100.02, 100.01)
+    assert journal.pending == 0
+
+    journal.record_quotes = True
+    journal.record_quote("AAPL", 100.0, 100.02, 100.01)
+    assert journal.pending == 3
+
+
+def test_object_store_chunks_continue_after_a_restart():
+    algorithm = StandInAlgorithm()
+    journal = SyntheticJournal(algorithm)
+    journal.record(JournalEvent.MONITOR_ENTRY, "AAPL", 100.0, 100)
+    journal.flush()
+    journal.record(JournalEvent.MONITOR_STOP, "MSFT", 400.0, -10)
+    journal.flush()
+
+    restarted = SyntheticJournal(algorithm)
+    restarted.record(JournalEvent.RELEASE_ENTRY, "TSLA", 250.0, 5)
+    restarted.record(JournalEvent.RELEASE_STOP, "MSFT", 400.0, -10)
+    restarted.flush()
+
+    prefix = journal.day_key(algorithm.Time.date())
+    assert sorted(key for key in algorithm.ObjectStore if key.startswith(prefix)) == [
+        f"{prefix}/00000", f"{prefix}/00001", f"{prefix}/00002", f"{prefix}/symbols"]
+    records, symbols = restarted.load(algorithm.Time.date())
+    assert symbols == ["AAPL", "MSFT", "TSLA"]
+    assert [symbols[r["symbol"]] for r in records] == ["AAPL", "MSFT", "TSLA", "MSFT"]
+
+    records, symbols = restarted.load(date(2025, 1, 3))  # Nothing journaled that day
+    assert (len(records), symbols) == (0, [])
+
+
+def test_file_journal_keeps_symbol_ids_after_a_restart(tmp_path):
+    algorithm = StandInAlgorithm()
+    path = str(tmp_path / "journal.bin")
+    journal = SyntheticJournal(algorithm, path=path)
+    journal.record(JournalEvent.MONITOR_ENTRY, "AAPL", 100.0, 100)
+    journal.record(JournalEvent.MONITOR_ENTRY, "MSFT", 400.0, 10)
+    journal.flush()
+
+    restarted = SyntheticJournal(algorithm, path=path)
+    restarted.record(JournalEvent.RELEASE_ENTRY, "MSFT", 400.0, 10)
+    restarted.flush()
+
+    records, symbols = read_journal(path)
+    assert symbols == ["AAPL", "MSFT"]
+    assert [symbols[r["symbol"]] for r in records] == ["AAPL", "MSFT", "MSFT"]
+
+
+def test_disabled_journal_records_nothing():
+    algorithm = StandInAlgorithm()
+    journal = SyntheticJournal(algorithm)
+    journal.enabled = False
+    journal.record(JournalEvent.MONITOR_ENTRY, "AAPL", 100.0, 100)
+    journal.flush()
+    assert not algorithm.ObjectStore
@@ -0,0 +1,64 @@
+"""Rejection-to-execution latency spans of synthetic records."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from lean_standin import Slice
+from orb_example import SyntheticLatencyTracker, SyntheticStop
+
+
+def test_spans_follow_a_synthetic_entry_from_rejection_to_fill(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("E", 49.95, 50.05)
+    rejected_at = algorithm.Time
+    algorithm.Time += timedelta(milliseconds=20)
+    handler.handle_entry_rejection("E", 7, 50.0, 100, "Stop price must be above the ask", rejected_at=rejected_at)
+
+    algorithm.Time += timedelta(seconds=1)
+    handler.process_synthetic_entries(Slice(algorithm.Time, ["E"]))  # Evaluated, not triggered
+    algorithm.Time += timedelta(seconds=2)
+    algorithm.set_quote("E", 49.98, 50.0)
+    handler.process_synthetic_entries(Slice(algorithm.Time, ["E"]))  # Placed as a stop order
+    algorithm.Time += timedelta(milliseconds=500)
+    algorithm.fill(algorithm.orders[-1])
+
+    assert handler.latency.durations == {
+        "reject_to_monitor": [20.0],
+        "monitor_to_evaluate": [1000.0],
+        "evaluate_to_trigger": [2000.0],
+        "trigger_to_fill": [500.0],
+        "reject_to_fill": [3520.0],
+    }
+    assert not handler.latency.pending
+
+
+def test_orders_that_never_fill_are_dropped(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("E", 49.95, 50.05)
+    handler.handle_entry_rejection("E", None, 50.0, 100, "Stop price must be above the ask")
+    algorithm.set_quote("E", 49.98, 50.0)
+    handler.process_synthetic_entries(Slice(algorithm.Time, ["E"]))
+
+    algorithm.orders[-1].Cancel()
+    assert not handler.latency.pending
+    assert not any(handler.latency.durations.values())
+
+
+def test_summary_percentiles_and_reset():
+    tracker = SyntheticLatencyTracker()
+    triggered_at = datetime(2025, 1, 2, 9, 33)
+    for order_id, milliseconds in enumerate(range(1, 101)):
+        record = SyntheticStop("S", 50.0, -100, triggered_at, -1, triggered_at=triggered_at)
+        tracker.track(order_id, record)
+        tracker.on_fill(order_id, triggered_at + timedelta(milliseconds=milliseconds))
+
+    # Stages without both timestamps are left out
+    assert list(tracker.summary()) == ["trigger_to_fill"]
+    count, p50, p95, p99 = tracker.summary()["trigger_to_fill"]
+    assert count == 100
+    assert (p50, p95, p99) == (pytest.approx(50.5), pytest.approx(95.05), pytest.approx(99.01))
+
+    tracker.on_fill(999, triggered_at)  # Untracked orders are ignored
+    tracker.reset()
+    assert tracker.summary() == {}
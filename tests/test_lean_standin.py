@@ -0,0 +1,102 @@
+"""The stand-in delivers order events and scheduled events the way a LEAN backtest does."""
+
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from lean_standin import OrderStatus, Slice, StandInAlgorithm, UpdateOrderFields
+
+
+@pytest.fixture
+def algorithm():
+    algorithm = StandInAlgorithm(datetime(2025, 1, 2, 9, 30))
+    algorithm.events = []
+    algorithm.OnOrderEvent = algorithm.events.append
+    algorithm.set_quote("AAPL", 100.0, 100.02)
+    return algorithm
+
+
+def test_synchronous_market_order_fills_before_returning(algorithm):
+    ticket = algorithm.MarketOrder("AAPL", 100, tag="Exit")
+
+    event, = algorithm.events
+    assert (event.OrderId, event.Status, event.FillQuantity) == (ticket.OrderId, OrderStatus.Filled, 100)
+    assert event.FillPrice == pytest.approx(100.01)  # The security price
+    assert ticket.Status == OrderStatus.Filled
+    assert algorithm.Portfolio["AAPL"].Quantity == 100
+
+
+def test_asynchronous_market_order_stays_open(algorithm):
+    ticket = algorithm.MarketOrder("AAPL", 100, asynchronous=True)
+    assert ticket.Status == OrderStatus.Submitted
+    assert not algorithm.events
+
+    algorithm.fill(ticket)
+    assert algorithm.events[-1].FillPrice == 100.02  # Buys fill at the ask without a price
+
+
+def test_inline_fills_can_be_turned_off(algorithm):
+    algorithm.fill_market_orders = False
+    ticket = algorithm.MarketOrder("AAPL", -100)
+    assert ticket.Status == OrderStatus.Submitted
+    assert algorithm.Portfolio["AAPL"].Quantity == 0
+
+
+def test_submit_time_rejection(algorithm):
+    algorithm.submit_rejection = lambda ticket: "Stop price must be above the ask" if ticket.Quantity > 0 else None
+
+    rejected = algorithm.StopMarketOrder("AAPL", 100, 100.01)
+    accepted = algorithm.StopMarketOrder("AAPL", -100, 99.0)
+    event, = algorithm.events
+    assert (event.OrderId, event.Status, event.Message) == (
+        rejected.OrderId, OrderStatus.Invalid, "Stop price must be above the ask")
+    assert accepted.Status == OrderStatus.Submitted
+
+    # A market order rejected at submit time is not filled
+    algorithm.submit_rejection = lambda ticket: "Insufficient buying power"
+    ticket = algorithm.MarketOrder("AAPL", 100)
+    assert ticket.Status == OrderStatus.Invalid
+    assert algorithm.Portfolio["AAPL"].Quantity == 0
+
+
+def test_partial_fills_then_update_and_cancel(algorithm):
+    ticket = algorithm.StopMarketOrder("AAPL", -100, 99.0)
+    algorithm.fill(ticket, quantity=-40)
+    assert (ticket.Status, ticket.QuantityFilled) == (OrderStatus.PartiallyFilled, -40)
+    assert algorithm.events[-1].FillPrice == 99.0
+
+    fields = UpdateOrderFields()
+    fields.Quantity = -150
+    assert ticket.Update(fields).IsSuccess
+    assert (ticket.Quantity, ticket.StopPrice) == (-150, 99.0)
+
+    algorithm.update_succeeds = False
+    assert not ticket.Update(fields).IsSuccess
+
+    assert ticket.Cancel().IsSuccess
+    assert algorithm.events[-1].Status == OrderStatus.Canceled
+    assert algorithm.Transactions.GetOpenOrders() == []
+
+
+def test_scheduled_events_fire_in_time_order_at_their_own_time(algorithm):
+    fired = []
+    for second in (30, 10, 20):
+        algorithm.Schedule.On(algorithm.DateRules.Today, algorithm.TimeRules.At(9, 30, second),
+                              lambda second=second: fired.append((second, algorithm.Time.second)))
+    removed = algorithm.Schedule.On(algorithm.DateRules.Today, algorithm.TimeRules.At(9, 30, 15),
+                                    lambda: fired.append("removed"))
+    algorithm.Schedule.Remove(removed)
+
+    algorithm.advance(algorithm.Time + timedelta(seconds=20))
+    assert fired == [(10, 10), (20, 20)]
+    assert algorithm.Time.time() == time(9, 30, 20)
+
+    algorithm.advance(algorithm.Time + timedelta(minutes=1))
+    assert fired[-1] == (30, 30)
+
+
+def test_slice_lists_quotes_and_ticks(algorithm):
+    data_slice = Slice(algorithm.Time, ["AAPL"], ticks={"MSFT": []})
+    assert data_slice.Keys == ["AAPL", "MSFT"]
+    assert not data_slice.QuoteBars["AAPL"].IsFillForward
+    assert data_slice.Ticks.ContainsKey("MSFT")
@@ -0,0 +1,102 @@
+"""OrderRegistry dispatch and cached order state, and events LEAN delivers before the submit call returns."""
+
+from lean_standin import OrderStatus, OrderType, Slice
+from orb_example import OrderRole
+
+
+def test_orders_are_routed_by_order_id(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("AAPL", 100.0, 100.02)
+    stop = handler.submit_stop_order("AAPL", -100, 99.0, tag="Stop Loss")
+    entry = handler.submit_stop_order("MSFT", 10, 400.0, tag="Entry", role=OrderRole.ENTRY)
+
+    assert len(handler.orders) == 2
+    event = algorithm.fill(entry)
+    route = handler.orders.routes[event.OrderId]
+    assert (route.symbol, route.role, route.ticket, route.quantity) == ("MSFT", OrderRole.ENTRY, entry, 10)
+    route = handler.orders.get(stop)
+    assert (route.symbol, route.role, route.quantity) == ("AAPL", OrderRole.STOP, -100)
+    assert handler.orders.get(None) is None
+
+
+def test_routes_and_statuses_follow_order_events(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("AAPL", 100.0, 100.02)
+    ticket = handler.submit_stop_order("AAPL", -100, 99.0, tag="Stop Loss")
+
+    route = handler.orders.get(ticket)
+    assert (route.symbol, route.role, route.quantity, route.filled) == ("AAPL", OrderRole.STOP, -100, 0)
+    assert handler.orders.is_open(ticket)
+
+    algorithm.fill(ticket, quantity=-40)
+    assert handler.orders.status(ticket) == OrderStatus.PartiallyFilled
+    assert route.remaining == -60
+
+    algorithm.fill(ticket)
+    assert handler.orders.status(ticket) == OrderStatus.Filled
+    assert not handler.orders.is_open(ticket)
+
+    handler.orders.prune()
+    assert handler.orders.get(ticket) is None
+
+
+def test_untracked_orders_have_no_route(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("AAPL", 100.0, 100.02)
+    ticket = algorithm.StopMarketOrder("AAPL", -100, 99.0)  # Not submitted through the handler
+
+    event = algorithm.fill(ticket)
+    assert handler.orders.on_order_event(event) is None
+    assert handler.orders.status(ticket) is None
+    assert not handler.orders.deferred
+
+
+def test_synchronous_market_fill_is_redelivered_after_registration(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("AAPL", 100.0, 100.02)
+    statuses = []
+    ticket = handler.submit_market_order("AAPL", 100, tag="Exit",
+                                         on_submitted=lambda ticket: statuses.append(handler.orders.status(ticket)))
+
+    # The fill arrived inside MarketOrder, before the route existed, and was applied after on_submitted
+    assert ticket.Status == OrderStatus.Filled
+    assert statuses == [OrderStatus.New]
+    assert handler.orders.status(ticket) == OrderStatus.Filled
+    assert handler.orders.get(ticket).filled == 100
+    assert not handler.orders.deferred
+
+
+def test_synthetic_cross_entry_fill_places_the_stop(algorithm):
+    symbol_data = algorithm.add_symbol("AAPL", 100.0, 100.01)
+    symbol_data.entry_price, symbol_data.stop_loss_price = 100.02, 99.87
+    handler = algorithm.synthetic_stops
+    handler.handle_entry_rejection("AAPL", None, 100.02, 100, "Stop price must be above the ask")
+
+    # Price trades through the entry while the ask is still above it: market entry, filled synchronously
+    algorithm.set_quote("AAPL", 100.08, 100.10, 100.09)
+    handler.process_synthetic_entries(Slice(algorithm.Time, ["AAPL"]))
+
+    entry, stop = algorithm.orders
+    assert (entry.OrderType, entry.Status, handler.orders.get(entry).role) == (
+        OrderType.Market, OrderStatus.Filled, OrderRole.CROSS_ENTRY)
+    assert symbol_data.entry_ticket is entry
+    assert symbol_data.stop_loss_ticket is stop
+    assert (stop.OrderType, stop.Quantity, stop.StopPrice) == (OrderType.StopMarket, -100, 99.87)
+    assert handler.fill_quality.paths  # The cross fill was measured against its target
+    assert "AAPL" not in handler.synthetic_entries
+
+
+def test_submit_time_rejection_starts_synthetic_monitoring(algorithm):
+    symbol_data = algorithm.add_symbol("AAPL", 100.0, 100.01)
+    algorithm.submit_rejection = lambda ticket: (
+        "Stop price must be above the current ask" if ticket.Tag == "Entry" else None)
+
+    symbol_data.PlaceTrade(100.02, 99.87)
+
+    entry, = algorithm.orders
+    assert entry.Status == OrderStatus.Invalid
+    assert symbol_data.entry_ticket is entry
+    assert algorithm.synthetic_stops.orders.status(entry) == OrderStatus.Invalid
+    record = algorithm.synthetic_stops.synthetic_entries["AAPL"]
+    assert (record.target_price, record.quantity, record.original_order_id) == (100.02, entry.Quantity, entry.OrderId)
+
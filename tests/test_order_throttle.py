@@ -0,0 +1,84 @@
+"""OrderThrottle rate limit, priority order and in-place replacement."""
+
+from datetime import timedelta
+
+from lean_standin import StandInAlgorithm
+from orb_example import OrderThrottle
+
+
+def make_throttle(orders_per_minute=60, burst=1):
+    algorithm = StandInAlgorithm()
+    return algorithm, OrderThrottle(algorithm, orders_per_minute, burst)
+
+
+def test_disabled_throttle_sends_immediately():
+    algorithm = StandInAlgorithm()
+    throttle = OrderThrottle(algorithm)
+    sent = []
+    for number in range(100):
+        assert throttle.submit(OrderThrottle.ENTRY, ("AAPL", number), lambda n=number: n, sent.append) == number
+    assert sent == list(range(100))
+    assert len(throttle) == 0
+
+
+def test_burst_is_not_exceeded():
+    algorithm, throttle = make_throttle(burst=3)
+    results = [throttle.submit(OrderThrottle.ENTRY, ("AAPL", number), lambda: "sent") for number in range(5)]
+    assert results == ["sent", "sent", "sent", None, None]
+    assert len(throttle) == 2
+
+
+def test_queue_drains_exits_then_synthetic_then_entries():
+    algorithm, throttle = make_throttle()
+    sent = []
+    throttle.submit(OrderThrottle.ENTRY, ("A", "entry"), lambda: "first", sent.append)  # Uses the only token
+    throttle.submit(OrderThrottle.ENTRY, ("B", "entry"), lambda: "entry", sent.append)
+    throttle.submit(OrderThrottle.SYNTHETIC, ("C", "synthetic"), lambda: "synthetic", sent.append)
+    throttle.submit(OrderThrottle.EXIT, ("D", "exit"), lambda: "exit", sent.append)
+    throttle.submit(OrderThrottle.EXIT, ("E", "exit"), lambda: "exit 2", sent.append)
+
+    # One token per second at 60 orders per minute, released by the scheduled drain
+    for second in range(1, 5):
+        algorithm.advance(algorithm.Time + timedelta(seconds=1))
+        assert len(sent) == 1 + second
+    assert sent == ["first", "exit", "exit 2", "synthetic", "entry"]
+    assert len(throttle) == 0
+
+
+def test_request_does_not_overtake_queued_higher_priority():
+    algorithm, throttle = make_throttle()
+    sent = []
+    throttle.submit(OrderThrottle.ENTRY, ("A", "entry"), lambda: "first", sent.append)
+    throttle.submit(OrderThrottle.EXIT, ("B", "exit"), lambda: "exit", sent.append)
+
+    # A token is free again, but the exit is still waiting for the scheduled drain
+    algorithm.Time += timedelta(seconds=1)
+    assert throttle.submit(OrderThrottle.ENTRY, ("C", "entry"), lambda: "entry", sent.append) is None
+    throttle.drain()
+    assert sent == ["first", "exit"]
+    assert throttle.is_queued(("C", "entry"))
+
+
+def test_replacement_keeps_queue_position_and_sends_latest():
+    algorithm, throttle = make_throttle()
+    sent = []
+    throttle.submit(OrderThrottle.EXIT, ("A", "first"), lambda: "first", sent.append)
+    throttle.submit(OrderThrottle.EXIT, ("AAPL", "stop"), lambda: "stop -100", sent.append)
+    throttle.submit(OrderThrottle.EXIT, ("MSFT", "stop"), lambda: "msft", sent.append)
+    throttle.submit(OrderThrottle.EXIT, ("AAPL", "stop"), lambda: "stop -300", sent.append)
+    assert len(throttle) == 2
+
+    algorithm.advance(algorithm.Time + timedelta(seconds=2))
+    assert sent == ["first", "stop -300", "msft"]
+
+
+def test_discarded_request_is_never_sent():
+    algorithm, throttle = make_throttle()
+    sent = []
+    throttle.submit(OrderThrottle.EXIT, ("A", "first"), lambda: "first", sent.append)
+    throttle.submit(OrderThrottle.EXIT, ("B", "stop"), lambda: "stop", sent.append)
+    throttle.submit(OrderThrottle.ENTRY, ("C", "entry"), lambda: "entry", sent.append)
+    throttle.discard(("B", "stop"))
+
+    algorithm.advance(algorithm.Time + timedelta(seconds=5))
+    assert sent == ["first", "entry"]
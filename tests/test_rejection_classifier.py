@@ -0,0 +1,49 @@
+"""SchwabRejectionClassifier reason codes, pattern priority and cache."""
+
+import pytest
+
+from orb_example import RejectionReason, SchwabRejectionClassifier
+
+
+@pytest.mark.parametrize("message, reason", [
+    ("Stop price must be above the current ask", RejectionReason.SPREAD),
+    ("ORDER REJECTED: STOP PRICE OUTSIDE SPREAD", RejectionReason.SPREAD),
+    ("Invalid stop price 101.25", RejectionReason.INVALID_PRICE),
+    ("Stop order rejected by broker", RejectionReason.OTHER),
+    ("Insufficient buying power", RejectionReason.NONE),
+    ("", RejectionReason.NONE),
+    (None, RejectionReason.NONE),
+])
+def test_default_patterns(message, reason):
+    assert SchwabRejectionClassifier().classify(message) == reason
+
+
+def test_priority_wins_over_position_in_the_message():
+    classifier = SchwabRejectionClassifier()
+    # The generic OTHER pattern comes first in the text, the specific one is still reported
+    assert classifier.classify("Stop order rejected: invalid stop price") == RejectionReason.INVALID_PRICE
+    assert classifier.classify("Stop order rejected:\nstop price must be below the bid") == RejectionReason.SPREAD
+
+
+def test_added_patterns_rank_ahead_of_other():
+    classifier = SchwabRejectionClassifier()
+    classifier.classify("Stop order rejected - price not within quote")  # Cached before the pattern exists
+    classifier.add_pattern(RejectionReason.SPREAD, r"not within quote")
+    assert classifier.classify("Stop order rejected - price not within quote") == RejectionReason.SPREAD
+    assert [reason for reason, _ in classifier.patterns][-1] == RejectionReason.OTHER
+
+    classifier.add_pattern(RejectionReason.OTHER, r"order refused")
+    assert classifier.classify("Order refused") == RejectionReason.OTHER
+    assert classifier.patterns[-1] == (RejectionReason.OTHER, r"order refused")
+
+
+def test_results_are_cached_per_message():
+    classifier = SchwabRejectionClassifier(cache_size=2)
+    for _ in range(3):
+        classifier.classify("Stop price must be above the current ask")
+    info = classifier.classify.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (2, 1, 2)
+
+
+def test_empty_pattern_list_matches_nothing():
+    assert SchwabRejectionClassifier(patterns=[]).classify("Stop price must be above") == RejectionReason.NONE
@@ -0,0 +1,81 @@
+"""RejectionStatistics counters and the gate's rejection-rate skip."""
+
+import json
+
+import pytest
+
+from lean_standin import OrderStatus
+
+
+def submit(handler, symbol="AAPL", quantity=-100, stop_price=99.0):
+    return handler.submit_stop_order(symbol, quantity, stop_price, tag="Stop Loss")
+
+
+def test_only_schwab_rejections_count(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("AAPL", 100.0, 100.20)  # 20 bps spread
+    statistics = handler.statistics
+
+    algorithm.reject(submit(handler), "Stop price must be below the bid")
+    algorithm.reject(submit(handler), "Insufficient buying power")  # Never tested the spread
+    algorithm.order_event(submit(handler), OrderStatus.Submitted)  # Accepted
+    submit(handler)  # Outcome still open
+
+    assert statistics.rejection_rate("AAPL", algorithm.Time, 20.0) == (pytest.approx(1 / 3), 3)
+    key = statistics.key("AAPL", algorithm.Time, 20.0)
+    assert key == ("AAPL", (9 * 60 + 33) // 15, 2)
+    assert list(statistics.pending.values()) == [key]
+
+
+def test_counters_survive_a_restart(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("AAPL", 100.0, 100.20)
+    algorithm.reject(submit(handler), "Stop price must be below the bid")
+    handler.statistics.save()
+    rows = json.loads(algorithm.ObjectStore.Read(handler.statistics.object_store_key))
+    assert rows == [{"symbol": "AAPL", "time_bucket": 38, "spread_bucket": 2, "submitted": 1, "rejected": 1}]
+
+    restarted = type(handler.statistics)(algorithm, handler.rejection_classifier)
+    restarted.load()
+    assert restarted.counts == handler.statistics.counts
+
+
+@pytest.fixture
+def skipping(handler):
+    handler.proactive_spread_gate = True
+    handler.skip_rejection_rate = 0.8
+    handler.skip_min_samples = 5
+    handler.skip_explore_every = 3
+    handler.algorithm.set_quote("AAPL", 100.0, 100.20)
+    for _ in range(5):
+        handler.algorithm.reject(submit(handler), "Stop price must be below the bid")
+    return handler
+
+
+def test_rejected_buckets_are_skipped_with_occasional_exploration(skipping):
+    # The quote alone would accept a stop at 99.0; the measured rate skips it, except every third time
+    decisions = [skipping.should_use_synthetic_stops("AAPL", 99.0, -100) for _ in range(6)]
+    assert decisions == [True, True, False, True, True, False]
+
+    # A stop the quote rejects is never submitted for exploration
+    assert all(skipping.should_use_synthetic_stops("AAPL", 100.5, -100) for _ in range(6))
+
+
+def test_skipped_bucket_recovers_through_exploration(skipping):
+    algorithm = skipping.algorithm
+    placed = 0
+    for _ in range(60):
+        ticket = skipping.place_stop_with_spread_check("AAPL", -100, 99.0)
+        if ticket is not None:
+            placed += 1
+            algorithm.order_event(ticket, OrderStatus.Submitted)  # Schwab accepts stops again
+        skipping._release_stop("AAPL")
+
+    rate, samples = skipping.statistics.rejection_rate("AAPL", algorithm.Time, 20.0)
+    assert rate < skipping.skip_rejection_rate
+    assert placed > 20  # Submitting normally again once the rate dropped
+
+
+def test_exploration_can_be_turned_off(skipping):
+    skipping.skip_explore_every = 0
+    assert all(skipping.should_use_synthetic_stops("AAPL", 99.0, -100) for _ in range(10))
@@ -0,0 +1,79 @@
+"""Replaying a journaled day reproduces the orders the monitors placed."""
+
+from datetime import timedelta
+
+import pytest
+
+import replay
+from lean_standin import Slice
+
+
+@pytest.fixture
+def journaled_day(handler):
+    """Run a day with entry placement, a stop cross and a stop timeout; returns (records, symbols)."""
+    algorithm = handler.algorithm
+    handler.quote_driven = True
+    handler.scheduled_timeouts = True
+    handler.journal.record_quotes = True
+
+    def tick(quotes, seconds=1):
+        algorithm.advance(algorithm.Time + timedelta(seconds=seconds))
+        for symbol, quote in quotes.items():
+            algorithm.set_quote(symbol, *quote)
+        data_slice = Slice(algorithm.Time, list(quotes))
+        handler.process_synthetic_entries(data_slice)
+        handler.process_synthetic_stops(data_slice)
+
+    for symbol in ("S", "T"):
+        algorithm.set_quote(symbol, 49.95, 50.05)
+        algorithm.fill(handler.submit_stop_order(symbol, 100, 50.05, tag="Entry"))  # Journaled position
+        handler.handle_stop_rejection(symbol, None, 49.0, -100, "Stop price must be below the bid")
+    algorithm.set_quote("E", 29.90, 30.10)
+    handler.handle_entry_rejection("E", None, 30.0, 200, "Stop price must be above the ask")
+
+    # Stop quotes stay below 49.00 - tolerance without trading through 49.00 until S crosses
+    tick({"E": (29.95, 30.05), "S": (48.95, 49.10, 49.02), "T": (48.95, 49.10, 49.02)})
+    tick({"E": (29.98, 30.01), "S": (48.90, 48.97, 48.93)})  # Entry placed, S crosses
+    tick({"T": (48.96, 49.08, 49.01)}, seconds=30)
+    algorithm.advance(algorithm.Time + timedelta(minutes=handler.synthetic_timeout_minutes))  # T times out
+    handler.journal.flush()
+    return handler.journal.load(algorithm.Time.date())
+
+
+def test_replay_reproduces_the_recorded_orders(journaled_day):
+    records, symbols = journaled_day
+    recorded = replay.synthetic_orders(records, symbols)
+    assert [(event.name, symbol) for _, event, symbol, _, _ in recorded] == [
+        ("SYNTHETIC_PLACED", "E"), ("SYNTHETIC_CROSSED", "S"), ("SYNTHETIC_TIMEOUT", "T")]
+
+    algorithm, handler = replay.replay(records, symbols)
+    replayed = replay.synthetic_orders(replay.decode_journal(bytes(handler.journal.buffer)), handler.journal.symbols())
+    assert replayed == recorded
+    assert [(ticket.Symbol, ticket.Quantity, ticket.Tag) for ticket in algorithm.orders] == [
+        ("E", 200, "Synthetic Entry"), ("S", -100, "Synthetic Stop (Cross)"), ("T", -100, "Synthetic Stop (Timeout)")]
+
+
+def test_replay_shows_the_effect_of_a_trigger_change(journaled_day):
+    records, symbols = journaled_day
+
+    def wider_tolerance(handler):
+        handler.price_tolerance = 0.10
+
+    algorithm, _ = replay.replay(records, symbols, wider_tolerance)
+    assert [ticket.Tag for ticket in algorithm.orders][:2] == ["Synthetic Entry", "Synthetic Stop"]
+
+
+def test_cli_replays_downloaded_object_store_chunks(journaled_day, handler, tmp_path, capsys):
+    store = handler.algorithm.ObjectStore
+    prefix = handler.journal.day_key(handler.algorithm.Time.date())
+    for key in store:
+        if key.startswith(prefix + "/"):
+            (tmp_path / key[len(prefix) + 1:]).write_bytes(
+                store[key] if isinstance(store[key], bytes) else store[key].encode())
+
+    records, symbols = replay.load_journal(str(tmp_path))
+    assert symbols == journaled_day[1]
+    assert records.tobytes() == journaled_day[0].tobytes()
+
+    assert replay.main([str(tmp_path)]) == 0
+    assert "3/3 recorded synthetic orders reproduced" in capsys.readouterr().out
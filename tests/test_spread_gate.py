@@ -0,0 +1,111 @@
+"""Proactive spread gate and the learned SpreadModel it widens quotes with."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from lean_standin import OrderType
+from orb_example import OrderRole, SpreadModel
+
+
+@pytest.fixture
+def gated(handler):
+    handler.proactive_spread_gate = True
+    handler.algorithm.set_quote("AAPL", 100.0, 100.10)
+    return handler
+
+
+@pytest.mark.parametrize("quantity, stop_price, synthetic", [
+    (100, 100.09, False),  # Buy stop: ask within tolerance
+    (100, 100.08, True),  # Buy stop: ask above stop + tolerance
+    (-100, 100.01, False),  # Sell stop: bid within tolerance
+    (-100, 100.02, True),  # Sell stop: bid below stop - tolerance
+])
+def test_gate_predicts_rejections_from_the_live_quote(gated, quantity, stop_price, synthetic):
+    assert gated.should_use_synthetic_stops("AAPL", stop_price, quantity) == synthetic
+
+
+def test_gate_is_off_by_default_and_without_a_quote(handler):
+    handler.algorithm.set_quote("AAPL", 100.0, 100.10)
+    assert not handler.should_use_synthetic_stops("AAPL", 100.5, -100)
+
+    handler.proactive_spread_gate = True
+    assert not handler.should_use_synthetic_stops("MSFT", 100.5, -100)
+    handler.algorithm.set_quote("MSFT", 0.0, 100.10)
+    assert not handler.should_use_synthetic_stops("MSFT", 100.5, -100)
+
+
+def test_gated_stop_is_monitored_instead_of_submitted(gated):
+    assert gated.place_stop_with_spread_check("AAPL", -100, 100.5) is None
+    assert not gated.algorithm.orders
+    record = gated.synthetic_stops["AAPL"]
+    assert (record.target_price, record.quantity) == (100.5, -100)
+
+    # A second gated stop adds to the monitored one
+    gated.place_stop_with_spread_check("AAPL", -50, 100.5)
+    assert gated.synthetic_stops["AAPL"].quantity == -150
+    assert len(gated.stop_book) == 1
+
+
+def test_gated_stop_supersedes_a_queued_native_stop(gated):
+    gated.throttle.orders_per_minute = 60
+    gated.throttle.burst = 1
+    gated.submit_stop_order("MSFT", -10, 1.0)  # Uses the only token
+    gated.place_stop_with_spread_check("AAPL", -100, 99.0)  # Accepted quote: queued
+    assert gated.throttle.is_queued(("AAPL", OrderRole.STOP))
+
+    gated.place_stop_with_spread_check("AAPL", -100, 100.5)  # Now rejected: goes synthetic
+    gated.algorithm.advance(gated.algorithm.Time + timedelta(seconds=5))
+    assert [ticket.Symbol for ticket in gated.algorithm.orders] == ["MSFT"]
+    assert "AAPL" in gated.synthetic_stops
+
+
+def test_gated_entry_is_monitored_instead_of_submitted(gated):
+    assert gated.place_entry_with_spread_check("AAPL", 100, 100.02) is None
+    assert "AAPL" in gated.synthetic_entries
+
+    ticket = gated.place_entry_with_spread_check("MSFT", 100, 100.02)  # No quote to judge by: submitted
+    assert ticket.OrderType == OrderType.StopMarket
+    assert "MSFT" not in gated.synthetic_entries
+
+
+def test_spread_model_needs_samples_and_falls_back_to_the_session():
+    model = SpreadModel(alpha=0.5, z_score=0.0, min_samples=3)
+    open_minute = datetime(2025, 1, 2, 9, 30)
+    assert model.predict(open_minute) is None
+
+    for _ in range(3):
+        model.update(open_minute, 100.0, 100.10)
+    assert model.predict(open_minute) == pytest.approx(0.10)
+    assert model.predict(open_minute + timedelta(minutes=1)) == pytest.approx(0.10)  # Session estimate
+
+    for _ in range(3):
+        model.update(open_minute + timedelta(minutes=1), 100.0, 100.02)
+    assert model.predict(open_minute + timedelta(minutes=1)) == pytest.approx(0.02)
+    assert model.predict(open_minute) == pytest.approx(0.10)
+
+
+def test_spread_model_adds_z_score_deviations_and_ignores_bad_quotes():
+    model = SpreadModel(alpha=0.5, z_score=1.0, min_samples=2)
+    minute = datetime(2025, 1, 2, 10, 0)
+    model.update(minute, 100.0, 100.10)
+    model.update(minute, 0.0, 100.10)  # No bid
+    model.update(minute, 100.10, 100.0)  # Crossed
+    assert model.count[model._bucket(minute)] == 1
+
+    model.update(minute, 100.0, 100.30)
+    # mean 0.10 + 0.5 * 0.20 = 0.20, variance 0.5 * (0 + 0.5 * 0.04) = 0.01
+    assert model.predict(minute) == pytest.approx(0.20 + 0.1)
+
+
+def test_spread_model_widens_the_live_quote(gated):
+    model = SpreadModel(min_samples=1, z_score=0.0)
+    model.update(gated.algorithm.Time, 100.0, 100.30)
+    # Live ask 100.10 is within tolerance of 100.09, the expected ask of 100.20 is not
+    assert not gated.should_use_synthetic_stops("AAPL", 100.09, 100)
+    assert gated.should_use_synthetic_stops("AAPL", 100.09, 100, model)
+
+    # A model spread narrower than the live one changes nothing
+    narrow = SpreadModel(min_samples=1, z_score=0.0)
+    narrow.update(gated.algorithm.Time, 100.0, 100.01)
+    assert not gated.should_use_synthetic_stops("AAPL", 100.09, 100, narrow)
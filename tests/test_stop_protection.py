@@ -0,0 +1,140 @@
+"""SymbolData keeps one protective stop sized to the position, across partial fills and days."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from lean_standin import OrderStatus, OrderType, Slice
+
+
+def stop_orders(algorithm):
+    return [ticket for ticket in algorithm.orders if ticket.OrderType == OrderType.StopMarket and ticket.Quantity < 0]
+
+
+@pytest.fixture
+def protected(algorithm):
+    """AAPL entered with 324 shares and protected by a stop."""
+    symbol_data = algorithm.add_symbol("AAPL", 100.0, 100.01)
+    symbol_data.PlaceTrade(100.02, 99.87)
+    algorithm.fill(symbol_data.entry_ticket)
+    return symbol_data
+
+
+@pytest.mark.parametrize("close_stop", ["fill", "cancel"])
+def test_pruned_stop_is_replaced_not_updated(algorithm, protected, close_stop):
+    stop, = stop_orders(algorithm)
+    if close_stop == "fill":
+        algorithm.fill(stop)
+    else:
+        stop.Cancel()
+        algorithm.Portfolio["AAPL"].Quantity = 0
+    algorithm.synthetic_stops.orders.prune()  # Daily reset forgets closed orders
+    assert algorithm.synthetic_stops.orders.status(stop) is None
+
+    algorithm.Portfolio["AAPL"].Quantity = 324
+    protected.ensure_position_protected()
+    new_stop = stop_orders(algorithm)[-1]
+    assert new_stop is not stop
+    assert (new_stop.Quantity, new_stop.Tag, new_stop.Status) == (-324, "ATR Stop", OrderStatus.Submitted)
+    assert protected.stop_loss_ticket is new_stop
+    assert not protected.backup_stops
+
+
+def test_open_stop_is_resized(algorithm, protected):
+    stop, = stop_orders(algorithm)
+    algorithm.Portfolio["AAPL"].Quantity = 400
+    protected.ensure_position_protected()
+    assert stop_orders(algorithm) == [stop]
+    assert stop.Quantity == -400
+
+
+def next_slice(algorithm):
+    algorithm.Time += timedelta(seconds=1)
+    return Slice(algorithm.Time)
+
+
+def test_partial_fills_coalesce_into_one_stop(algorithm):
+    symbol_data = algorithm.add_symbol("AAPL", 100.0, 100.01)
+    symbol_data.PlaceTrade(100.02, 99.87)
+    entry = symbol_data.entry_ticket
+    assert entry.Quantity == 324
+
+    for quantity in (50, 30, 20):
+        algorithm.fill(entry, quantity=quantity)
+    assert stop_orders(algorithm) == []
+    assert symbol_data in algorithm.pending_protection
+
+    algorithm.OnData(next_slice(algorithm))
+    stop, = stop_orders(algorithm)
+    assert (stop.Quantity, stop.StopPrice) == (-100, 99.87)
+    assert symbol_data.stop_loss_ticket is stop
+    assert not algorithm.pending_protection
+
+    # Later partial fills resize the same stop on the next slice
+    algorithm.fill(entry, quantity=100)
+    algorithm.OnData(next_slice(algorithm))
+    assert stop_orders(algorithm) == [stop]
+    assert stop.Quantity == -200
+
+    # The final fill protects right away
+    algorithm.fill(entry)
+    assert stop_orders(algorithm) == [stop]
+    assert stop.Quantity == -324
+    assert symbol_data.last_stop_quantity == -324
+
+
+def test_full_fill_places_stop_immediately(algorithm):
+    symbol_data = algorithm.add_symbol("AAPL", 100.0, 100.01)
+    symbol_data.PlaceTrade(100.02, 99.87)
+
+    algorithm.fill(symbol_data.entry_ticket)
+    stop, = stop_orders(algorithm)
+    assert stop.Quantity == -324
+    assert not algorithm.pending_protection
+
+
+def next_day(algorithm):
+    """Close the day like the strategy's scheduled events and open the next one."""
+    algorithm.Time = algorithm.Time.replace(hour=15, minute=59)
+    algorithm.LiquidateAll()
+    algorithm.Time = datetime.combine(algorithm.Time.date() + timedelta(days=1), algorithm.Time.time().replace(
+        hour=9, minute=30))
+    algorithm.ResetDaily()
+    algorithm.Time += timedelta(minutes=3)
+
+
+@pytest.mark.parametrize("day_one", ["stopped out", "liquidated"])
+def test_next_day_entry_gets_a_new_stop(algorithm, protected, day_one):
+    day_one_stop, = stop_orders(algorithm)
+    if day_one == "stopped out":
+        algorithm.fill(day_one_stop)
+    next_day(algorithm)
+    assert day_one_stop.Status in (OrderStatus.Filled, OrderStatus.Canceled)
+    assert algorithm.Portfolio["AAPL"].Quantity == 0
+    assert protected.stop_loss_ticket is None and protected.last_stop_quantity == 0
+
+    protected.PlaceTrade(100.02, 99.80)
+    algorithm.fill(protected.entry_ticket)
+    position = algorithm.Portfolio["AAPL"].Quantity
+    stop = stop_orders(algorithm)[-1]
+    assert stop is not day_one_stop
+    assert (stop.Quantity, stop.StopPrice, stop.Tag, stop.Status) == (
+        -position, 99.80, "Stop Loss", OrderStatus.Submitted)
+    assert protected.stop_loss_ticket is stop
+    assert [ticket.Tag for ticket in stop_orders(algorithm)].count("Backup Stop") == 0
+    assert "AAPL" not in algorithm.synthetic_stops.synthetic_stops
+
+
+def test_canceling_stops_clears_their_tracking(algorithm, protected):
+    stop, = stop_orders(algorithm)
+    protected.backup_stops[99] = stop
+    protected.cancel_all_stops()
+    assert stop.Status == OrderStatus.Canceled
+    assert (protected.stop_loss_ticket, protected.last_stop_quantity, protected.backup_stops) == (None, 0, {})
+
+
+def test_daily_reset_keeps_a_stop_that_is_still_working(algorithm, protected):
+    stop, = stop_orders(algorithm)
+    algorithm.ResetDaily()  # Position carried over with its stop
+    assert protected.stop_loss_ticket is stop
+    assert protected.last_stop_quantity == -324
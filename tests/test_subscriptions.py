@@ -0,0 +1,149 @@
+"""MonitoringSubscriptions reference counting, deferred removal and prewarming."""
+
+import pytest
+
+from lean_standin import OrderStatus, Resolution, StandInAlgorithm, Universe
+from orb_example import MonitoringSubscriptions
+
+ENTRY, STOP, BACKUP = MonitoringSubscriptions.ENTRY, MonitoringSubscriptions.STOP, MonitoringSubscriptions.BACKUP
+
+
+@pytest.fixture
+def subscriptions():
+    return MonitoringSubscriptions(StandInAlgorithm())
+
+
+def resolutions(subscriptions, symbol):
+    return [sub.Resolution for sub in subscriptions.algorithm.Securities[symbol].Subscriptions]
+
+
+def test_feed_is_added_once_and_removed_with_the_last_user(subscriptions):
+    subscriptions.acquire("AAPL", ENTRY, Resolution.Second)
+    subscriptions.acquire("AAPL", STOP, Resolution.Second)
+    subscriptions.acquire("AAPL", STOP, Resolution.Second)
+    assert resolutions(subscriptions, "AAPL") == [Resolution.Second]
+
+    subscriptions.release("AAPL", ENTRY)
+    assert resolutions(subscriptions, "AAPL") == [Resolution.Second]
+    subscriptions.release("AAPL", STOP)
+    assert resolutions(subscriptions, "AAPL") == []
+    assert not subscriptions.subscribed and not subscriptions.users
+
+    subscriptions.release("AAPL", STOP)  # Unknown users are ignored
+
+
+def test_existing_feed_is_never_removed(subscriptions):
+    subscriptions.algorithm.AddEquity("AAPL", Resolution.Second)
+    subscriptions.acquire("AAPL", STOP, Resolution.Second)
+    subscriptions.release("AAPL", STOP)
+    assert resolutions(subscriptions, "AAPL") == [Resolution.Second]
+    assert subscriptions.external == {"AAPL"}
+
+
+def test_removal_waits_for_position_and_open_orders(subscriptions):
+    algorithm = subscriptions.algorithm
+    algorithm.set_quote("AAPL", 100.0, 100.02)
+    subscriptions.acquire("AAPL", STOP, Resolution.Second)
+    algorithm.Portfolio["AAPL"].Quantity = 100
+    stop = algorithm.StopMarketOrder("AAPL", -100, 99.0)
+
+    subscriptions.release("AAPL", STOP)
+    assert subscriptions.pending_removal == {"AAPL"}
+
+    algorithm.fill(stop)  # Flat, no open orders
+    subscriptions.flush_pending()
+    assert resolutions(subscriptions, "AAPL") == []
+    assert not subscriptions.pending_removal
+
+
+def test_acquire_cancels_a_pending_removal(subscriptions):
+    subscriptions.algorithm.Portfolio["AAPL"].Quantity = 100
+    subscriptions.acquire("AAPL", STOP, Resolution.Second)
+    subscriptions.release("AAPL", STOP)
+    subscriptions.acquire("AAPL", BACKUP, Resolution.Second)
+    assert not subscriptions.pending_removal
+
+    subscriptions.algorithm.Portfolio["AAPL"].Quantity = 0
+    subscriptions.flush_pending()
+    assert resolutions(subscriptions, "AAPL") == [Resolution.Second]
+
+
+def test_universe_members_keep_the_feed_until_deselected(subscriptions):
+    universe = Universe(["AAPL"])
+    subscriptions.algorithm.UniverseManager["fundamental"] = universe
+    subscriptions.acquire("AAPL", ENTRY, Resolution.Second)
+
+    subscriptions.release("AAPL", ENTRY)
+    assert resolutions(subscriptions, "AAPL") == [Resolution.Second]
+    assert subscriptions.retained == {"AAPL"}
+
+    subscriptions.release_all()  # Still selected
+    assert resolutions(subscriptions, "AAPL") == [Resolution.Second]
+
+    universe.members.clear()
+    subscriptions.release_all()
+    assert resolutions(subscriptions, "AAPL") == []
+    assert not subscriptions.retained and not subscriptions.subscribed
+
+
+def test_release_all_drops_every_user(subscriptions):
+    for symbol in ("AAPL", "MSFT"):
+        subscriptions.acquire(symbol, ENTRY, Resolution.Second)
+        subscriptions.acquire(symbol, BACKUP, Resolution.Second)
+    subscriptions.release_all()
+    assert not subscriptions.users and not subscriptions.subscribed
+    assert resolutions(subscriptions, "MSFT") == []
+
+
+PREWARM = MonitoringSubscriptions.PREWARM
+
+
+def test_prewarm_is_off_by_default_and_bounded_by_the_budget(algorithm):
+    handler = algorithm.synthetic_stops
+    symbol_data = algorithm.add_symbol("AAPL", 100.0, 100.01)
+    symbol_data.PlaceTrade(100.02, 99.87)
+    assert not handler.prewarmed and not handler.subscriptions.users
+
+    handler.prewarm_budget = 1
+    assert handler.prewarm("AAPL") and handler.prewarm("AAPL")
+    assert not handler.prewarm("MSFT")
+    assert handler.subscriptions.users == {"AAPL": {PREWARM}}
+
+
+def test_prewarm_is_released_once_the_stop_is_accepted(algorithm):
+    handler = algorithm.synthetic_stops
+    handler.prewarm_budget = 8
+    symbol_data = algorithm.add_symbol("AAPL", 100.0, 100.01)
+    symbol_data.PlaceTrade(100.02, 99.87)
+    assert handler.prewarmed == {"AAPL"}
+
+    algorithm.fill(symbol_data.entry_ticket)  # Places the stop
+    assert handler.prewarmed == {"AAPL"}  # Schwab may still reject it
+
+    algorithm.order_event(symbol_data.stop_loss_ticket, OrderStatus.Submitted)  # Broker accepted the stop
+    assert not handler.prewarmed
+    assert "AAPL" not in handler.subscriptions.users
+    assert handler.subscriptions.pending_removal == {"AAPL"}  # Removed once flat
+
+
+def test_prewarm_is_released_when_the_entry_fails(algorithm):
+    handler = algorithm.synthetic_stops
+    handler.prewarm_budget = 8
+    symbol_data = algorithm.add_symbol("AAPL", 100.0, 100.01)
+    symbol_data.PlaceTrade(100.02, 99.87)
+
+    algorithm.reject(symbol_data.entry_ticket, "Insufficient buying power")
+    assert not handler.prewarmed
+    assert resolutions(handler.subscriptions, "AAPL") == []
+
+
+def test_prewarm_hands_over_to_the_entry_monitor(algorithm):
+    handler = algorithm.synthetic_stops
+    handler.prewarm_budget = 8
+    symbol_data = algorithm.add_symbol("AAPL", 100.0, 100.01)
+    symbol_data.PlaceTrade(100.02, 99.87)
+
+    algorithm.reject(symbol_data.entry_ticket, "Stop price must be above the current ask")
+    assert not handler.prewarmed
+    assert handler.subscriptions.users == {"AAPL": {ENTRY}}
+    assert resolutions(handler.subscriptions, "AAPL") == [Resolution.Second]
@@ -0,0 +1,113 @@
+"""Synthetic timeouts: the min-heap, polled expiry and scheduled timeout events."""
+
+from datetime import datetime, timedelta
+
+from lean_standin import OrderType, Slice
+from orb_example import OrderRole, SyntheticEntry, SyntheticStop, SyntheticTimeoutScheduler
+
+START = datetime(2025, 1, 2, 9, 33)
+
+
+def record(symbol, minutes, record_type=SyntheticStop):
+    return record_type(symbol, 50.0, -100, START + timedelta(minutes=minutes), -1)
+
+
+def test_scheduler_pops_expired_active_records_in_timeout_order():
+    scheduler = SyntheticTimeoutScheduler()
+    late, early, resolved, later = record("A", 5), record("B", 1), record("C", 2), record("D", 9)
+    for item in (late, early, resolved, later):
+        scheduler.schedule(item)
+    assert scheduler.next_timeout() == early.timeout
+
+    expired = scheduler.pop_expired(START + timedelta(minutes=5), lambda item: item is not resolved)
+    assert expired == [early, late]
+    assert len(scheduler) == 1
+    assert scheduler.next_timeout() == later.timeout
+    assert scheduler.pop_expired(START + timedelta(minutes=8), lambda item: True) == []
+
+
+def test_equal_timeouts_do_not_compare_records():
+    scheduler = SyntheticTimeoutScheduler()
+    first, second = record("A", 1, SyntheticEntry), record("A", 1)
+    scheduler.schedule(first)
+    scheduler.schedule(second)
+    assert scheduler.pop_expired(START + timedelta(minutes=1), lambda item: True) == [first, second]
+
+
+def test_polled_timeouts_expire_entries_and_exit_stops(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("E", 49.95, 50.05)
+    algorithm.set_quote("S", 49.95, 50.05)
+    algorithm.set_quote("F", 49.95, 50.05)
+    algorithm.Portfolio["S"].Quantity = 100
+    handler.handle_entry_rejection("E", None, 50.0, 100, "Stop price must be above the ask")
+    handler.handle_stop_rejection("S", None, 50.0, -100, "Stop price must be below the bid")
+    handler.handle_stop_rejection("F", None, 50.0, -100, "Stop price must be below the bid")  # Flat by now
+
+    algorithm.Time += timedelta(minutes=handler.synthetic_timeout_minutes) - timedelta(seconds=1)
+    handler.process_synthetic_entries(Slice(algorithm.Time))
+    assert len(handler.timeouts) == 3 and not algorithm.orders
+
+    algorithm.Time += timedelta(seconds=1)
+    handler.process_synthetic_entries(Slice(algorithm.Time))  # Expires stops too, without data for them
+    assert not handler.synthetic_entries and not handler.synthetic_stops
+    assert not handler.entry_book and not handler.stop_book
+    ticket, = algorithm.orders
+    assert (ticket.Symbol, ticket.OrderType, ticket.Quantity, ticket.Tag) == (
+        "S", OrderType.Market, -100, "Synthetic Stop (Timeout)")
+    assert handler.orders.get(ticket).role == OrderRole.TIMEOUT
+
+
+def test_resolved_records_are_not_expired(handler):
+    algorithm = handler.algorithm
+    algorithm.set_quote("S", 49.95, 50.05)
+    algorithm.Portfolio["S"].Quantity = 100
+    handler.handle_stop_rejection("S", None, 50.0, -100, "Stop price must be below the bid")
+    algorithm.set_quote("S", 50.0, 50.05)
+    handler.process_synthetic_stops(Slice(algorithm.Time, ["S"]))  # Placed as a stop order
+    placed, = algorithm.orders
+
+    # A new record for the symbol gets its own timeout; the placed one never expires
+    algorithm.Time += timedelta(minutes=5)
+    algorithm.set_quote("S", 49.95, 50.05)
+    handler.handle_stop_rejection("S", None, 50.0, -100, "Stop price must be below the bid")
+    algorithm.Time += timedelta(minutes=handler.synthetic_timeout_minutes - 1)
+    handler.process_synthetic_stops(Slice(algorithm.Time))
+    assert algorithm.orders == [placed]
+    assert "S" in handler.synthetic_stops
+
+
+def test_scheduled_timeout_fires_without_data(handler):
+    algorithm = handler.algorithm
+    handler.scheduled_timeouts = True
+    algorithm.set_quote("S", 49.95, 50.05)
+    algorithm.Portfolio["S"].Quantity = 100
+    algorithm.Time += timedelta(microseconds=500)
+    handler.handle_stop_rejection("S", None, 50.0, -100, "Stop price must be below the bid")
+    timeout = handler.synthetic_stops["S"].timeout
+
+    algorithm.advance(timeout.replace(microsecond=0))
+    assert not algorithm.orders  # Rounded up to the next whole second, never early
+
+    algorithm.advance(timeout + timedelta(minutes=1))
+    ticket, = algorithm.orders
+    assert ticket.Tag == "Synthetic Stop (Timeout)"
+    assert ticket.Time == timeout.replace(microsecond=0) + timedelta(seconds=1)
+    assert not handler._timeout_events
+
+
+def test_scheduled_timeout_is_canceled_with_its_record(handler):
+    algorithm = handler.algorithm
+    handler.scheduled_timeouts = True
+    algorithm.set_quote("E", 49.95, 50.05)
+    handler.handle_entry_rejection("E", None, 50.0, 100, "Stop price must be above the ask")
+    assert len(algorithm.Schedule.events) == 1
+
+    algorithm.set_quote("E", 49.98, 50.0)
+    handler.process_synthetic_entries(Slice(algorithm.Time, ["E"]))
+    assert not algorithm.Schedule.events
+
+    # Slices no longer poll the heap; the resolved record stays in it until a scheduled event pops it
+    algorithm.Time += timedelta(minutes=handler.synthetic_timeout_minutes + 1)
+    handler.process_synthetic_entries(Slice(algorithm.Time))
+    assert len(handler.timeouts) == 1
@@ -0,0 +1,152 @@
+"""SyntheticTriggerBook and evaluate_synthetic_triggers against the per-record trigger checks."""
+
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from lean_standin import Slice, StandInAlgorithm
+from orb_example import SchwabSyntheticStops, SyntheticStop, SyntheticTriggerBook, evaluate_synthetic_triggers
+
+TOLERANCE = 0.01
+
+
+def scalar_trigger(record, bid_price, ask_price, price):
+    """Place first, then cross: the checks the monitors ran per record before the book."""
+    if record.side > 0:
+        if ask_price > 0 and ask_price <= record.target_price + TOLERANCE:
+            return SyntheticTriggerBook.PLACE
+        if price > record.target_price:
+            return SyntheticTriggerBook.CROSS
+    else:
+        if bid_price > 0 and bid_price >= record.target_price - TOLERANCE:
+            return SyntheticTriggerBook.PLACE
+        if price < record.target_price:
+            return SyntheticTriggerBook.CROSS
+    return None
+
+
+def random_records(rng, count):
+    records = []
+    for _ in range(count):
+        side = rng.choice((1, -1))
+        # Round targets so ties and exact tolerance boundaries come up
+        target = round(rng.uniform(99.5, 100.5), 2)
+        records.append(SyntheticStop("AAPL", target, side * rng.randint(1, 500), datetime(2025, 1, 2, 10), side))
+    return records
+
+
+def random_quote(rng):
+    bid = round(rng.uniform(99.4, 100.6), 2)
+    ask = round(bid + rng.choice((0.0, 0.01, 0.02, 0.05, 0.3)), 2)
+    price = round(rng.uniform(bid - 0.05, ask + 0.05), 2)
+    if rng.random() < 0.1:
+        bid = 0.0
+    if rng.random() < 0.1:
+        ask = 0.0
+    return bid, ask, price
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_book_matches_scalar_checks(seed):
+    rng = random.Random(seed)
+    records = random_records(rng, rng.randint(1, 40))
+    book = SyntheticTriggerBook()
+    for record in records:
+        book.add(record)
+
+    for _ in range(50):
+        bid, ask, price = random_quote(rng)
+        hits = book.triggered("AAPL", bid, ask, price, TOLERANCE)
+        assert len(hits) == len({id(record) for record, _ in hits}), "record reported twice"
+        actual = {id(record): action for record, action in hits}
+        expected = {id(record): action for record in records
+                    if (action := scalar_trigger(record, bid, ask, price)) is not None}
+        assert actual == expected
+
+
+def test_book_remove_keeps_other_records_with_the_same_target():
+    book = SyntheticTriggerBook()
+    first = SyntheticStop("AAPL", 100.0, -100, datetime(2025, 1, 2, 10), -1)
+    second = SyntheticStop("AAPL", 100.0, -50, datetime(2025, 1, 2, 10), -1)
+    book.add(first)
+    book.add(second)
+
+    book.remove(first)
+    assert book.triggered("AAPL", 100.0, 100.02, 100.01, TOLERANCE) == [(second, SyntheticTriggerBook.PLACE)]
+
+    book.remove(second)
+    assert "AAPL" not in book
+
+
+def test_handler_evaluates_only_symbols_in_the_slice(handler):
+    algorithm = handler.algorithm
+    for symbol in ("AAPL", "MSFT"):
+        algorithm.set_quote(symbol, 99.95, 100.05)
+        handler.handle_entry_rejection(symbol, None, 100.0, 100, "Stop price must be above the ask")
+        algorithm.set_quote(symbol, 99.98, 100.0)  # Ask back at the target: the entry can be placed
+
+    handler.process_synthetic_entries(Slice(algorithm.Time, ["MSFT"]))
+    ticket, = algorithm.orders
+    assert (ticket.Symbol, ticket.StopPrice, ticket.Tag) == ("MSFT", 100.0, "Synthetic Entry")
+    assert "AAPL" in handler.synthetic_entries and "AAPL" in handler.entry_book
+    assert "MSFT" not in handler.synthetic_entries and "MSFT" not in handler.entry_book
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_vectorized_matches_scalar_checks(seed):
+    rng = random.Random(seed)
+    records = random_records(rng, 64)
+    quotes = [random_quote(rng) for _ in records]
+    bid, ask, price = (np.array(column) for column in zip(*quotes))
+    target = np.array([record.target_price for record in records])
+    quantity = np.array([record.quantity for record in records])
+
+    place, cross, dead = evaluate_synthetic_triggers(bid, ask, price, target, quantity, TOLERANCE)
+    assert not dead.any()
+    for row, record in enumerate(records):
+        expected = scalar_trigger(record, *quotes[row])
+        assert place[row] == (expected == SyntheticTriggerBook.PLACE)
+        assert cross[row] == (expected == SyntheticTriggerBook.CROSS)
+
+
+def test_vectorized_drop_dead_excludes_one_sided_quotes():
+    bid = np.array([0.0, 100.0, 100.0])
+    ask = np.array([100.02, 0.0, 100.02])
+    price = np.array([101.0, 99.0, 100.01])
+    target = np.array([100.0, 100.0, 100.0])
+    quantity = np.array([100, -100, -100])
+
+    place, cross, dead = evaluate_synthetic_triggers(bid, ask, price, target, quantity, TOLERANCE, drop_dead=True)
+    assert dead.tolist() == [True, True, False]
+    assert place.tolist() == [False, False, True]
+    assert not cross.any()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_and_book_paths_issue_the_same_orders(seed):
+    issued = []
+    for batch_threshold in (1, 1000):
+        rng = random.Random(seed)
+        algorithm = StandInAlgorithm()
+        handler = SchwabSyntheticStops(algorithm)
+        handler.batch_threshold = batch_threshold
+        symbols = [f"S{number}" for number in range(40)]
+        for symbol in symbols:
+            algorithm.set_quote(symbol, 49.95, 50.05)
+            algorithm.Portfolio[symbol].Quantity = 100
+            if rng.random() < 0.5:
+                handler.handle_entry_rejection(symbol, None, 50.0, 100, "Stop price must be above the ask")
+            else:
+                handler.handle_stop_rejection(symbol, None, 50.0, -100, "Stop price must be below the bid")
+        for symbol in symbols:
+            bid = round(rng.uniform(49.8, 50.2), 2)
+            algorithm.set_quote(symbol, bid, round(bid + rng.choice((0.01, 0.1, 0.3)), 2),
+                                0.0 if rng.random() < 0.1 else None)
+        data_slice = Slice(algorithm.Time, symbols)
+        handler.process_synthetic_entries(data_slice)
+        handler.process_synthetic_stops(data_slice)
+        issued.append(sorted((t.Symbol, t.OrderType, t.Quantity, t.StopPrice, t.Tag) for t in algorithm.orders))
+    assert issued[0] == issued[1]
+    assert issued[0]